@@ -1,14 +1,21 @@
 import argparse
+import sys
 import config.manager.config_manager as CM
 from utils.logging.pitpal_logger import PitPalLogger
 #from engine.engine import Engine
 
 
 
-def argument_list():
-    parser = argparse.ArgumentParser()
+def register_config_arguments(parser):
     CM.getLogConfigManager().register_arguments(parser)
-    return parser.parse_args()
+    CM.getEngineConfigManager().register_arguments(parser)
+
+def argument_list(argv=None):
+    parser = argparse.ArgumentParser()
+    register_config_arguments(parser)
+    parser.add_argument("--frozen-config", default=None,
+                        help="Load all config from a bundle made by 'config freeze'")
+    return parser.parse_args(argv)
 
 def init_logger(args):
     log_cli = CM.getLogConfigManager().extract_arguments(args)
@@ -16,10 +23,31 @@ def init_logger(args):
     print(log_config)
     PitPalLogger.initialize(log_config)
 
+def init_engine_config(args):
+    engine_cli = CM.getEngineConfigManager().extract_arguments(args)
+    return CM.getEngineConfigManager().select(engine_cli)
+
+def freeze_main(argv):
+    parser = argparse.ArgumentParser(prog="PitPal.py config freeze",
+                                     description="Resolve YAML, env and CLI config into one bundle")
+    register_config_arguments(parser)
+    parser.add_argument("--output", default="pitpal.config.bundle", help="Bundle file to write")
+    args = parser.parse_args(argv)
+
+    digest = CM.freezeConfig(args, args.output)
+    print(f"{args.output} sha256:{digest}")
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    if argv[:2] == ["config", "freeze"]:
+        return freeze_main(argv[2:])
 
-def main():
-    args = argument_list()
+    args = argument_list(argv)
+    if args.frozen_config:
+        CM.loadFrozenConfig(args.frozen_config)
     init_logger(args)
+    init_engine_config(args)
 
 
 
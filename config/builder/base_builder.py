@@ -77,7 +77,7 @@ class ConfigBuilder:
         self.env = env_vars
         self.default_yaml = default_yaml
 
-    def build(self, cc):
+    def build(self, cc, coerce=False):
 
         yaml_file = get_yaml_file(self.cli, self.env, self.default_yaml)
 
@@ -87,4 +87,4 @@ class ConfigBuilder:
 
         final_data = apply_overrides(yaml_data, overrides)
 
-        return ConfigConvertor.config_from_dict(cc,final_data)
+        return ConfigConvertor.config_from_dict(cc,final_data,coerce)
@@ -1,45 +1,145 @@
-
+import threading
+import types
 from dataclasses import is_dataclass, fields
-from typing import get_origin, get_args
+from typing import get_origin, get_args, get_type_hints, Union
+
+
+_TRUE = ("true", "1", "yes", "on")
+_FALSE = ("false", "0", "no", "off")
+
+
+def _to_bool(value):
+    if not isinstance(value, str):
+        return value
+    v = value.strip().lower()
+    if v in _TRUE:
+        return True
+    if v in _FALSE:
+        return False
+    raise ValueError(f"Cannot convert {value!r} to bool")
+
+
+def _to_int(value):
+    return int(value) if isinstance(value, str) else value
+
+
+def _to_float(value):
+    return float(value) if isinstance(value, str) else value
+
+
+# env / CLI values arrive as strings
+_COERCERS = {
+    bool: _to_bool,
+    int: _to_int,
+    float: _to_float,
+}
+
+
+def _unwrap_optional(t):
+    origin = get_origin(t)
+    if origin is Union or origin is types.UnionType:
+        args = [a for a in get_args(t) if a is not type(None)]
+        if len(args) == 1:
+            return args[0]
+    return t
+
 
 class ConfigConvertor:
 
+    # (dataclass type, coerce) -> compiled converter
+    _plans = {}
+    _lock = threading.Lock()
+
     @staticmethod
-    def config_from_dict(dataclass_type, data: dict):
+    def config_from_dict(dataclass_type, data: dict, coerce: bool = False):
 
         if not is_dataclass(dataclass_type):
             return data
 
-        kwargs = {}
+        return ConfigConvertor.plan(dataclass_type, coerce)(data)
 
-        for field in fields(dataclass_type):
+    @staticmethod
+    def plan(dataclass_type, coerce: bool = False):
+        """
+        Converter function for dataclass_type, compiled on first use.
 
-            value = data.get(field.name)
+        The dataclass tree is inspected once and turned into straight-line
+        code: one data.get() per field, None kept as None, nested
+        dataclasses and lists of dataclasses handed to their own compiled
+        converters. With coerce=True, string values for int, float and
+        bool fields are converted.
+        """
+        key = (dataclass_type, coerce)
+        converter = ConfigConvertor._plans.get(key)
+        if converter is None:
+            with ConfigConvertor._lock:
+                converter = ConfigConvertor._plans.get(key)
+                if converter is None:
+                    converter = ConfigConvertor._compile(dataclass_type, coerce)
+                    ConfigConvertor._plans[key] = converter
+        return converter
 
-            if value is None:
-                kwargs[field.name] = None
-                continue
+    @staticmethod
+    def _compile(dataclass_type, coerce):
+        try:
+            hints = get_type_hints(dataclass_type)
+        except NameError:
+            hints = {}
+        namespace = {"cls": dataclass_type}
+        lines = ["def convert(data):"]
+        args = []
 
-            field_type = field.type
+        for i, field in enumerate(fields(dataclass_type)):
+            field_type = _unwrap_optional(hints.get(field.name, field.type))
             origin = get_origin(field_type)
+            name = f"f{i}"
+            value = f"v{i}"
+            lines.append(f"    {value} = data.get({field.name!r})")
 
+            expr = value
             # list handling
             if origin == list:
-                item_type = get_args(field_type)[0]
-
+                item_type = get_args(field_type)[0] if get_args(field_type) else None
                 if is_dataclass(item_type):
-                    kwargs[field.name] = [
-                         ConfigConvertor.config_from_dict(item_type, v) for v in value
-                    ]
-                else:
-                    kwargs[field.name] = value
+                    namespace[name] = ConfigConvertor._lazy(item_type, coerce)
+                    expr = f"[{name}(x) for x in {value}]"
+                elif coerce and item_type in _COERCERS:
+                    namespace[name] = _COERCERS[item_type]
+                    expr = f"[{name}(x) for x in {value}]"
 
             # nested dataclass
             elif is_dataclass(field_type):
-                kwargs[field.name] =  ConfigConvertor.config_from_dict(field_type, value)
+                namespace[name] = ConfigConvertor._lazy(field_type, coerce)
+                expr = f"{name}({value})"
 
-            else:
-                kwargs[field.name] = value
+            elif coerce and field_type in _COERCERS:
+                namespace[name] = _COERCERS[field_type]
+                expr = f"{name}({value})"
+
+            if expr != value:
+                lines.append(f"    if {value} is not None:")
+                lines.append(f"        {value} = {expr}")
+            args.append(f"{field.name}={value}")
+
+        lines.append(f"    return cls({', '.join(args)})")
+
+        exec("\n".join(lines), namespace)
+        convert = namespace["convert"]
+        convert.__qualname__ = f"convert_{dataclass_type.__name__}"
+        return convert
+
+    @staticmethod
+    def _lazy(dataclass_type, coerce):
+        """
+        Nested converter, looked up on first call so that recursive
+        dataclass trees do not recurse at compile time.
+        """
+        converter = None
 
-        return dataclass_type(**kwargs)
+        def convert(data):
+            nonlocal converter
+            if converter is None:
+                converter = ConfigConvertor.plan(dataclass_type, coerce)
+            return converter(data)
 
+        return convert
@@ -2,17 +2,76 @@ import os
 
 PREFIX = "PITPAL_"
 
-def get_env(prefix: str) -> dict:
-    result = {}
 
-    env_prefix = PREFIX + prefix.upper() + "_"
+class EnvSnapshot:
+    """
+    Every PITPAL_* variable, read in one pass over the environment and
+    indexed by module prefix. Shared by all config managers.
+
+    get() re-reads the environment only when it looks changed: a
+    different number of variables, or a PITPAL_* value that differs.
+    Call refresh() after a change that keeps the count and touches no
+    existing PITPAL_* variable.
+    """
+
+    def __init__(self, environ=None):
+        self.environ = os.environ if environ is None else environ
+        self.refresh()
+
+    def refresh(self):
+        variables = {}
+        modules = {}
+        for key, value in self.environ.items():
+            if not key.startswith(PREFIX):
+                continue
+            variables[key] = value
+            module = key[len(PREFIX):].split("_", 1)[0]
+            modules.setdefault(module, []).append(key)
+
+        # one assignment, so readers never see half a snapshot
+        self._state = (len(self.environ), variables, modules, {})
+
+    def _current(self):
+        state = self._state
+        size, variables, _, _ = state
+        environ = self.environ
+        if len(environ) != size or any(environ.get(k) != v for k, v in variables.items()):
+            self.refresh()
+            state = self._state
+        return state
+
+    def get(self, prefix: str) -> dict:
+        _, variables, modules, paths = self._current()
+
+        result = paths.get(prefix)
+        if result is None:
+            env_prefix = PREFIX + prefix.upper() + "_"
+            keys = modules.get(prefix.upper().split("_", 1)[0], ())
 
-    for key, value in os.environ.items():
+            result = {}
+            for key in keys:
+                if not key.startswith(env_prefix):
+                    continue
+                path = prefix + "." + key[len(env_prefix):].lower().replace("_", ".")
+                result[path] = variables[key]
+            paths[prefix] = result
 
-        if not key.startswith(env_prefix):
-            continue
+        return dict(result)
 
-        path = prefix + "." + key[len(env_prefix):].lower().replace("_", ".")
-        result[path] = value
 
-    return result
+_snapshot = None
+
+
+def snapshot() -> EnvSnapshot:
+    global _snapshot
+    if _snapshot is None:
+        _snapshot = EnvSnapshot()
+    return _snapshot
+
+
+def refresh():
+    snapshot().refresh()
+
+
+def get_env(prefix: str) -> dict:
+    return snapshot().get(prefix)
@@ -1,19 +1,56 @@
-
+import os
+import threading
 import yaml
 from pathlib import Path
 
+# libyaml when PyYAML was built with it, the pure-Python loader otherwise
+SafeLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+def _copy(data):
+    """
+    Copy of a safe_load result: new dicts and lists, shared scalars.
+    """
+    if isinstance(data, dict):
+        return {k: _copy(v) for k, v in data.items()}
+    if isinstance(data, list):
+        return [_copy(v) for v in data]
+    if isinstance(data, set):
+        return set(data)
+    return data
+
 
 class YamlLoader:
 
+    # resolved path -> ((mtime_ns, size), parsed document)
+    _cache = {}
+    _lock = threading.Lock()
+
     @staticmethod
     def load(path: str) -> dict:
         p = Path(path)
 
-        if not p.exists():
+        try:
+            st = os.stat(p)
+        except FileNotFoundError:
             raise FileNotFoundError(f"Config YAML not found: {path}")
 
-        with open(p, "r", encoding="utf-8") as f:
-            data = yaml.safe_load(f)
+        key = os.path.realpath(p)
+        stamp = (st.st_mtime_ns, st.st_size)
+
+        with YamlLoader._lock:
+            cached = YamlLoader._cache.get(key)
+        if cached is None or cached[0] != stamp:
+            with open(p, "r", encoding="utf-8") as f:
+                data = yaml.load(f, Loader=SafeLoader) or {}
+            cached = (stamp, data)
+            with YamlLoader._lock:
+                YamlLoader._cache[key] = cached
 
-        return data or {}
+        # callers (apply_overrides) modify the result in place
+        return _copy(cached[1])
 
+    @staticmethod
+    def clear_cache():
+        with YamlLoader._lock:
+            YamlLoader._cache.clear()
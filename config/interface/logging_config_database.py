@@ -1,4 +1,5 @@
 from dataclasses import dataclass
+from typing import Optional
 
 module_name="logging"
 
@@ -41,6 +42,17 @@ class RemoteLoggingConfig:
     type: str
     url: str
     timeout: int
+    batch_size: int = 100
+    flush_interval: float = 1.0
+    retries: int = 3
+    spill: Optional[str] = None
+
+
+@dataclass(frozen=True)
+class QueueLoggingConfig:
+    enabled: bool
+    size: int
+    policy: str
 
 
 @dataclass(frozen=True)
@@ -51,6 +63,7 @@ class LoggingConfig:
     format: FormatConfig
     remote: RemoteLoggingConfig
     yaml: str
+    queue: Optional[QueueLoggingConfig] = None
 
 @dataclass(frozen=True)
 class PitpalLoggingConfig:
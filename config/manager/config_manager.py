@@ -1,5 +1,35 @@
 from config.manager.log_config_manager import LoggingConfigManager as LCM
+from config.manager.engine_config_manager import EngineConfigManager as ECM
+import config.manager.frozen_config as fc
 
 def getLogConfigManager():
     return LCM()
 
+def getEngineConfigManager():
+    return ECM()
+
+def getConfigManagers():
+    managers = [getLogConfigManager(), getEngineConfigManager()]
+    return {m.prefix: m for m in managers}
+
+def freezeConfig(args, path):
+    """
+    Resolve every manager's config from args, env and YAML and write
+    them to one bundle. Returns the bundle hash.
+    """
+    configs = {}
+    for name, manager in getConfigManagers().items():
+        configs[name] = manager.get_config(manager.extract_arguments(args))
+    return fc.write_bundle(path, configs)
+
+def loadFrozenConfig(path):
+    configs = fc.read_bundle(path)
+    managers = getConfigManagers()
+
+    missing = set(managers) - set(configs)
+    if missing:
+        raise ValueError(f"{path}: no frozen config for {sorted(missing)}")
+
+    for name, manager in managers.items():
+        manager.use_frozen(configs[name])
+    return configs
@@ -0,0 +1,112 @@
+import os
+import threading
+
+
+def _stamp(path):
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return (st.st_mtime_ns, st.st_size)
+
+
+class ConfigWatcher:
+    """
+    Keeps a frozen config current with the YAML files it was built from.
+
+    The files are polled with os.stat; when one changes the config is
+    rebuilt, published by a single attribute assignment and handed to
+    every subscriber. Readers just use watcher.config. A rebuild that
+    fails (e.g. a half-edited file) keeps the previous config and is
+    recorded in last_error.
+
+    Usage:
+        watcher = CM.getLogConfigManager().watch(log_cli)
+        watcher.subscribe(PitPalLogger.reconfigure)
+        watcher.start()
+        ...
+        level = watcher.config.logging.level
+    """
+
+    def __init__(self, build, paths, interval: float = 1.0):
+        self.build = build
+        self.paths = list(paths)
+        self.interval = interval
+        self.last_error = None
+
+        self._subscribers = []
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread = None
+
+        self._stamps = self._read_stamps()
+        self.config = build()
+
+    def _read_stamps(self):
+        return [_stamp(p) for p in self.paths]
+
+    def subscribe(self, callback):
+        """
+        callback(config) is called after each published change.
+        """
+        with self._lock:
+            self._subscribers.append(callback)
+        return callback
+
+    def unsubscribe(self, callback):
+        with self._lock:
+            self._subscribers.remove(callback)
+
+    def check(self) -> bool:
+        """
+        Poll once; returns True when a new config was published.
+        """
+        stamps = self._read_stamps()
+        if stamps == self._stamps:
+            return False
+        self._stamps = stamps
+
+        try:
+            config = self.build()
+        except Exception as e:
+            self.last_error = e
+            return False
+
+        if config == self.config:
+            return False
+
+        self.config = config
+        self.last_error = None
+
+        with self._lock:
+            subscribers = list(self._subscribers)
+        for callback in subscribers:
+            try:
+                callback(config)
+            except Exception as e:
+                self.last_error = e
+        return True
+
+    # ---------------------------
+    # Polling thread
+    # ---------------------------
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            self.check()
+
+    def start(self):
+        if self._thread is not None and self._thread.is_alive():
+            return self
+        self._stop.clear()
+        self._thread = threading.Thread(
+            target=self._run, name="pitpal-config-watcher", daemon=True
+        )
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
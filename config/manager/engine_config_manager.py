@@ -0,0 +1,104 @@
+import threading
+
+import config.builder.cli_loader as loader
+import config.builder.base_builder as bb
+import config.builder.env_loader as el
+from config.manager.config_watcher import ConfigWatcher
+from utils.oops.singleton import Singleton
+from config.interface.engine_config_database import PitpalRuleConfig as PRC
+from config.interface.engine_config_database import module_name
+
+class EngineConfigManager(Singleton):
+    """
+    CLI > env > engineconfig.yaml, built into a PitpalRuleConfig.
+
+    Configs are built on first use and memoized per override set.
+    select() makes one of them the process config; current() returns it
+    with a single attribute load, building the defaults on first call.
+
+    Usage:
+        mgr = CM.getEngineConfigManager()
+        mgr.select(mgr.extract_arguments(args))
+        ...
+        limit = mgr.current().rule.var.time.max
+    """
+
+    def __init__(self):
+        self.prefix=module_name
+        self.args=["--rule-fixed-level","--rule-fixed-algo","--rule-fixed-engine",
+                   "--rule-var-time-max","--rule-yaml"]
+        self.default_yaml = "config/default/engineconfig.yaml"
+        self._configs = {}
+        self._current = None
+        self.frozen = None
+        self._lock = threading.Lock()
+
+    def _after_fork(self):
+        # the parent may have held the lock while forking; the built
+        # configs are frozen and stay valid in the child
+        self._lock = threading.Lock()
+
+    def register_arguments(self, parser):
+        return loader.register_arguments(parser, self.args)
+
+    def  extract_arguments(self,arg):
+        return loader.extract_arguments(arg,self.prefix,self.args)
+
+    def get_config(self, cli_args):
+        if self.frozen is not None:
+            return self.frozen
+        env_vars = el.get_env(self.prefix)
+        key = (
+            frozenset((k, v) for k, v in cli_args.items() if v is not None),
+            frozenset(env_vars.items()),
+        )
+        config = self._configs.get(key)
+        if config is None:
+            with self._lock:
+                config = self._configs.get(key)
+                if config is None:
+                    builder=bb.ConfigBuilder(cli_args,env_vars,self.default_yaml)
+                    # env and CLI values are strings
+                    config = builder.build(PRC, coerce=True)
+                    self._configs[key] = config
+        return config
+
+    def select(self, cli_args):
+        self._current = self.get_config(cli_args)
+        return self._current
+
+    def current(self):
+        config = self._current
+        if config is None:
+            config = self.select({})
+        return config
+
+    def use_frozen(self, config):
+        """
+        Serve config from a frozen bundle; YAML and env are not read.
+        """
+        self.frozen = config
+        self._current = config
+
+    def clear(self):
+        with self._lock:
+            self._configs.clear()
+            self._current = None
+
+    def watch(self, cli_args, interval=1.0):
+        env_vars = el.get_env(self.prefix)
+        yaml_file = bb.get_yaml_file(cli_args, env_vars, self.default_yaml)
+
+        def build():
+            # bypass the memo: the file behind it is what changed
+            builder = bb.ConfigBuilder(cli_args, env_vars, self.default_yaml)
+            return builder.build(PRC, coerce=True)
+
+        watcher = ConfigWatcher(build, [yaml_file], interval)
+        watcher.subscribe(self._publish)
+        return watcher
+
+    def _publish(self, config):
+        with self._lock:
+            self._configs.clear()
+        self._current = config
@@ -0,0 +1,41 @@
+import hashlib
+import os
+import pickle
+
+MAGIC = b"PPCF"
+FORMAT_VERSION = 1
+
+
+def write_bundle(path, configs: dict) -> str:
+    """
+    Write {module name: frozen config} as one file: magic, format
+    version, sha256 of the payload, pickled payload. Returns the hash.
+    """
+    payload = pickle.dumps(configs, protocol=pickle.HIGHEST_PROTOCOL)
+    digest = hashlib.sha256(payload).digest()
+
+    tmp = f"{path}.{os.getpid()}.tmp"
+    with open(tmp, "wb") as f:
+        f.write(MAGIC + FORMAT_VERSION.to_bytes(2, "little") + digest + payload)
+    os.replace(tmp, path)
+    return digest.hex()
+
+
+def read_bundle(path) -> dict:
+    with open(path, "rb") as f:
+        raw = f.read()
+
+    if raw[:4] != MAGIC:
+        raise ValueError(f"{path} is not a frozen config bundle")
+    version = int.from_bytes(raw[4:6], "little")
+    if version != FORMAT_VERSION:
+        raise ValueError(f"{path}: bundle format {version}, expected {FORMAT_VERSION}")
+
+    digest, payload = raw[6:38], raw[38:]
+    if hashlib.sha256(payload).digest() != digest:
+        raise ValueError(f"{path}: bundle hash mismatch")
+
+    configs = pickle.loads(payload)
+    if not isinstance(configs, dict):
+        raise ValueError(f"{path}: bundle payload is not a dict")
+    return configs
@@ -2,6 +2,7 @@
 import config.builder.cli_loader as loader
 import config.builder.base_builder as bb
 import config.builder.env_loader as el
+from config.manager.config_watcher import ConfigWatcher
 from utils.oops.singleton import Singleton
 from config.interface.logging_config_database import PitpalLoggingConfig as PLC
 from config.interface.logging_config_database import module_name
@@ -9,10 +10,10 @@ from config.interface.logging_config_database import module_name
 class LoggingConfigManager(Singleton):
 
     def __init__(self):
-        if not hasattr(self, "_initialized"):
-            self.prefix=module_name
-            self.args=["--logging-level","--logging-file-path","--logging-yaml"]
-            self._initialized = True
+        self.prefix=module_name
+        self.args=["--logging-level","--logging-file-path","--logging-yaml"]
+        self.default_yaml = "config/default/logconfig.yaml"
+        self.frozen = None
 
     def register_arguments(self, parser):
         return loader.register_arguments(parser, self.args)
@@ -21,8 +22,20 @@ class LoggingConfigManager(Singleton):
         return loader.extract_arguments(arg,self.prefix,self.args)
 
     def get_config(self, cli_args):
+        if self.frozen is not None:
+            return self.frozen
         env_vars = el.get_env(self.prefix)
-        default_yaml = "config/default/logconfig.yaml"
-        builder=bb.ConfigBuilder(cli_args,env_vars,default_yaml)
+        builder=bb.ConfigBuilder(cli_args,env_vars,self.default_yaml)
         return builder.build(PLC)
 
+    def use_frozen(self, config):
+        """
+        Serve config from a frozen bundle; YAML and env are not read.
+        """
+        self.frozen = config
+
+    def watch(self, cli_args, interval=1.0):
+        env_vars = el.get_env(self.prefix)
+        yaml_file = bb.get_yaml_file(cli_args, env_vars, self.default_yaml)
+        return ConfigWatcher(lambda: self.get_config(cli_args), [yaml_file], interval)
+
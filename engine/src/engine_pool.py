@@ -0,0 +1,189 @@
+#!/usr/bin/env python3
+# Copyright (C) 2026 Pitpal
+#
+# This file is part of PitPal.
+#
+# PitPal is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License,
+# either version 3 of the License, or (at your option) any later version.
+#
+# PitPal is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+# See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with PitPal. If not, see <https://www.gnu.org/licenses/>.
+#    Author    :  Kalaiyarasan Es
+#    File name :  pitpal/engine/src/engine_pool.py
+#    Date      :  19/10/2026
+#######################################################################
+
+import hashlib
+import os
+import threading
+from collections import OrderedDict
+
+
+def rule_file_hash(path: str) -> str:
+    """
+    sha256 of the rule file content. Two paths holding the same
+    rule variant share one pool entry.
+    """
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(65536), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class EnginePool:
+    """
+    Warm pool of pre-initialized engine instances keyed by rule-file hash.
+
+    Usage:
+        pool = EnginePool(factory=lambda rule_path: Engine(rule_path))
+        engine = pool.checkout("engine/rules/json/pal.json")
+        ...
+        pool.checkin(engine)
+
+    factory(rule_path) builds a new instance on a cold miss.
+    Instances are reset (instance.reset() if present) on checkin so the
+    next game starts from a clean state. Variants beyond max_variants
+    are evicted least recently used first.
+    """
+
+    def __init__(self, factory, max_variants: int = 8, max_idle: int = 4):
+        if max_variants < 1:
+            raise ValueError("max_variants must be >= 1")
+        if max_idle < 0:
+            raise ValueError("max_idle must be >= 0")
+
+        self.factory = factory
+        self.max_variants = max_variants
+        self.max_idle = max_idle
+
+        self._lock = threading.Lock()
+        # rule hash -> list of idle instances, ordered by last use
+        self._idle = OrderedDict()
+        # id(instance) -> rule hash, for instances checked out
+        self._owner = {}
+        # path -> ((mtime_ns, size), rule hash); avoids re-hashing
+        self._path_keys = {}
+
+    # ---------------------------
+    # Key resolution
+    # ---------------------------
+
+    def _key_for(self, rule_path: str) -> str:
+        # called without the lock: a cold or changed path hashes the
+        # whole file, and other checkouts must not wait for that
+        st = os.stat(rule_path)
+        stamp = (st.st_mtime_ns, st.st_size)
+
+        cached = self._path_keys.get(rule_path)
+        if cached and cached[0] == stamp:
+            return cached[1]
+
+        key = rule_file_hash(rule_path)
+        with self._lock:
+            self._path_keys[rule_path] = (stamp, key)
+        return key
+
+    # ---------------------------
+    # Public API
+    # ---------------------------
+
+    def checkout(self, rule_path: str):
+        """
+        Return a ready engine for rule_path. Warm hits are a dict lookup;
+        misses build through factory outside the lock.
+        """
+        key = self._key_for(rule_path)
+        with self._lock:
+            idle = self._idle.get(key)
+            if idle is not None:
+                self._idle.move_to_end(key)
+            if idle:
+                instance = idle.pop()
+                self._owner[id(instance)] = key
+                return instance
+
+        instance = self.factory(rule_path)
+
+        with self._lock:
+            self._owner[id(instance)] = key
+            self._touch(key)
+        return instance
+
+    def checkin(self, instance) -> None:
+        """
+        Return an instance to the pool. It is reset before it becomes
+        available to the next checkout.
+        """
+        with self._lock:
+            key = self._owner.pop(id(instance), None)
+        if key is None:
+            raise KeyError("Instance was not checked out from this pool")
+
+        reset = getattr(instance, "reset", None)
+        if callable(reset):
+            reset()
+
+        with self._lock:
+            idle = self._touch(key)
+            if len(idle) < self.max_idle:
+                idle.append(instance)
+
+    def warm(self, rule_path: str, count: int = 1) -> None:
+        """
+        Pre-build count idle instances for rule_path.
+        """
+        instances = [self.checkout(rule_path) for _ in range(count)]
+        for instance in instances:
+            self.checkin(instance)
+
+    def evict(self, rule_path: str) -> None:
+        """
+        Drop every idle instance of the variant stored at rule_path.
+        """
+        with self._lock:
+            cached = self._path_keys.pop(rule_path, None)
+            if cached:
+                self._idle.pop(cached[1], None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._idle.clear()
+            self._path_keys.clear()
+
+    def variants(self):
+        """
+        Rule hashes currently held, least recently used first.
+        """
+        with self._lock:
+            return list(self._idle.keys())
+
+    def idle_count(self, rule_path: str) -> int:
+        key = self._key_for(rule_path)
+        with self._lock:
+            return len(self._idle.get(key, ()))
+
+    # ---------------------------
+    # LRU bookkeeping (lock held)
+    # ---------------------------
+
+    def _touch(self, key: str) -> list:
+        idle = self._idle.get(key)
+        if idle is None:
+            idle = self._idle[key] = []
+        self._idle.move_to_end(key)
+
+        while len(self._idle) > self.max_variants:
+            cold_key, _ = self._idle.popitem(last=False)
+            for path, (_, path_key) in list(self._path_keys.items()):
+                if path_key == cold_key:
+                    del self._path_keys[path]
+
+        return idle
@@ -0,0 +1,344 @@
+#!/usr/bin/env python3
+# Copyright (C) 2026 Pitpal
+#
+# This file is part of PitPal.
+#
+# PitPal is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License,
+# either version 3 of the License, or (at your option) any later version.
+#
+# PitPal is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+# See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with PitPal. If not, see <https://www.gnu.org/licenses/>.
+#    Author    :  Kalaiyarasan Es
+#    File name :  pitpal/engine/src/ruleset.py
+#    Date      :  19/10/2026
+#######################################################################
+
+import ast
+import hashlib
+import json
+import os
+import threading
+from pathlib import Path
+from typing import Optional
+
+from config.interface.engine_config_database import VarRuleConfig
+from engine.src import ruleset_binary as rsb
+from engine.src.ruleset_types import RuleParam, RuleSet
+
+RULES_SCHEMA = "engine/rules/schema/pal.rules.schema.json"
+CACHE_ENV = "PITPAL_CACHE_DIR"
+
+
+# ---------------------------
+# Param.Value parsing
+# ---------------------------
+
+def _to_bool(value: str) -> bool:
+    return str(value).strip().lower() in ("true", "1", "yes")
+
+
+_CONVERTERS = {
+    "integer": int,
+    "enum": str,
+    "bool": _to_bool,
+}
+
+
+def _parse_options(options, convert):
+    if options is None:
+        return None
+    if isinstance(options, str):
+        options = ast.literal_eval(options)
+    return tuple(convert(o) for o in options)
+
+
+def _compile_param(name: str, entry: dict) -> RuleParam:
+    # boolean.schema.json entries carry no "Type"
+    convert = _CONVERTERS[entry.get("Type", "bool")]
+    p = entry["Param"]
+    default = convert(p["Default"])
+
+    return RuleParam(
+        name=name,
+        value=convert(p["Value"]) if "Value" in p else default,
+        default=default,
+        options=_parse_options(p.get("Options"), convert),
+        enabled=p.get("Enabled", True),
+        config=p["Config"],
+        min=convert(p["Min"]) if "Min" in p else None,
+        max=convert(p["Max"]) if "Max" in p else None,
+    )
+
+
+def _override(param: RuleParam, value) -> RuleParam:
+    """
+    Apply an engineconfig.yaml value. "fixed" parameters keep the rule
+    file value; "flexi" values must be one of Options; others must lie
+    within Min/Max.
+    """
+    if value is None or param.config == "fixed":
+        return param
+
+    if param.config == "flexi":
+        if param.options is not None and value not in param.options:
+            raise ValueError(
+                f"{param.name}={value!r} is not one of {list(param.options)}"
+            )
+    elif isinstance(value, int) and not isinstance(value, bool):
+        if param.min is not None and value < param.min:
+            raise ValueError(f"{param.name}={value} is below Min {param.min}")
+        if param.max is not None and value > param.max:
+            raise ValueError(f"{param.name}={value} is above Max {param.max}")
+
+    return RuleParam(
+        name=param.name,
+        value=value,
+        default=param.default,
+        options=param.options,
+        enabled=param.enabled,
+        config=param.config,
+        min=param.min,
+        max=param.max,
+    )
+
+
+def _optional(params: dict, name: str):
+    p = params.get(name)
+    return p.value if p is not None else None
+
+
+def compile_rules(data: dict, source_hash: str,
+                  var: Optional[VarRuleConfig] = None) -> RuleSet:
+    """
+    Turn a validated rule dict into a RuleSet with typed values.
+    """
+    board = data["board"]
+    params = {}
+    for name in ("pitsPerSide", "nSide", "nSeeds"):
+        params[name] = _compile_param(name, board[name])
+    for name in ("algorithm", "capture", "timelimit", "nPlayers",
+                 "direction", "mod"):
+        if name in data:
+            params[name] = _compile_param(name, data[name])
+
+    if var is not None:
+        overrides = {}
+        if var.board is not None:
+            overrides["pitsPerSide"] = var.board.npits
+            overrides["nSide"] = var.board.nside
+            overrides["nSeeds"] = var.board.nseeds
+        if var.time is not None:
+            overrides["timelimit"] = var.time.max
+        overrides["capture"] = var.capture
+        for name, value in overrides.items():
+            if name in params:
+                params[name] = _override(params[name], value)
+
+    timelimit = params.get("timelimit")
+    if timelimit is not None:
+        timelimit_enabled = timelimit.enabled
+        if var is not None and var.time is not None and timelimit.config != "fixed":
+            timelimit_enabled = var.time.enabled
+    else:
+        timelimit_enabled = False
+
+    fruit = var.fruit if var is not None else None
+    clock = var.clock if var is not None else None
+
+    return RuleSet(
+        source_hash=source_hash,
+        v_rule=data["vRule"],
+        v_schema=data["vSchema"],
+        pits_per_side=params["pitsPerSide"].value,
+        n_side=params["nSide"].value,
+        n_seeds=params["nSeeds"].value,
+        special_pits=tuple(board.get("specialPits", ())),
+        algorithm=params["algorithm"].value,
+        capture=params["capture"].value,
+        timelimit=_optional(params, "timelimit"),
+        timelimit_enabled=timelimit_enabled,
+        n_players=params["nPlayers"].value,
+        direction=_optional(params, "direction"),
+        mod=_optional(params, "mod"),
+        fruit_dormant=fruit.dormant if fruit is not None else None,
+        fruit_period=fruit.period if fruit is not None else None,
+        clock_enabled=clock.enabled if clock is not None else None,
+        clock_min=clock.min if clock is not None else None,
+        kingzpit=var.kingzpit if var is not None else None,
+        captureplus=var.captureplus if var is not None else None,
+        params=tuple(params.values()),
+    )
+
+
+# ---------------------------
+# Loader with caches
+# ---------------------------
+
+class RuleSetLoader:
+    """
+    Validates a rule file once, compiles it to a RuleSet and caches the
+    result in-process and, when cache_dir or $PITPAL_CACHE_DIR is set
+    (or sidecar=True), on disk in the binary form of ruleset_binary.
+
+    The binary file records the rule file's (mtime_ns, size) and content
+    hash; while the stamp matches, a load is one small read plus struct
+    unpacking, with no JSON parsing or schema validation. A touched but
+    unchanged rule file is recognised by its hash. Under cache_dir each
+    compiled RuleSet is also kept by content hash, so identical rule
+    files at different paths are compiled once.
+
+    Usage:
+        rules = RuleSetLoader().load("engine/rules/json/pal.json", var)
+    """
+
+    def __init__(self, cache_dir: Optional[str] = None,
+                 schema_file: str = RULES_SCHEMA, sidecar: bool = False):
+        if cache_dir is None:
+            cache_dir = os.environ.get(CACHE_ENV)
+        self.cache_dir = Path(cache_dir) / "ruleset" if cache_dir else None
+        self.sidecar = sidecar
+        self.schema_file = schema_file
+
+        self._lock = threading.Lock()
+        self._rulesets = {}
+        # (path, var) -> ((mtime_ns, size), cache key)
+        self._path_keys = {}
+
+    def load(self, rule_path: str, var: Optional[VarRuleConfig] = None) -> RuleSet:
+        st = os.stat(rule_path)
+        stamp = (st.st_mtime_ns, st.st_size)
+
+        with self._lock:
+            cached = self._path_keys.get((rule_path, var))
+            if cached and cached[0] == stamp:
+                ruleset = self._rulesets.get(cached[1])
+                if ruleset is not None:
+                    return ruleset
+
+        binary_path = self.binary_path(rule_path, var)
+        var_digest = self._var_digest(var)
+        buf = self._read_binary(binary_path)
+        header = rsb.read_header(buf) if buf else None
+        if header is not None and header.var_digest != var_digest:
+            header = None
+
+        ruleset = None
+        if header is not None and (header.mtime_ns, header.size) == stamp:
+            ruleset = self._decode(buf)
+
+        if ruleset is None:
+            with open(rule_path, "rb") as f:
+                raw = f.read()
+            source_hash = hashlib.sha256(raw).hexdigest()
+
+            if header is not None and header.source_digest.hex() == source_hash:
+                ruleset = self._decode(buf)
+            if ruleset is None:
+                ruleset = self._rulesets.get((source_hash, var))
+            content_path = self.content_path(source_hash, var)
+            if ruleset is None:
+                buf = self._read_binary(content_path)
+                if buf:
+                    ruleset = self._decode(buf)
+            if ruleset is None:
+                ruleset = self._compile(rule_path, raw, source_hash, var)
+                self._write_binary(content_path, rsb.encode(ruleset, *stamp, var_digest))
+            self._write_binary(binary_path, rsb.encode(ruleset, *stamp, var_digest))
+
+        key = (ruleset.source_hash, var)
+        with self._lock:
+            ruleset = self._rulesets.setdefault(key, ruleset)
+            self._path_keys[(rule_path, var)] = (stamp, key)
+        return ruleset
+
+    def clear(self) -> None:
+        with self._lock:
+            self._rulesets.clear()
+            self._path_keys.clear()
+
+    def binary_path(self, rule_path: str, var=None) -> Optional[Path]:
+        """
+        Where the binary form of rule_path (with var applied) is kept.
+        """
+        if self.cache_dir is not None:
+            name = f"{os.path.realpath(rule_path)}\0{var!r}"
+            return self.cache_dir / f"{hashlib.sha256(name.encode()).hexdigest()}.rsc"
+        if self.sidecar:
+            if var is None:
+                return Path(f"{rule_path}.rsc")
+            return Path(f"{rule_path}.{self._var_digest(var).hex()[:12]}.rsc")
+        return None
+
+    def content_path(self, source_hash: str, var=None) -> Optional[Path]:
+        """
+        Where a RuleSet compiled from source_hash (with var applied) is
+        shared between rule paths; only under cache_dir.
+        """
+        if self.cache_dir is None:
+            return None
+        name = f"{source_hash}\0{var!r}"
+        return self.cache_dir / "content" / f"{hashlib.sha256(name.encode()).hexdigest()}.rsc"
+
+    def _compile(self, rule_path, raw, source_hash, var):
+        # jsonschema costs more to import than a binary load takes, so
+        # only processes that actually compile pay for it
+        import utils.jsonUtils.pitpal_json_schema_utils as Jsu
+
+        data = json.loads(raw)
+        jsu = Jsu.JSU(schema_file=self.schema_file, json_data=data)
+        if not jsu.validate():
+            raise ValueError(
+                f"Rule file {rule_path} failed schema validation: {jsu.errors()}"
+            )
+        return compile_rules(data, source_hash, var)
+
+    @staticmethod
+    def _var_digest(var) -> bytes:
+        return hashlib.sha256(repr(var).encode()).digest()
+
+    @staticmethod
+    def _decode(buf: bytes) -> Optional[RuleSet]:
+        try:
+            return rsb.decode(buf)
+        except (rsb.RuleSetFormatError, TypeError):
+            return None
+
+    @staticmethod
+    def _read_binary(path: Optional[Path]) -> Optional[bytes]:
+        if path is None:
+            return None
+        try:
+            with open(path, "rb") as f:
+                return f.read()
+        except OSError:
+            return None
+
+    @staticmethod
+    def _write_binary(path: Optional[Path], buf: bytes) -> None:
+        if path is None:
+            return
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        with open(tmp, "wb") as f:
+            f.write(buf)
+        os.replace(tmp, path)
+
+
+_default_loader = None
+
+
+def load_ruleset(rule_path: str, var: Optional[VarRuleConfig] = None) -> RuleSet:
+    """
+    Process-wide loader shortcut.
+    """
+    global _default_loader
+    if _default_loader is None:
+        _default_loader = RuleSetLoader()
+    return _default_loader.load(rule_path, var)
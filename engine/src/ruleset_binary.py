@@ -0,0 +1,167 @@
+#!/usr/bin/env python3
+# Copyright (C) 2026 Pitpal
+#
+# This file is part of PitPal.
+#
+# PitPal is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License,
+# either version 3 of the License, or (at your option) any later version.
+#
+# PitPal is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+# See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with PitPal. If not, see <https://www.gnu.org/licenses/>.
+#    Author    :  Kalaiyarasan Es
+#    File name :  pitpal/engine/src/ruleset_binary.py
+#    Date      :  19/10/2026
+#######################################################################
+"""
+Compact binary form of a compiled RuleSet.
+
+Layout (little endian):
+
+    header  magic "PPRS", format version, RuleSet field count,
+            source mtime_ns, source size, sha256 of the source JSON,
+            sha256 of the overrides applied
+    body    the remaining RuleSet fields in declaration order, each a
+            tagged value
+
+A file whose header matches the rule file's (mtime_ns, size) is decoded
+without touching the JSON at all.
+"""
+
+import struct
+from dataclasses import dataclass, fields
+from typing import Optional
+
+from engine.src.ruleset_types import RuleParam, RuleSet
+
+MAGIC = b"PPRS"
+FORMAT_VERSION = 1
+
+_HEADER = struct.Struct("<4sHHqQ32s32s")
+_INT = struct.Struct("<q")
+_LEN = struct.Struct("<H")
+
+_FIELDS = tuple(f.name for f in fields(RuleSet))
+# source_hash lives in the header
+_BODY_FIELDS = tuple(name for name in _FIELDS if name != "source_hash")
+_PARAM_FIELDS = tuple(f.name for f in fields(RuleParam))
+
+# value tags
+_NONE, _TRUE, _FALSE, _INTEGER, _STRING, _TUPLE, _PARAM = b"NTFISUP"
+_TAG = {tag: bytes((tag,)) for tag in b"NTFISUP"}
+
+
+class RuleSetFormatError(ValueError):
+    pass
+
+
+@dataclass(frozen=True, slots=True)
+class Header:
+    mtime_ns: int
+    size: int
+    source_digest: bytes
+    var_digest: bytes
+
+
+# ---------------------------
+# Encoding
+# ---------------------------
+
+def _encode(value, out: list) -> None:
+    if value is None:
+        out.append(_TAG[_NONE])
+    elif value is True:
+        out.append(_TAG[_TRUE])
+    elif value is False:
+        out.append(_TAG[_FALSE])
+    elif isinstance(value, int):
+        out.append(_TAG[_INTEGER] + _INT.pack(value))
+    elif isinstance(value, str):
+        raw = value.encode("utf-8")
+        out.append(_TAG[_STRING] + _LEN.pack(len(raw)) + raw)
+    elif isinstance(value, RuleParam):
+        out.append(_TAG[_PARAM])
+        for name in _PARAM_FIELDS:
+            _encode(getattr(value, name), out)
+    elif isinstance(value, tuple):
+        out.append(_TAG[_TUPLE] + _LEN.pack(len(value)))
+        for item in value:
+            _encode(item, out)
+    else:
+        raise TypeError(f"Cannot encode {type(value).__name__} in a RuleSet")
+
+
+def encode(ruleset: RuleSet, mtime_ns: int, size: int, var_digest: bytes) -> bytes:
+    out = [_HEADER.pack(MAGIC, FORMAT_VERSION, len(_FIELDS), mtime_ns, size,
+                        bytes.fromhex(ruleset.source_hash), var_digest)]
+    for name in _BODY_FIELDS:
+        _encode(getattr(ruleset, name), out)
+    return b"".join(out)
+
+
+# ---------------------------
+# Decoding
+# ---------------------------
+
+def read_header(buf: bytes) -> Optional[Header]:
+    """
+    The header, or None when buf is not a current-format RuleSet.
+    """
+    if len(buf) < _HEADER.size:
+        return None
+    magic, version, count, mtime_ns, size, source, var = _HEADER.unpack_from(buf)
+    if magic != MAGIC or version != FORMAT_VERSION or count != len(_FIELDS):
+        return None
+    return Header(mtime_ns, size, source, var)
+
+
+def _decode(buf: bytes, pos: int):
+    tag = buf[pos]
+    pos += 1
+    if tag == _NONE:
+        return None, pos
+    if tag == _TRUE:
+        return True, pos
+    if tag == _FALSE:
+        return False, pos
+    if tag == _INTEGER:
+        return _INT.unpack_from(buf, pos)[0], pos + _INT.size
+    if tag == _STRING:
+        (n,) = _LEN.unpack_from(buf, pos)
+        pos += _LEN.size
+        return buf[pos:pos + n].decode("utf-8"), pos + n
+    if tag == _TUPLE:
+        (n,) = _LEN.unpack_from(buf, pos)
+        pos += _LEN.size
+        items = []
+        for _ in range(n):
+            item, pos = _decode(buf, pos)
+            items.append(item)
+        return tuple(items), pos
+    if tag == _PARAM:
+        values = []
+        for _ in _PARAM_FIELDS:
+            value, pos = _decode(buf, pos)
+            values.append(value)
+        return RuleParam(*values), pos
+    raise RuleSetFormatError(f"Unknown tag {tag!r} at offset {pos - 1}")
+
+
+def decode(buf: bytes) -> RuleSet:
+    header = read_header(buf)
+    if header is None:
+        raise RuleSetFormatError("Not a RuleSet file of this version")
+    values = {"source_hash": header.source_digest.hex()}
+    pos = _HEADER.size
+    try:
+        for name in _BODY_FIELDS:
+            values[name], pos = _decode(buf, pos)
+    except (IndexError, struct.error, UnicodeDecodeError) as e:
+        raise RuleSetFormatError(f"Truncated RuleSet file: {e}") from e
+    return RuleSet(**values)
@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+# Copyright (C) 2026 Pitpal
+#
+# This file is part of PitPal.
+#
+# PitPal is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License,
+# either version 3 of the License, or (at your option) any later version.
+#
+# PitPal is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+# See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with PitPal. If not, see <https://www.gnu.org/licenses/>.
+#    Author    :  Kalaiyarasan Es
+#    File name :  pitpal/engine/src/ruleset_types.py
+#    Date      :  19/10/2026
+#######################################################################
+"""
+Compiled rule set types, shared by the loader (ruleset) and the binary
+codec (ruleset_binary).
+"""
+
+from dataclasses import dataclass
+from typing import Optional
+
+
+@dataclass(frozen=True, slots=True)
+class RuleParam:
+    name: str
+    value: object
+    default: object
+    options: Optional[tuple]
+    enabled: bool
+    config: str
+    min: object
+    max: object
+
+
+@dataclass(frozen=True, slots=True)
+class RuleSet:
+    source_hash: str
+    v_rule: str
+    v_schema: str
+
+    pits_per_side: int
+    n_side: int
+    n_seeds: int
+    special_pits: tuple
+
+    algorithm: str
+    capture: str
+    timelimit: Optional[int]
+    timelimit_enabled: bool
+    n_players: int
+    direction: Optional[bool]
+    mod: Optional[int]
+
+    # engineconfig.yaml only; no counterpart in the rule file
+    fruit_dormant: Optional[bool]
+    fruit_period: Optional[int]
+    clock_enabled: Optional[bool]
+    clock_min: Optional[int]
+    kingzpit: Optional[bool]
+    captureplus: Optional[bool]
+
+    params: tuple
+
+    def param(self, name: str) -> RuleParam:
+        for p in self.params:
+            if p.name == name:
+                return p
+        raise KeyError(f"Rule parameter '{name}' not found")
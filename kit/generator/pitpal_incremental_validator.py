@@ -0,0 +1,173 @@
+#!/usr/bin/env python3
+# Copyright (C) 2026 Pitpal
+#
+# This file is part of PitPal.
+#
+# PitPal is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License,
+# either version 3 of the License, or (at your option) any later version.
+#
+# PitPal is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+# See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with PitPal. If not, see <https://www.gnu.org/licenses/>.
+#    Author    :  Kalaiyarasan Es
+#    File name :  pitpal/kit/generator/pitpal_incremental_validator.py
+#    Date      :  19/10/2026
+#######################################################################
+import re
+
+
+# keywords whose result for an object depends only on each property
+# separately; a node using anything else is validated as a whole
+LOCAL_KEYWORDS = {
+    "type", "properties", "required", "additionalProperties", "items",
+    "const", "enum", "minimum", "maximum",
+    "$schema", "$id", "$defs", "$comment", "title", "description", "default",
+}
+
+
+def parse_path(path):
+    """
+    "board.specialPits[1]" -> ["board", "specialPits", 1]
+    """
+    if isinstance(path, (list, tuple)):
+        return list(path)
+
+    tokens = []
+    for part in path.split("."):
+        while True:
+            match = re.match(r"([^\[]+)\[(\d+)\]", part)
+            if match:
+                tokens.append(match.group(1))
+                tokens.append(int(match.group(2)))
+                part = part[match.end():]
+                if not part:
+                    break
+            else:
+                tokens.append(part)
+                break
+    return tokens
+
+
+def patch_paths(base, patch, prefix=()):
+    """
+    Paths deep_merge(base, patch) will change. Call before merging.
+    """
+    for key, value in patch.items():
+        if isinstance(value, dict) and isinstance(base, dict) and isinstance(base.get(key), dict):
+            yield from patch_paths(base[key], value, prefix + (key,))
+        else:
+            yield list(prefix + (key,))
+
+
+class IncrementalValidator:
+    """
+    Revalidates only the subtrees touched by a list of edits.
+
+    The document is assumed valid before the edits (e.g. the sample was
+    validated once). For each changed path the validator walks down the
+    schema from the root while every node on the way is property-local,
+    and stops at the parent of the changed key at the latest; that
+    subtree is validated in full. Changes at the root, or that cannot
+    get below it, fall back to full validation.
+
+    Usage:
+        inc = IncrementalValidator(validator, resolver._resolve_ref)
+        errors = inc.revalidate(data, ["board.nSeeds.Param.Value"])
+    """
+
+    def __init__(self, validator, resolve_ref):
+        self.validator = validator
+        self.resolve_ref = resolve_ref
+        self._subvalidators = {}
+
+    # ---------------------------
+    # Schema walk
+    # ---------------------------
+
+    def _deref(self, node):
+        while True:
+            if "$ref" in node and len(node) == 1:
+                node = self.resolve_ref(node["$ref"])
+                continue
+            all_of = node.get("allOf")
+            if all_of and len(all_of) == 1 and len(node) == 1:
+                node = all_of[0]
+                continue
+            return node
+
+    def _child(self, node, token):
+        node = self._deref(node)
+        if any(k not in LOCAL_KEYWORDS for k in node):
+            return None
+
+        if isinstance(token, int):
+            return node.get("items")
+
+        properties = node.get("properties", {})
+        if token in properties:
+            return properties[token]
+        extra = node.get("additionalProperties")
+        return extra if isinstance(extra, dict) else None
+
+    def _anchor(self, data, tokens):
+        schema, instance = self.validator.schema, data
+        depth = 0
+
+        for token in tokens[:-1]:
+            child = self._child(schema, token)
+            if child is None:
+                break
+            try:
+                instance = instance[token]
+            except (KeyError, IndexError, TypeError):
+                break
+            schema = child
+            depth += 1
+
+        return tuple(tokens[:depth]), schema, instance
+
+    def _subvalidator(self, schema):
+        key = id(schema)
+        entry = self._subvalidators.get(key)
+        if entry is None or entry[0] is not schema:
+            entry = (schema, self.validator.evolve(schema=schema))
+            self._subvalidators[key] = entry
+        return entry[1]
+
+    # ---------------------------
+    # Public API
+    # ---------------------------
+
+    def revalidate(self, data, changed_paths):
+        """
+        Return the list of ValidationErrors for the changed subtrees.
+        """
+        anchors = {}
+        for path in changed_paths:
+            tokens = parse_path(path)
+            if len(tokens) <= 1:
+                return list(self.validator.iter_errors(data))
+            prefix, schema, instance = self._anchor(data, tokens)
+            if not prefix:
+                return list(self.validator.iter_errors(data))
+            anchors[prefix] = (schema, instance)
+
+        errors = []
+        for prefix in sorted(anchors, key=len):
+            # skip anchors already covered by a shallower one
+            if any(prefix[:len(p)] == p for p in anchors if len(p) < len(prefix)):
+                continue
+            schema, instance = anchors[prefix]
+            for error in self._subvalidator(schema).iter_errors(instance):
+                error.path.extendleft(reversed(prefix))
+                errors.append(error)
+        return errors
+
+    def is_valid(self, data, changed_paths):
+        return not self.revalidate(data, changed_paths)
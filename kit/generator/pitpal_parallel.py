@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+# Copyright (C) 2026 Pitpal
+#
+# This file is part of PitPal.
+#
+# PitPal is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License,
+# either version 3 of the License, or (at your option) any later version.
+#
+# PitPal is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+# See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with PitPal. If not, see <https://www.gnu.org/licenses/>.
+#    Author    :  Kalaiyarasan Es
+#    File name :  pitpal/kit/generator/pitpal_parallel.py
+#    Date      :  19/10/2026
+#######################################################################
+"""
+Shared by the bulk rule tools (validate-all, matrix, migrator):
+
+for result in run_bounded(validate_rule_file, find_rule_files(root),
+                          _init_validate_worker, (schema_path,), jobs):
+    ...
+"""
+#######################################################################
+import fnmatch
+import os
+from concurrent.futures import ProcessPoolExecutor, FIRST_COMPLETED, as_completed, wait
+
+
+def find_rule_files(root, pattern="*.json"):
+    """
+    Lazily yield every file under root matching pattern, in sorted order.
+    """
+    for dirpath, dirnames, filenames in os.walk(root):
+        dirnames.sort()
+        for filename in sorted(filenames):
+            if fnmatch.fnmatch(filename, pattern):
+                yield os.path.join(dirpath, filename)
+
+
+def run_bounded(task, items, initializer=None, initargs=(), jobs=None, window=4):
+    """
+    Yield task(item) for every item as results finish.
+
+    jobs == 1 runs in this process after initializer(*initargs).
+    Otherwise a process pool of jobs workers (default: CPU count) runs
+    initializer once per worker, and at most jobs * window items are
+    in flight, so items may be a lazy iterator of any length.
+    """
+    if jobs == 1:
+        if initializer is not None:
+            initializer(*initargs)
+        for item in items:
+            yield task(item)
+        return
+
+    jobs = jobs or os.cpu_count() or 1
+    limit = jobs * window
+    with ProcessPoolExecutor(max_workers=jobs, initializer=initializer,
+                             initargs=initargs) as pool:
+        pending = set()
+        for item in items:
+            pending.add(pool.submit(task, item))
+            if len(pending) >= limit:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    yield future.result()
+        for future in as_completed(pending):
+            yield future.result()
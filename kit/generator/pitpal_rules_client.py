@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+# Copyright (C) 2026 Pitpal
+#
+# This file is part of PitPal.
+#
+# PitPal is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License,
+# either version 3 of the License, or (at your option) any later version.
+#
+# PitPal is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+# See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with PitPal. If not, see <https://www.gnu.org/licenses/>.
+#    Author    :  Kalaiyarasan Es
+#    File name :  pitpal/kit/generator/pitpal_rules_client.py
+#    Date      :  19/10/2026
+#######################################################################
+"""
+#forward the usual rules cli arguments to a daemon started with
+#pitpal_rules_creator_cli.py --serve; only the standard library is
+#imported, so start-up stays in the tens of milliseconds
+python kit/generator/pitpal_rules_client.py /tmp/pitpal-rules.sock \
+  --schema engine/rules/schema/pal.rules.schema.json \
+  --sample rules/base.json --set mod.Param.Value=11 --output rules/out.json
+"""
+#######################################################################
+import json
+import os
+import socket
+import sys
+
+# file arguments; the daemon may run in another directory
+PATH_ARGS = ("--schema", "--sample", "--output", "--patch")
+
+
+def forward(socket_path, argv):
+    """
+    Send one CLI invocation to a running daemon. Returns (status, output).
+    """
+    argv = list(argv)
+    for i, arg in enumerate(argv[:-1]):
+        if arg in PATH_ARGS:
+            argv[i + 1] = os.path.realpath(argv[i + 1])
+
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.connect(socket_path)
+        sock.sendall((json.dumps({"argv": argv}) + "\n").encode("utf-8"))
+        with sock.makefile("r", encoding="utf-8") as reply:
+            response = json.loads(reply.readline())
+    return response["status"], response["output"]
+
+
+def connect_main(argv):
+    if not argv:
+        print("usage: SOCKET <cli arguments>")
+        return 2
+    status, output = forward(argv[0], argv[1:])
+    sys.stdout.write(output)
+    return status
+
+
+if __name__ == "__main__":
+    sys.exit(connect_main(sys.argv[1:]))
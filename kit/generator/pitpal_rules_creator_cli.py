@@ -30,6 +30,24 @@
   --patch override.json \
   --output rules/flexi.json
   --help
+
+#validate every rule file under a directory tree
+./kit/generator/python rules_cli.py validate-all \
+  --schema engine/rules/schema/pal.rules.schema.json \
+  --rules engine/rules/json \
+  --jobs 8 \
+  --report report.json
+
+#keep schemas loaded; serve requests on a unix socket (or stdin)
+./kit/generator/python rules_cli.py --serve \
+  --schema engine/rules/schema/pal.rules.schema.json \
+  --socket /tmp/pitpal-rules.sock
+
+#forward the usual arguments to the running daemon; the thin client
+#(stdlib only) starts much faster than --connect here
+python kit/generator/pitpal_rules_client.py /tmp/pitpal-rules.sock \
+  --schema engine/rules/schema/pal.rules.schema.json \
+  --sample rules/base.json --set mod.Param.Value=11 --output rules/out.json
 """
 #######################################################################
 import json
@@ -39,11 +57,24 @@ import sys
 import re
 import ast
 from copy import deepcopy
+import io
+import contextlib
+import socketserver
 from jsonschema import Draft202012Validator
 from referencing import Registry, Resource
 
 from pathlib import Path
 
+if __name__ == "__main__":
+    # run as a script: kit/generator is on sys.path, the base path is not
+    sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from kit.generator.pitpal_incremental_validator import IncrementalValidator, patch_paths
+from kit.generator.pitpal_schema_index import SchemaTypeIndex
+from kit.generator.pitpal_parallel import find_rule_files, run_bounded
+from kit.generator.pitpal_rules_client import connect_main
+from utils.jsonUtils.pitpal_json_schema_utils import retrieve_by_id
+
 
 JSON_TYPE_MAP = {
     "string": str,
@@ -59,6 +90,7 @@ JSON_TYPE_MAP = {
 class SchemaTypeResolver:
     def __init__(self, schema_path: str):
         self.schema={}
+        self._index = None
         self._load_schema(schema_path)
 
     # ---------------------------
@@ -71,6 +103,10 @@ class SchemaTypeResolver:
             if filename.endswith(".json"):
                 with open(filename) as sf: 
                     self.schema[filename] = json.load(sf)
+                # $refs name other files by $id, whatever path we were given
+                schema_id = self.schema[filename].get("$id")
+                if schema_id:
+                    self.schema.setdefault(schema_id, self.schema[filename])
                 if filename == schema_path:
                     self.schema["."] = self.schema[filename]
 
@@ -120,7 +156,7 @@ class SchemaTypeResolver:
         """
         Recursively resolve $ref chains.
         """
-        if "$ref" in node:
+        while "$ref" in node:
             node = self._resolve_ref(node["$ref"])
         return node
 
@@ -167,40 +203,25 @@ class SchemaTypeResolver:
     # Public API
     # ---------------------------
     def get_type(self, path: str):
-        tokens = self._parse_path(path)
-        current = self.schema["."]
-
-        for token in tokens:
-            current = self._fully_resolve(current)
-
-            if isinstance(token, str):
-                if "properties" in current and token in current["properties"]:
-                    current = current["properties"][token]
-                else:
-                    print(f"Property '{token}' not found in schema")
-                    raise KeyError(f"Property '{token}' not found in schema")
-
-            elif isinstance(token, int):
-                # must be array
-                resolved_type = self._extract_type(current)
-
-                if resolved_type == list or (
-                    isinstance(resolved_type, list) and list in resolved_type
-                ):
-                    current = current.get("items", {})
-                else:
-                    print(f"Property '{token}' not found in array")
-                    raise TypeError(
-                        f"Attempted array index on non-array type at '{token}'"
-                    )
+        if self._index is None:
+            self._index = SchemaTypeIndex(
+                self.schema["."], self._fully_resolve, self._extract_type
+            )
+        try:
+            return self._index.lookup(path)
+        except (KeyError, TypeError) as e:
+            print(e)
+            raise
 
-        return self._extract_type(current)
+    def get_constraints(self, path: str):
+        self.get_type(path)
+        return self._index.get_constraints(path)
 
 
 
 def load_schema(schema_path):
     directory, rootfilename = os.path.split(schema_path)
-    registry = Registry()
+    resources = {}
     root_schema="{}"
     for filename in os.listdir(directory):
         filename = os.path.join(directory,filename)
@@ -209,13 +230,12 @@ def load_schema(schema_path):
                 schema_data = json.load(sf)
 
             schema_id = schema_data.get("$id", filename)
-            registry = registry.with_resource(
-                schema_id,
-                Resource.from_contents(schema_data)
-            )
+            resources[schema_id] = Resource.from_contents(schema_data)
 
             if filename == schema_path:
                 root_schema = schema_data 
+
+    registry = Registry(retrieve=retrieve_by_id(resources)).with_resources(resources.items())
     validator = Draft202012Validator(root_schema, registry=registry)
     return validator
 def check_matching(validator,json_data):
@@ -226,6 +246,13 @@ def check_matching(validator,json_data):
         print(e)
         return False
 
+def check_matching_incremental(validator, resolver, json_data, changed):
+    inc = IncrementalValidator(validator, resolver._resolve_ref)
+    errors = inc.revalidate(json_data, changed)
+    for error in errors:
+        print("/".join(str(p) for p in error.path) + ":", error.message)
+    return not errors
+
 
 def get_element_in_array(data,key):
     match = re.match(r"(\w+)\[(\d+)\]", key)
@@ -342,10 +369,93 @@ def deep_merge(base, patch):
 
 
 # ---------------------------------------------------
-# Main
+# Bulk Validation (validate-all)
 # ---------------------------------------------------
 
-def main():
+_worker_validator = None
+
+
+def _init_validate_worker(schema_path):
+    # one registry + validator per worker process
+    global _worker_validator
+    _worker_validator = load_schema(schema_path)
+
+
+def validate_rule_file(path):
+    try:
+        with open(path, "r") as f:
+            data = json.load(f)
+    except (OSError, ValueError) as e:
+        return {"file": path, "valid": False, "errors": [f"unreadable: {e}"]}
+
+    errors = [
+        {"path": "/".join(str(p) for p in error.absolute_path), "message": error.message}
+        for error in _worker_validator.iter_errors(data)
+    ]
+    return {"file": path, "valid": not errors, "errors": errors}
+
+
+def validate_all(schema_path, rules_root, jobs=None, pattern="*.json", out=sys.stdout):
+    """
+    Validate every rule file under rules_root, streaming one JSON line per
+    file to out as results finish. Returns the summary report.
+    """
+    files = find_rule_files(rules_root, pattern)
+    results = []
+
+    def emit(result):
+        results.append(result)
+        out.write(json.dumps(result) + "\n")
+        out.flush()
+
+    for result in run_bounded(validate_rule_file, files, _init_validate_worker,
+                              (schema_path,), jobs):
+        emit(result)
+
+    results.sort(key=lambda r: r["file"])
+    invalid = [r for r in results if not r["valid"]]
+    return {
+        "schema": schema_path,
+        "root": rules_root,
+        "total": len(results),
+        "valid": len(results) - len(invalid),
+        "invalid": len(invalid),
+        "results": results,
+    }
+
+
+def validate_all_main(argv):
+    parser = argparse.ArgumentParser(
+        prog="validate-all",
+        description="Validate every rule file in a directory tree",
+        formatter_class=argparse.ArgumentDefaultsHelpFormatter
+    )
+    parser.add_argument("--schema", default="engine/rules/schema/pal.rules.schema.json", help="Path to root JSON schema file")
+    parser.add_argument("--rules", required=True, help="Directory tree holding rule JSON files")
+    parser.add_argument("--pattern", default="*.json", help="File name pattern of rule files")
+    parser.add_argument("--jobs", type=int, default=None, help="Worker processes (default: CPU count)")
+    parser.add_argument("--report", help="Write the JSON report to this file instead of stdout")
+
+    args = parser.parse_args(argv)
+
+    report = validate_all(args.schema, args.rules, args.jobs, args.pattern,
+                          out=sys.stderr if not args.report else sys.stdout)
+
+    if args.report:
+        with open(args.report, "w") as f:
+            json.dump(report, f, indent=2)
+    else:
+        json.dump(report, sys.stdout, indent=2)
+        print()
+
+    return 1 if report["invalid"] else 0
+
+
+# ---------------------------------------------------
+# Edit (sample + set/unset/patch -> output)
+# ---------------------------------------------------
+
+def edit_parser():
     parser = argparse.ArgumentParser(
         description="PitPal Rules CLI Tool",
         formatter_class=argparse.ArgumentDefaultsHelpFormatter
@@ -357,8 +467,25 @@ def main():
     parser.add_argument("--unset", action="append",help="Remove property using dot notation (example: debugMode)" )
     parser.add_argument("--patch", help="Apply deep merge patch from JSON file")
     parser.add_argument("--output", required=True, help="Output file path")
+    parser.add_argument("--incremental", action="store_true", help="Revalidate only the edited paths (sample assumed valid)")
+    return parser
 
-    args = parser.parse_args()
+
+def load_schema_pair(schema_path, loaded=None):
+    """
+    (validator, resolver) for schema_path, reused from loaded when given.
+    """
+    if loaded is None:
+        return load_schema(schema_path), SchemaTypeResolver(schema_path)
+    # one entry per file, however the path was spelled
+    schema_path = os.path.realpath(schema_path)
+    if schema_path not in loaded:
+        loaded[schema_path] = (load_schema(schema_path), SchemaTypeResolver(schema_path))
+    return loaded[schema_path]
+
+
+def run_edit(args, loaded=None):
+    changed = []
 
     # Load sample
     with open(args.sample, "r") as f:
@@ -366,12 +493,12 @@ def main():
 
     # Load schema  
     if args.schema:
-        validator = load_schema(args.schema)
-        resolver = SchemaTypeResolver(args.schema)
+        validator, resolver = load_schema_pair(args.schema, loaded)
     # Apply patch
     if args.patch:
         with open(args.patch, "r") as f:
             patch_data = json.load(f)
+        changed.extend(patch_paths(rule_data, patch_data))
         deep_merge(rule_data, patch_data)
 
     # Apply set
@@ -379,14 +506,16 @@ def main():
         for entry in args.set:
             if "=" not in entry:
                 print(f"Invalid format: {entry}")
-                sys.exit(1)
+                return 1
             key, value = entry.split("=", 1)
             apply_set(resolver,rule_data,key.strip(), value.strip())
+            changed.append(key.strip())
 
     # Apply unset
     if args.unset:
         for key in args.unset:
             apply_unset(rule_data, key.strip())
+            changed.append(key.strip())
 
 
     # Write output
@@ -394,13 +523,131 @@ def main():
         json.dump(rule_data, f, indent=2)
     print("json rule generated successfully.")
 
-    result = check_matching(validator , rule_data)
+    if args.incremental:
+        result = check_matching_incremental(validator, resolver, rule_data, changed)
+    else:
+        result = check_matching(validator , rule_data)
 
     if result:
         print("✅ Rule generated and Validated successfully.")
     else:
         print("X Rule Validation failed for the given Schema.")
-    sys.exit(0)
+    return 0
+
+
+# ---------------------------------------------------
+# Daemon (--serve) and client (--connect)
+# ---------------------------------------------------
+
+def handle_request(argv, loaded):
+    """
+    Run one CLI invocation inside the daemon. Returns (status, output).
+    """
+    buf = io.StringIO()
+    with contextlib.redirect_stdout(buf), contextlib.redirect_stderr(buf):
+        try:
+            status = run_edit(edit_parser().parse_args(argv), loaded)
+        except SystemExit as e:
+            status = e.code if isinstance(e.code, int) else 1
+        except Exception as e:
+            print(e)
+            status = 1
+    return status, buf.getvalue()
+
+
+def _handle_line(line, loaded):
+    try:
+        request = json.loads(line)
+        argv = [str(a) for a in request["argv"]]
+    except (ValueError, KeyError, TypeError) as e:
+        return {"status": 2, "output": f"bad request: {e}\n"}
+    status, output = handle_request(argv, loaded)
+    return {"status": status, "output": output}
+
+
+def serve_stream(instream, outstream, loaded):
+    """
+    One JSON request per line: {"argv": [...]} -> {"status", "output"}.
+    """
+    for line in instream:
+        if not line.strip():
+            continue
+        outstream.write(json.dumps(_handle_line(line, loaded)) + "\n")
+        outstream.flush()
+
+
+class _RequestHandler(socketserver.StreamRequestHandler):
+
+    def handle(self):
+        for line in self.rfile:
+            if not line.strip():
+                continue
+            reply = _handle_line(line.decode("utf-8"), self.server.loaded)
+            self.wfile.write((json.dumps(reply) + "\n").encode("utf-8"))
+            self.wfile.flush()
+
+
+class RulesDaemon(socketserver.UnixStreamServer):
+    """
+    Serves requests one at a time; run_edit prints to a redirected
+    stdout, which is process wide.
+    """
+
+    def __init__(self, socket_path, loaded):
+        if os.path.exists(socket_path):
+            os.unlink(socket_path)
+        self.loaded = loaded
+        super().__init__(socket_path, _RequestHandler)
+
+    def server_close(self):
+        super().server_close()
+        if os.path.exists(self.server_address):
+            os.unlink(self.server_address)
+
+
+def serve_main(argv):
+    parser = argparse.ArgumentParser(
+        prog="--serve",
+        description="Keep schemas loaded and serve edit requests",
+        formatter_class=argparse.ArgumentDefaultsHelpFormatter
+    )
+    parser.add_argument("--schema", action="append", help="Preload this root JSON schema")
+    parser.add_argument("--socket", help="Unix socket path (default: requests on stdin)")
+    args = parser.parse_args(argv)
+
+    loaded = {}
+    for schema in args.schema or ():
+        load_schema_pair(schema, loaded)
+
+    if not args.socket:
+        serve_stream(sys.stdin, sys.stdout, loaded)
+        return 0
+
+    with RulesDaemon(args.socket, loaded) as server:
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+    return 0
+
+
+# ---------------------------------------------------
+# Main
+# ---------------------------------------------------
+
+def main():
+    if sys.argv[1:2] == ["validate-all"]:
+        sys.exit(validate_all_main(sys.argv[2:]))
+
+    if sys.argv[1:2] == ["--serve"]:
+        sys.exit(serve_main(sys.argv[2:]))
+
+    if sys.argv[1:2] == ["--connect"]:
+        # pitpal_rules_client.py does the same without loading jsonschema
+        sys.exit(connect_main(sys.argv[2:]))
+
+    args = edit_parser().parse_args()
+    sys.exit(run_edit(args))
 
 
 if __name__ == "__main__":
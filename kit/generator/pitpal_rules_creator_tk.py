@@ -19,15 +19,118 @@
 #    File name :  pitpal/kit/generator/pitpal_rules_creator_tk.py
 #    Date      :  21/02/2026
 #######################################################################
+import copy
 import json
 import os
+import queue
+import sys
+import threading
 import tkinter as tk
+from concurrent.futures import ThreadPoolExecutor
 from tkinter import ttk, filedialog, messagebox
-from jsonschema import validate, ValidationError
+from jsonschema import Draft202012Validator, validate, ValidationError
 #from jsonschema import Draft202012Validator, RefResolver
-from jsonschema import Draft202012Validator
-from referencing import Registry, Resource
 from referencing.jsonschema import DRAFT202012
+from pathlib import Path
+
+if __name__ == "__main__":
+    # run as a script: kit/generator is on sys.path, the base path is not
+    sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from utils.jsonUtils.pitpal_json_schema_utils import get_schema_set
+
+VALIDATION_DEBOUNCE_MS = 400
+VALIDATION_POLL_MS = 100
+
+
+class VirtualEntryList(ttk.Frame):
+    """
+    Scrollable list of entries for large arrays. Only visible_rows rows
+    of widgets exist; scrolling rebinds them to other indexes of values.
+    """
+
+    def __init__(self, parent, values, visible_rows=10):
+        super().__init__(parent)
+        self.values = list(values)
+        self.visible_rows = visible_rows
+        self.first = 0
+        self._loading = False
+
+        self.rows_frame = ttk.Frame(self)
+        self.rows_frame.pack(side="left", fill="both", expand=True)
+        self.scrollbar = ttk.Scrollbar(self, orient="vertical", command=self.yview)
+        self.scrollbar.pack(side="right", fill="y")
+
+        self.rows = []
+        for slot in range(visible_rows):
+            row = ttk.Frame(self.rows_frame)
+            label = ttk.Label(row, width=6)
+            label.pack(side="left", padx=5)
+            var = tk.StringVar()
+            var.trace_add("write", lambda *_, slot=slot: self._on_edit(slot))
+            entry = ttk.Entry(row, textvariable=var)
+            entry.pack(side="right", padx=5)
+            for widget in (row, label, entry):
+                widget.bind("<MouseWheel>", self._on_wheel)
+                widget.bind("<Button-4>", lambda e: self.scroll(-1))
+                widget.bind("<Button-5>", lambda e: self.scroll(1))
+            self.rows.append((row, label, var))
+
+        self.refresh()
+
+    def resize(self, count):
+        count = max(count, 0)
+        if count < len(self.values):
+            del self.values[count:]
+        else:
+            self.values.extend([""] * (count - len(self.values)))
+        self.first = min(self.first, max(len(self.values) - self.visible_rows, 0))
+        self.refresh()
+
+    def refresh(self):
+        self._loading = True
+        for slot, (row, label, var) in enumerate(self.rows):
+            index = self.first + slot
+            if index < len(self.values):
+                label.config(text=str(index + 1))
+                var.set(self.values[index])
+                row.pack(fill="x", pady=3)
+            else:
+                row.pack_forget()
+        self._loading = False
+
+        total = len(self.values)
+        if total <= self.visible_rows:
+            self.scrollbar.set(0.0, 1.0)
+        else:
+            self.scrollbar.set(self.first / total,
+                               (self.first + self.visible_rows) / total)
+
+    def _on_edit(self, slot):
+        if self._loading:
+            return
+        index = self.first + slot
+        if index < len(self.values):
+            self.values[index] = self.rows[slot][2].get()
+
+    def scroll(self, rows):
+        last = max(len(self.values) - self.visible_rows, 0)
+        first = min(max(self.first + rows, 0), last)
+        if first != self.first:
+            self.first = first
+            self.refresh()
+
+    def _on_wheel(self, event):
+        self.scroll(-1 if event.delta > 0 else 1)
+
+    def yview(self, *args):
+        if args[0] == "moveto":
+            self.scroll(int(float(args[1]) * len(self.values)) - self.first)
+        elif args[0] == "scroll":
+            step = int(args[1])
+            if args[2] == "pages":
+                step *= self.visible_rows
+            self.scroll(step)
 
 
 class RuleGenerator:
@@ -45,9 +148,23 @@ class RuleGenerator:
 
         self.widgets = {}
         self.data_store = {}
+        # section name -> frame, built on first display
+        self.section_frames = {}
+        self.section_parent = None
+        self._schema_files = {}
+
+        # live validation: cached validators used from a worker thread
+        self._validator = None
+        self._section_validators = {}
+        self._validator_lock = threading.Lock()
+        self._validation_pool = ThreadPoolExecutor(max_workers=1)
+        self._validation_results = queue.Queue()
+        self._validation_generation = 0
+        self._debounce_id = None
 
         self.build_layout()
         self.show_section()
+        self.root.after(VALIDATION_POLL_MS, self._poll_validation)
 
     # ---------------------------------------------------
     # Layout with Scroll Support
@@ -87,6 +204,10 @@ class RuleGenerator:
         self.progress_label = ttk.Label(self.nav_frame, text="")
         self.progress_label.pack()
 
+        self.status_label = ttk.Label(self.nav_frame, text="", foreground="red",
+                                      wraplength=500, justify="center")
+        self.status_label.pack()
+
     # ---------------------------------------------------
     # Schema Utilities
     # ---------------------------------------------------
@@ -100,12 +221,15 @@ class RuleGenerator:
 
         full_path = os.path.join(self.base_dir, file_path)
 
-        try:
-            with open(full_path, "r") as f:
-                schema = json.load(f)
-        except Exception as e:
-            messagebox.showerror("Schema Error", f"Error loading {full_path}\n{e}")
-            raise e
+        schema = self._schema_files.get(full_path)
+        if schema is None:
+            try:
+                with open(full_path, "r") as f:
+                    schema = json.load(f)
+            except Exception as e:
+                messagebox.showerror("Schema Error", f"Error loading {full_path}\n{e}")
+                raise e
+            self._schema_files[full_path] = schema
 
         if path:
             for part in path.strip("/").split("/"):
@@ -143,10 +267,23 @@ class RuleGenerator:
 
     def show_section(self):
 
-        for widget in self.scrollable_frame.winfo_children():
-            widget.destroy()
+        for frame in self.section_frames.values():
+            frame.pack_forget()
 
         section_name = self.sections[self.current_index]
+
+        frame = self.section_frames.get(section_name)
+        if frame is None:
+            frame = ttk.Frame(self.scrollable_frame)
+            self.section_frames[section_name] = frame
+            self.section_parent = frame
+            self.build_section(section_name)
+
+        frame.pack(fill="both", expand=True)
+        self.canvas.yview_moveto(0)
+        self.update_navigation()
+
+    def build_section(self, section_name):
         section_schema = self.schema["properties"][section_name]
 
         if "$ref" in section_schema:
@@ -155,7 +292,7 @@ class RuleGenerator:
         section_schema = self.merge_allOf(section_schema)
 
         ttk.Label(
-            self.scrollable_frame,
+            self.section_parent,
             text=section_name.upper(),
             font=("Arial", 18, "bold")
         ).pack(pady=15)
@@ -165,15 +302,13 @@ class RuleGenerator:
         else:
             self.build_form(section_schema, section_name)
 
-        self.update_navigation()
-
     # ---------------------------------------------------
     # Field Builders
     # ---------------------------------------------------
 
     def build_single_field(self, schema, path):
 
-        frame = ttk.Frame(self.scrollable_frame)
+        frame = ttk.Frame(self.section_parent)
         frame.pack(fill="x", pady=10, padx=10)
 
         ttk.Label(frame, text=path).pack(side="left")
@@ -218,7 +353,6 @@ class RuleGenerator:
 
             elif field_type == "array":
                 def open_array_editor():
-                    self.data_store[path] = []
                     self.open_array_popup(path, schema)
                 widget = ttk.Button(frame,text="Edit Array",command=open_array_editor)
                 widget.pack(side="right")
@@ -231,10 +365,11 @@ class RuleGenerator:
                 return
 
         self.widgets[path] = var
+        self._watch(var)
 
     def build_form(self, schema, parent_path, parent_key=None):
         if parent_key:
-            frame = ttk.Frame(self.scrollable_frame)
+            frame = ttk.Frame(self.section_parent)
             frame.pack(fill="x", pady=5, padx=20)
             ttk.Label(frame, text="----" + str(parent_key) +"----").pack(side="left")
 
@@ -254,7 +389,7 @@ class RuleGenerator:
                 self.build_form(prop, full_key,key)
                 continue
 
-            frame = ttk.Frame(self.scrollable_frame)
+            frame = ttk.Frame(self.section_parent)
             frame.pack(fill="x", pady=5, padx=20)
 
             ttk.Label(frame, text=key).pack(side="left")
@@ -311,44 +446,35 @@ class RuleGenerator:
                 return
 
             self.widgets[full_key] = var
+            self._watch(var)
     
     def open_array_popup(self, key, prop):
-        popup = ttk.Frame(self.scrollable_frame)
+        # section_parent is the last section built, not the one on screen
+        popup = ttk.Frame(self.section_frames[self.sections[self.current_index]])
         popup.pack(side="right")
         items_schema = prop.get("items", {})
         item_type = items_schema.get("type", "string")
         ttk.Label(popup, text="Number of elements:").pack(pady=5)
 
-        count_var = tk.IntVar(value=0)
+        existing = self.data_store.get(key) or []
+        count_var = tk.IntVar(value=len(existing))
         count_entry = ttk.Entry(popup, textvariable=count_var)
         count_entry.pack(pady=5)
 
-        entries_frame = ttk.Frame(popup)
-        entries_frame.pack(fill="both", expand=True, pady=10)
-        entry_vars = []
+        entries = VirtualEntryList(popup, [str(v) for v in existing])
+        entries.pack(fill="both", expand=True, pady=10)
 
         def generate_fields():
-            for widget in entries_frame.winfo_children():
-                widget.destroy()
-            entry_vars.clear()
             try:
                 count = count_var.get()
             except:
                 return
-            for i in range(count):
-                row = ttk.Frame(entries_frame)
-                row.pack(fill="x", pady=3)
-                ttk.Label(row, text=str(i + 1)).pack(side="left", padx=5)
-                var = tk.StringVar()
-                entry = ttk.Entry(row, textvariable=var)
-                entry.pack(side="right", padx=5)
-                entry_vars.append(var)
+            entries.resize(count)
         ttk.Button(popup, text="Generate", command=generate_fields).pack(pady=5)
         
         def submit():
             result = []
-            for var in entry_vars:
-                value = var.get()
+            for value in entries.values:
                 if item_type == "integer":
                     try:
                         value = int(value)
@@ -360,6 +486,7 @@ class RuleGenerator:
                 result.append(value)
             self.data_store[key] = result
             popup.destroy()
+            self.schedule_validation()
 
         def cancel():
             popup.destroy()
@@ -430,21 +557,7 @@ class RuleGenerator:
     def finish(self):
         final_data = self.collect_data()	
         try:
-            # Load all schemas in the schema folder
-            registry = Registry()
-            for filename in os.listdir(self.base_dir):
-                if filename.endswith(".json"):
-                    full_path = os.path.join(self.base_dir, filename)
-                    with open(full_path, "r") as f:
-                        schema_data = json.load(f)
-                    # Use $id if available, else file URI
-                    schema_id = schema_data.get(
-                            "$id",f"file://{full_path}")
-                    registry = registry.with_resource( schema_id,
-                            Resource.from_contents(schema_data))
-            # Create validator with registry
-            validator = Draft202012Validator(self.schema,
-                registry=registry)
+            validator = self.get_validator()
             #validator.validate(final_data)
         except Exception as e:
             messagebox.showerror("Validation Error", str(e))
@@ -456,6 +569,100 @@ class RuleGenerator:
                 json.dump(final_data, f, indent=2)
             messagebox.showinfo("Success", "Rule JSON generated successfully!")
 
+    # ---------------------------------------------------
+    # Live Validation
+    # ---------------------------------------------------
+
+    def get_validator(self):
+        """
+        Build the validator once; later calls (UI or worker) share it.
+        """
+        with self._validator_lock:
+            if self._validator is None:
+                # every schema in the folder, registered once and shared
+                schema_set = get_schema_set(self.schema_path)
+                self._validator = schema_set.validator(self.schema_path)
+            return self._validator
+
+    def get_section_validator(self, section):
+        """
+        Validator for one top-level section, against the root schema's
+        own properties/<section> so every $ref resolves as usual.
+        """
+        with self._validator_lock:
+            validator = self._section_validators.get(section)
+            if validator is None:
+                schema_set = get_schema_set(self.schema_path)
+                root_id = self.schema.get("$id", self.schema_path)
+                validator = Draft202012Validator(
+                    {"$ref": f"{root_id}#/properties/{section}"},
+                    registry=schema_set.registry,
+                )
+                self._section_validators[section] = validator
+            return validator
+
+    def _watch(self, var):
+        if var is not None:
+            var.trace_add("write", self.schedule_validation)
+
+    def schedule_validation(self, *_):
+        """
+        Restart the debounce timer; validation runs once edits pause.
+        """
+        if self._debounce_id is not None:
+            self.root.after_cancel(self._debounce_id)
+        self._debounce_id = self.root.after(VALIDATION_DEBOUNCE_MS, self._start_validation)
+
+    def _start_validation(self):
+        self._debounce_id = None
+        try:
+            self.store_current_section()
+        except tk.TclError:
+            # a half-typed value (e.g. empty IntVar); wait for the next edit
+            return
+        data = copy.deepcopy(self.collect_data())
+        # sections not shown yet are missing by design, not errors
+        sections = [name for name in self.sections if name in self.section_frames]
+        self._validation_generation += 1
+        self.status_label.config(text="Validating...", foreground="gray")
+        self._validation_pool.submit(self._validate_worker,
+                                     self._validation_generation, data, sections)
+
+    def _validate_worker(self, generation, data, sections):
+        # worker thread: no Tk calls here, results go through the queue
+        try:
+            errors = []
+            for section in sections:
+                if section not in data:
+                    continue
+                for error in self.get_section_validator(section).iter_errors(data[section]):
+                    path = [section] + [str(p) for p in error.absolute_path]
+                    errors.append("/".join(path) + ": " + error.message)
+        except Exception as e:
+            errors = [str(e)]
+        self._validation_results.put((generation, errors))
+
+    def _poll_validation(self):
+        latest = None
+        while True:
+            try:
+                latest = self._validation_results.get_nowait()
+            except queue.Empty:
+                break
+
+        # results of superseded edits are dropped
+        if latest is not None and latest[0] == self._validation_generation:
+            errors = latest[1]
+            if errors:
+                shown = "\n".join(errors[:5])
+                if len(errors) > 5:
+                    shown += f"\n... {len(errors) - 5} more"
+                self.status_label.config(text=shown, foreground="red")
+            else:
+                self.status_label.config(text="Valid", foreground="green")
+
+        self.root.after(VALIDATION_POLL_MS, self._poll_validation)
+
 
 
 # ---------------------------------------------------
@@ -0,0 +1,260 @@
+#!/usr/bin/env python3
+# Copyright (C) 2026 Pitpal
+#
+# This file is part of PitPal.
+#
+# PitPal is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License,
+# either version 3 of the License, or (at your option) any later version.
+#
+# PitPal is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+# See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with PitPal. If not, see <https://www.gnu.org/licenses/>.
+#    Author    :  Kalaiyarasan Es
+#    File name :  pitpal/kit/generator/pitpal_rules_matrix.py
+#    Date      :  19/10/2026
+#######################################################################
+"""
+#run from base path: every combination of every parameter's Options;
+#each variant pins its values as Config "fixed"
+python -m kit.generator.pitpal_rules_matrix \
+  --sample engine/rules/json/pal2020.json \
+  --output out/matrix
+
+#only some parameters / values
+python -m kit.generator.pitpal_rules_matrix \
+  --sample engine/rules/json/pal2020.json \
+  --param mod=5,11 \
+  --output out/matrix
+"""
+#######################################################################
+import argparse
+import ast
+import itertools
+import json
+import os
+import re
+import sys
+
+from kit.generator.pitpal_parallel import run_bounded
+from kit.generator.pitpal_schema_compiler import schema_set_hash
+import utils.jsonUtils.pitpal_compiled_schema as compiled
+import utils.jsonUtils.pitpal_json_schema_utils as Jsu
+
+SCHEMA_DIR = "engine/rules/schema"
+RULES_SCHEMA = "engine/rules/schema/pal.rules.schema.json"
+
+
+# ---------------------------------------------------
+# Parameter discovery
+# ---------------------------------------------------
+
+def _options(param):
+    options = param.get("Options")
+    if isinstance(options, str):
+        # older rule files store the list as a Python literal string
+        try:
+            options = ast.literal_eval(options)
+        except (ValueError, SyntaxError):
+            return None
+    if isinstance(options, (list, tuple)) and options:
+        return [str(o) for o in options]
+    return None
+
+
+def find_option_params(data, prefix=""):
+    """
+    Yield (dotted path, options) for every entry whose Param has Options.
+    """
+    for key, value in data.items():
+        if not isinstance(value, dict):
+            continue
+        path = f"{prefix}.{key}" if prefix else key
+        param = value.get("Param")
+        if isinstance(param, dict):
+            options = _options(param)
+            if options:
+                yield path, options
+        else:
+            yield from find_option_params(value, path)
+
+
+def select_params(found, subset=None):
+    """
+    subset maps path -> list of values (None keeps every option).
+    """
+    found = dict(found)
+    if not subset:
+        return list(found.items())
+
+    selected = []
+    for path, values in subset.items():
+        if path not in found:
+            raise KeyError(f"Parameter '{path}' has no Options")
+        if values is None:
+            values = found[path]
+        unknown = [v for v in values if v not in found[path]]
+        if unknown:
+            raise ValueError(f"{path}: {unknown} not in Options {found[path]}")
+        selected.append((path, values))
+    return selected
+
+
+def iter_combinations(params):
+    """
+    Lazily yield tuples of (path, value); never builds the full matrix.
+    """
+    paths = [p for p, _ in params]
+    for values in itertools.product(*(v for _, v in params)):
+        yield tuple(zip(paths, values))
+
+
+def variant_name(stem, combo):
+    parts = [f"{path.split('.')[-1]}-{value}" for path, value in combo]
+    name = "__".join([stem] + parts)
+    return re.sub(r"[^A-Za-z0-9_.-]", "_", name) + ".json"
+
+
+# ---------------------------------------------------
+# Validator
+# ---------------------------------------------------
+
+def load_validator(schema_dir=SCHEMA_DIR, root=RULES_SCHEMA):
+    """
+    The generated validator when it matches the schema files on disk,
+    the jsonschema one otherwise.
+    """
+    if compiled.SOURCE_HASH == schema_set_hash(schema_dir) and compiled.ROOT == root:
+        return compiled.validator_for(root)
+    return Jsu.get_schema_set(root).validator(root)
+
+
+# ---------------------------------------------------
+# Workers
+# ---------------------------------------------------
+
+_worker = {}
+
+
+def _init_worker(base_json, output_dir, stem, schema_dir, root):
+    _worker["base"] = base_json
+    _worker["output"] = output_dir
+    _worker["stem"] = stem
+    _worker["validator"] = load_validator(schema_dir, root)
+
+
+def build_variant(base_json, combo):
+    data = json.loads(base_json)
+    for path, value in combo:
+        node = data
+        for key in path.split("."):
+            node = node[key]
+        param = node["Param"]
+        # pin the chosen value: engineconfig.yaml overrides only reach
+        # flexi parameters, and the schema wants Options null otherwise
+        param["Value"] = value
+        param["Config"] = "fixed"
+        param["Options"] = None
+    return data
+
+
+def _write_variant(combo):
+    data = build_variant(_worker["base"], combo)
+    name = variant_name(_worker["stem"], combo)
+    errors = [e.message for e in _worker["validator"].iter_errors(data)]
+    if errors:
+        return name, False, errors
+
+    path = os.path.join(_worker["output"], name)
+    tmp = f"{path}.{os.getpid()}.tmp"
+    with open(tmp, "w") as f:
+        json.dump(data, f, indent=2)
+    os.replace(tmp, path)
+    return name, True, []
+
+
+# ---------------------------------------------------
+# Matrix
+# ---------------------------------------------------
+
+def generate_matrix(sample, output_dir, subset=None, jobs=None,
+                    schema_dir=SCHEMA_DIR, root=RULES_SCHEMA, out=None):
+    """
+    Validate and write every combination. At most jobs * 4 combinations
+    are in flight at a time. Returns a summary report.
+    """
+    with open(sample) as f:
+        base = json.load(f)
+    base_json = json.dumps(base)
+
+    params = select_params(find_option_params(base), subset)
+    os.makedirs(output_dir, exist_ok=True)
+    stem = os.path.splitext(os.path.basename(sample))[0]
+    initargs = (base_json, output_dir, stem, schema_dir, root)
+
+    report = {"sample": sample, "params": [p for p, _ in params],
+              "written": 0, "invalid": []}
+
+    def record(name, valid, errors):
+        if valid:
+            report["written"] += 1
+        else:
+            report["invalid"].append({"file": name, "errors": errors})
+        if out is not None:
+            out.write(json.dumps({"file": name, "valid": valid}) + "\n")
+
+    combos = iter_combinations(params)
+    for result in run_bounded(_write_variant, combos, _init_worker, initargs, jobs):
+        record(*result)
+
+    return report
+
+
+def parse_param_args(entries):
+    subset = {}
+    for entry in entries or ():
+        if "=" in entry:
+            path, values = entry.split("=", 1)
+            subset[path.strip()] = [v.strip() for v in values.split(",") if v.strip()]
+        else:
+            subset[entry.strip()] = None
+    return subset
+
+
+# ---------------------------------------------------
+# Main
+# ---------------------------------------------------
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="PitPal Rule Variant Matrix Generator",
+        formatter_class=argparse.ArgumentDefaultsHelpFormatter
+    )
+    parser.add_argument("--sample", required=True, help="Base rule JSON file")
+    parser.add_argument("--param", action="append", help="Expand only this parameter, optionally a subset of its Options (example: mod=5,11)")
+    parser.add_argument("--output", required=True, help="Output directory")
+    parser.add_argument("--jobs", type=int, default=None, help="Worker processes (default: CPU count)")
+    parser.add_argument("--schema-dir", default=SCHEMA_DIR, help="Schema directory")
+    parser.add_argument("--schema", default=RULES_SCHEMA, help="Path to root JSON schema file")
+
+    args = parser.parse_args()
+
+    try:
+        subset = parse_param_args(args.param)
+        report = generate_matrix(args.sample, args.output, subset, args.jobs,
+                                 args.schema_dir, args.schema, out=sys.stdout)
+    except (KeyError, ValueError) as e:
+        print(e)
+        sys.exit(1)
+
+    print(f"{report['written']} variants written, {len(report['invalid'])} invalid.")
+    sys.exit(1 if report["invalid"] else 0)
+
+
+if __name__ == "__main__":
+    main()
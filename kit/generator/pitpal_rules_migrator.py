@@ -0,0 +1,275 @@
+#!/usr/bin/env python3
+# Copyright (C) 2026 Pitpal
+#
+# This file is part of PitPal.
+#
+# PitPal is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License,
+# either version 3 of the License, or (at your option) any later version.
+#
+# PitPal is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+# See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with PitPal. If not, see <https://www.gnu.org/licenses/>.
+#    Author    :  Kalaiyarasan Es
+#    File name :  pitpal/kit/generator/pitpal_rules_migrator.py
+#    Date      :  19/10/2026
+#######################################################################
+"""
+#run from base path: upgrade every rule file to the schema's vSchema
+python -m kit.generator.pitpal_rules_migrator --root engine/rules/json
+
+#explicit target, report only
+python -m kit.generator.pitpal_rules_migrator --root engine/rules/json \
+  --target s00.00.003 --dry-run
+
+Register a step next to the schema change that needs it:
+
+@migration("s00.00.002", "s00.00.003")
+def _add_kingz_pit(data):
+    data.setdefault("kingzpit", {...})
+    return data
+
+The migrator sets vSchema after each step; steps only reshape the data.
+"""
+#######################################################################
+import argparse
+import json
+import os
+import re
+import sys
+
+from kit.generator.pitpal_parallel import find_rule_files, run_bounded
+import utils.jsonUtils.pitpal_json_schema_utils as Jsu
+
+RULES_SCHEMA = "engine/rules/schema/pal.rules.schema.json"
+
+# vSchema is the second key of every rule file; this is plenty
+HEADER_BYTES = 4096
+
+_VSCHEMA_RE = re.compile(r'"vSchema"\s*:\s*"([^"]*)"')
+
+
+class MigrationError(Exception):
+    pass
+
+
+# ---------------------------------------------------
+# Registry
+# ---------------------------------------------------
+
+class MigrationRegistry:
+    """
+    Step functions between schema versions. Each step takes the rule
+    dict and returns the upgraded one (it may modify it in place).
+    """
+
+    def __init__(self):
+        self.steps = {}
+
+    def register(self, source, target, func):
+        if source in self.steps:
+            raise MigrationError(f"A migration from {source} is already registered")
+        self.steps[source] = (target, func)
+
+    def migration(self, source, target):
+        def decorator(func):
+            self.register(source, target, func)
+            return func
+        return decorator
+
+    def plan(self, source, target):
+        """
+        Ordered list of (from, to, func) leading from source to target.
+        """
+        plan = []
+        seen = {source}
+        version = source
+        while version != target:
+            if version not in self.steps:
+                raise MigrationError(f"No migration path from {source} to {target} (stuck at {version})")
+            nxt, func = self.steps[version]
+            if nxt in seen:
+                raise MigrationError(f"Migration cycle at {nxt}")
+            plan.append((version, nxt, func))
+            seen.add(nxt)
+            version = nxt
+        return plan
+
+    def migrate(self, data, target):
+        source = data.get("vSchema")
+        if source is None:
+            raise MigrationError("Rule file has no vSchema")
+        for _, nxt, func in self.plan(source, target):
+            data = func(data)
+            data["vSchema"] = nxt
+        return data
+
+
+MIGRATIONS = MigrationRegistry()
+migration = MIGRATIONS.migration
+
+
+# ---------------------------------------------------
+# Registered migrations
+# ---------------------------------------------------
+
+# s00.00.002 is the first versioned schema; add steps here as it moves on.
+
+
+# ---------------------------------------------------
+# Files
+# ---------------------------------------------------
+
+def read_vschema(path):
+    """
+    vSchema from the head of the file, without parsing the whole thing.
+    Falls back to a full parse when the header does not hold it.
+    """
+    with open(path, "r", encoding="utf-8") as f:
+        head = f.read(HEADER_BYTES)
+    match = _VSCHEMA_RE.search(head)
+    if match:
+        return match.group(1)
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f).get("vSchema")
+
+
+def schema_version(schema_path=RULES_SCHEMA):
+    """
+    The vSchema const pinned by the root schema.
+    """
+    with open(schema_path, "r", encoding="utf-8") as f:
+        schema = json.load(f)
+    try:
+        return schema["properties"]["vSchema"]["const"]
+    except KeyError:
+        raise MigrationError(f"{schema_path} does not pin vSchema")
+
+
+def write_atomic(path, data):
+    tmp = f"{path}.{os.getpid()}.tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(data, f, indent=2)
+        f.write("\n")
+    os.replace(tmp, path)
+
+
+# ---------------------------------------------------
+# Workers
+# ---------------------------------------------------
+
+_worker = {}
+
+
+def _init_worker(target, schema_path, dry_run, registry=None):
+    _worker["target"] = target
+    _worker["dry_run"] = dry_run
+    _worker["registry"] = registry or MIGRATIONS
+    _worker["validator"] = Jsu.get_schema_set(schema_path).validator(schema_path) if schema_path else None
+
+
+def migrate_file(path):
+    target = _worker["target"]
+    result = {"file": path}
+    try:
+        source = read_vschema(path)
+        result["from"] = source
+        if source == target:
+            result["status"] = "current"
+            return result
+
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        data = _worker["registry"].migrate(data, target)
+
+        validator = _worker["validator"]
+        if validator is not None:
+            errors = [e.message for e in validator.iter_errors(data)]
+            if errors:
+                result.update(status="invalid", errors=errors)
+                return result
+
+        if not _worker["dry_run"]:
+            write_atomic(path, data)
+        result["status"] = "migrated"
+    except Exception as e:
+        # a broken step fails its file, not the whole run
+        result.update(status="error", errors=[f"{type(e).__name__}: {e}"])
+    return result
+
+
+# ---------------------------------------------------
+# Bulk
+# ---------------------------------------------------
+
+def migrate_all(rules_root, target=None, schema_path=RULES_SCHEMA, jobs=None,
+                pattern="*.json", dry_run=False, validate=True, out=None,
+                registry=None):
+    """
+    Upgrade every rule file under rules_root to target (default: the
+    schema's vSchema). Files already at target are skipped after reading
+    their header only. At most jobs * 4 files are in flight at a time.
+    Migrated files are validated against the schema and only written
+    when valid. Returns the summary report.
+    """
+    if target is None:
+        target = schema_version(schema_path)
+    initargs = (target, schema_path if validate else None, dry_run, registry)
+    report = {"root": rules_root, "target": target,
+              "current": 0, "migrated": 0, "failed": []}
+
+    def record(result):
+        if result["status"] in ("current", "migrated"):
+            report[result["status"]] += 1
+        else:
+            report["failed"].append(result)
+        if out is not None:
+            out.write(json.dumps(result) + "\n")
+            out.flush()
+
+    files = find_rule_files(rules_root, pattern)
+    for result in run_bounded(migrate_file, files, _init_worker, initargs, jobs):
+        record(result)
+
+    return report
+
+
+# ---------------------------------------------------
+# Main
+# ---------------------------------------------------
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="PitPal Rule File Schema Migrator",
+        formatter_class=argparse.ArgumentDefaultsHelpFormatter
+    )
+    parser.add_argument("--root", required=True, help="Directory tree of rule files")
+    parser.add_argument("--schema", default=RULES_SCHEMA, help="Path to root JSON schema file")
+    parser.add_argument("--target", default=None, help="Target vSchema (default: the schema's const)")
+    parser.add_argument("--pattern", default="*.json", help="File name pattern")
+    parser.add_argument("--jobs", type=int, default=None, help="Worker processes (default: CPU count)")
+    parser.add_argument("--dry-run", action="store_true", help="Report only, do not write files")
+    parser.add_argument("--no-validate", action="store_true", help="Skip validating migrated files")
+
+    args = parser.parse_args()
+
+    try:
+        report = migrate_all(args.root, args.target, args.schema, args.jobs,
+                             args.pattern, args.dry_run, not args.no_validate,
+                             out=sys.stdout)
+    except MigrationError as e:
+        print(e)
+        sys.exit(1)
+
+    print(f"{report['migrated']} migrated, {report['current']} current, "
+          f"{len(report['failed'])} failed.")
+    sys.exit(1 if report["failed"] else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,413 @@
+#!/usr/bin/env python3
+# Copyright (C) 2026 Pitpal
+#
+# This file is part of PitPal.
+#
+# PitPal is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License,
+# either version 3 of the License, or (at your option) any later version.
+#
+# PitPal is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+# See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with PitPal. If not, see <https://www.gnu.org/licenses/>.
+#    Author    :  Kalaiyarasan Es
+#    File name :  pitpal/kit/generator/pitpal_schema_compiler.py
+#    Date      :  19/10/2026
+#######################################################################
+"""
+#run from base path; regenerate after any change in engine/rules/schema
+python -m kit.generator.pitpal_schema_compiler \
+  --schema-dir engine/rules/schema \
+  --root engine/rules/schema/pal.rules.schema.json \
+  --output utils/jsonUtils/pitpal_compiled_schema.py
+"""
+#######################################################################
+import argparse
+import hashlib
+import json
+import os
+import sys
+
+
+# keywords that carry no validation meaning
+ANNOTATIONS = {
+    "$schema", "$id", "$defs", "$comment",
+    "title", "description", "default", "examples",
+}
+
+TYPE_CHECKS = {
+    "object": "isinstance(x, dict)",
+    "array": "isinstance(x, list)",
+    "string": "isinstance(x, str)",
+    "boolean": "isinstance(x, bool)",
+    "null": "x is None",
+    "integer": "_is_integer(x)",
+    "number": "_is_number(x)",
+}
+
+RUNTIME = '''
+
+class CompiledValidationError(ValueError):
+
+    def __init__(self, message, path):
+        super().__init__(f"{path}: {message}")
+        self.message = message
+        self.path = path
+
+
+def _is_integer(x):
+    if isinstance(x, bool):
+        return False
+    return isinstance(x, int) or (isinstance(x, float) and x.is_integer())
+
+
+def _is_number(x):
+    return isinstance(x, (int, float)) and not isinstance(x, bool)
+
+
+def _equal(a, b):
+    # JSON equality: booleans never equal numbers
+    if isinstance(a, bool) or isinstance(b, bool):
+        return isinstance(a, bool) and isinstance(b, bool) and a == b
+    if isinstance(a, list) and isinstance(b, list):
+        return len(a) == len(b) and all(_equal(i, j) for i, j in zip(a, b))
+    if isinstance(a, dict) and isinstance(b, dict):
+        return a.keys() == b.keys() and all(_equal(a[k], b[k]) for k in a)
+    if isinstance(a, (list, dict, str)) or isinstance(b, (list, dict, str)):
+        return type(a) is type(b) and a == b
+    return a == b
+
+'''
+
+API = '''
+
+class CompiledValidator:
+    """
+    Drop-in subset of Draft202012Validator: is_valid, iter_errors, validate.
+    """
+
+    def __init__(self, schema_id):
+        self.schema_id = schema_id
+        self._check = VALIDATORS[schema_id]
+
+    def iter_errors(self, instance):
+        errors = []
+        self._check(instance, "$", errors)
+        return iter(errors)
+
+    def is_valid(self, instance):
+        errors = []
+        self._check(instance, "$", errors)
+        return not errors
+
+    def validate(self, instance):
+        errors = []
+        self._check(instance, "$", errors)
+        if errors:
+            raise errors[0]
+
+
+def validator_for(schema_id=ROOT):
+    return CompiledValidator(schema_id)
+
+
+def is_valid(instance, schema_id=ROOT):
+    errors = []
+    VALIDATORS[schema_id](instance, "$", errors)
+    return not errors
+
+
+def validate(instance, schema_id=ROOT):
+    CompiledValidator(schema_id).validate(instance)
+'''
+
+
+def schema_set_hash(schema_dir: str) -> str:
+    digest = hashlib.sha256()
+    for name in sorted(os.listdir(schema_dir)):
+        if name.endswith(".json"):
+            digest.update(name.encode())
+            with open(os.path.join(schema_dir, name), "rb") as f:
+                digest.update(f.read())
+    return digest.hexdigest()
+
+
+class SchemaCompiler:
+    """
+    Compiles a directory of Draft 2020-12 schemas into Python source.
+    Supports the keywords used by engine/rules/schema: $ref (cross file),
+    type, const, enum, required, properties, additionalProperties, items,
+    minimum/maximum, allOf/anyOf/oneOf and if/then/else. Anything else
+    raises NotImplementedError at compile time rather than being ignored.
+    """
+
+    def __init__(self, schema_dir: str):
+        self.schema_dir = schema_dir
+        self.schemas = {}
+        for name in sorted(os.listdir(schema_dir)):
+            if name.endswith(".json"):
+                path = os.path.join(schema_dir, name)
+                with open(path) as f:
+                    schema = json.load(f)
+                self.schemas[schema.get("$id", path)] = schema
+
+        self._functions = []
+        self._constants = []
+        self._compiled = {}
+
+    # ---------------------------
+    # $ref Resolver
+    # ---------------------------
+
+    def _lookup(self, ref: str, base_id: str):
+        target, _, pointer = ref.partition("#")
+        if not target:
+            schema_id = base_id
+        else:
+            schema_id = next(
+                (i for i in self.schemas if target.endswith(i) or i.endswith(target)),
+                None,
+            )
+            if schema_id is None:
+                raise KeyError(f"$ref path invalid: {ref}")
+
+        node = self.schemas[schema_id]
+        for part in pointer.strip("/").split("/") if pointer.strip("/") else []:
+            node = node[part.replace("~1", "/").replace("~0", "~")]
+        return schema_id, pointer, node
+
+    def compile_ref(self, ref: str, base_id: str) -> str:
+        schema_id, pointer, node = self._lookup(ref, base_id)
+        key = (schema_id, pointer)
+        if key not in self._compiled:
+            self._compiled[key] = self._compile(node, schema_id, name_hint=key)
+        return self._compiled[key]
+
+    # ---------------------------
+    # Code Emission
+    # ---------------------------
+
+    def _const(self, value) -> str:
+        name = f"_C{len(self._constants)}"
+        if isinstance(value, frozenset):
+            # sorted so the generated source is reproducible
+            source = f"frozenset({sorted(value)!r})"
+        else:
+            source = repr(value)
+        self._constants.append(f"{name} = {source}")
+        return name
+
+    def _compile(self, node, base_id: str, name_hint=None) -> str:
+        name = f"_v{len(self._functions)}"
+        body = []
+        self._functions.append((name, body))
+        if name_hint is not None:
+            # register before descending so recursive $refs terminate
+            self._compiled[name_hint] = name
+
+        if node is True or node == {}:
+            body.append("pass")
+            return name
+        if node is False:
+            body.append('errors.append(CompiledValidationError("False schema does not allow value", path))')
+            return name
+
+        for keyword in node:
+            if keyword not in ANNOTATIONS and keyword not in self._HANDLED:
+                raise NotImplementedError(f"Unsupported schema keyword: {keyword}")
+
+        if "$ref" in node:
+            body.append(f"{self.compile_ref(node['$ref'], base_id)}(x, path, errors)")
+
+        if "type" in node:
+            types = node["type"] if isinstance(node["type"], list) else [node["type"]]
+            check = " or ".join(TYPE_CHECKS[t] for t in types)
+            message = self._const(f"is not of type {', '.join(repr(t) for t in types)}")
+            body.append(f"if not ({check}):")
+            body.append(f"    errors.append(CompiledValidationError(f\"{{x!r}} {{{message}}}\", path))")
+
+        if "const" in node:
+            value = node["const"]
+            const = self._const(value)
+            if isinstance(value, str):
+                check = f"isinstance(x, str) and x == {const}"
+            else:
+                check = f"_equal(x, {const})"
+            body.append(f"if not ({check}):")
+            body.append(f"    errors.append(CompiledValidationError(f\"{{{const}!r}} was expected\", path))")
+
+        if "enum" in node:
+            values = node["enum"]
+            if all(isinstance(v, str) for v in values):
+                enum = self._const(frozenset(values))
+                check = f"isinstance(x, str) and x in {enum}"
+            else:
+                enum = self._const(values)
+                check = f"any(_equal(x, v) for v in {enum})"
+            listed = self._const(values)
+            body.append(f"if not ({check}):")
+            body.append(f"    errors.append(CompiledValidationError(f\"{{x!r}} is not one of {{{listed}!r}}\", path))")
+
+        for keyword, op in (("minimum", "<"), ("maximum", ">")):
+            if keyword in node:
+                limit = self._const(node[keyword])
+                word = "less" if op == "<" else "greater"
+                body.append(f"if _is_number(x) and x {op} {limit}:")
+                body.append(f"    errors.append(CompiledValidationError(f\"{{x!r}} is {word} than the {keyword} of {{{limit}!r}}\", path))")
+
+        object_lines = self._object_keywords(node, base_id)
+        if object_lines:
+            body.append("if isinstance(x, dict):")
+            body.extend("    " + line for line in object_lines)
+
+        if "items" in node:
+            item = self._compile(node["items"], base_id)
+            body.append("if isinstance(x, list):")
+            body.append("    for i, v in enumerate(x):")
+            body.append(f"        {item}(v, f\"{{path}}[{{i}}]\", errors)")
+
+        for sub in node.get("allOf", ()):
+            body.append(f"{self._compile(sub, base_id)}(x, path, errors)")
+
+        for keyword in ("anyOf", "oneOf"):
+            if keyword in node:
+                subs = [self._compile(sub, base_id) for sub in node[keyword]]
+                body.append("_passed = 0")
+                for sub in subs:
+                    body.append("_e = []")
+                    body.append(f"{sub}(x, path, _e)")
+                    body.append("_passed += not _e")
+                ok = "_passed >= 1" if keyword == "anyOf" else "_passed == 1"
+                body.append(f"if not ({ok}):")
+                body.append(f"    errors.append(CompiledValidationError(f\"{{x!r}} failed {keyword}\", path))")
+
+        if "if" in node:
+            cond = self._compile(node["if"], base_id)
+            then = self._compile(node["then"], base_id) if "then" in node else None
+            other = self._compile(node["else"], base_id) if "else" in node else None
+            body.append("_e = []")
+            body.append(f"{cond}(x, path, _e)")
+            body.append("if not _e:")
+            body.append(f"    {then}(x, path, errors)" if then else "    pass")
+            if other:
+                body.append("else:")
+                body.append(f"    {other}(x, path, errors)")
+
+        if not body:
+            body.append("pass")
+        return name
+
+    _HANDLED = {
+        "$ref", "type", "const", "enum", "minimum", "maximum",
+        "required", "properties", "additionalProperties", "items",
+        "allOf", "anyOf", "oneOf", "if", "then", "else",
+    }
+
+    def _object_keywords(self, node, base_id):
+        lines = []
+
+        for key in node.get("required", ()):
+            msg = self._const(f"{key!r} is a required property")
+            lines.append(f"if {key!r} not in x:")
+            lines.append(f"    errors.append(CompiledValidationError({msg}, path))")
+
+        properties = node.get("properties", {})
+        for key, sub in properties.items():
+            func = self._compile(sub, base_id)
+            lines.append(f"if {key!r} in x:")
+            lines.append(f"    {func}(x[{key!r}], path + {('.' + key)!r}, errors)")
+
+        extra = node.get("additionalProperties", True)
+        if extra is not True:
+            known = self._const(frozenset(properties))
+            lines.append("for k in x:")
+            lines.append(f"    if k not in {known}:")
+            if extra is False:
+                lines.append("        errors.append(CompiledValidationError(f\"Additional properties are not allowed ({k!r} was unexpected)\", path))")
+            else:
+                func = self._compile(extra, base_id)
+                lines.append(f"        {func}(x[k], f\"{{path}}.{{k}}\", errors)")
+
+        return lines
+
+    # ---------------------------
+    # Module Output
+    # ---------------------------
+
+    def entry_points(self):
+        """
+        Every schema file root and every $defs entry.
+        """
+        for schema_id, schema in self.schemas.items():
+            yield schema_id, schema_id
+            for name in schema.get("$defs", {}):
+                yield f"{schema_id}#/$defs/{name}", f"{schema_id}#/$defs/{name}"
+
+    def generate(self, root_id: str) -> str:
+        entries = [(key, self.compile_ref(ref, key.split("#")[0]))
+                   for key, ref in self.entry_points()]
+
+        out = [
+            "# Generated by kit/generator/pitpal_schema_compiler.py. Do not edit.",
+            f"# Source: {self.schema_dir}",
+            "",
+            f"SOURCE_HASH = {schema_set_hash(self.schema_dir)!r}",
+            f"ROOT = {root_id!r}",
+            RUNTIME,
+        ]
+        out.extend(self._constants)
+        out.append("")
+        for name, body in self._functions:
+            out.append("")
+            out.append(f"def {name}(x, path, errors):")
+            out.extend("    " + line for line in body)
+        out.append("")
+        out.append("")
+        out.append("VALIDATORS = {")
+        for key, func in entries:
+            out.append(f"    {key!r}: {func},")
+        out.append("}")
+        out.append(API)
+        return "\n".join(out)
+
+
+def compile_schemas(schema_dir: str, root: str) -> str:
+    compiler = SchemaCompiler(schema_dir)
+    with open(root) as f:
+        root_id = json.load(f).get("$id", root)
+    return compiler.generate(root_id)
+
+
+# ---------------------------------------------------
+# Main
+# ---------------------------------------------------
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="PitPal Schema Compiler",
+        formatter_class=argparse.ArgumentDefaultsHelpFormatter
+    )
+    parser.add_argument("--schema-dir", default="engine/rules/schema", help="Directory holding the schema files")
+    parser.add_argument("--root", default="engine/rules/schema/pal.rules.schema.json", help="Default schema for validate()/is_valid()")
+    parser.add_argument("--output", default="utils/jsonUtils/pitpal_compiled_schema.py", help="Generated module path")
+
+    args = parser.parse_args()
+
+    try:
+        source = compile_schemas(args.schema_dir, args.root)
+    except (KeyError, NotImplementedError) as e:
+        print(e)
+        sys.exit(1)
+
+    with open(args.output, "w") as f:
+        f.write(source)
+    print(f"compiled validators written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
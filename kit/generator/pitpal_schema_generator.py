@@ -2,6 +2,8 @@ import argparse
 import json
 from pitpal_schema_service import JsonSchemaService
 from pitpal_schema_json_mutator import (apply_set, apply_unset, deep_merge)
+from pitpal_incremental_validator import IncrementalValidator, patch_paths
+from jsonschema.exceptions import best_match
 
 
 def main():
@@ -12,8 +14,10 @@ def main():
     parser.add_argument("--unset", action="append")
     parser.add_argument("--patch")
     parser.add_argument("--output", required=True)
+    parser.add_argument("--incremental", action="store_true")
 
     args = parser.parse_args()
+    changed = []
 
     engine = JsonSchemaService(args.schema)
 
@@ -23,18 +27,27 @@ def main():
     if args.patch:
         with open(args.patch) as f:
             patch = json.load(f)
+        changed.extend(patch_paths(data, patch))
         deep_merge(data, patch)
 
     if args.set:
         for entry in args.set:
             key, value = entry.split("=", 1)
             apply_set(engine, data, key, value)
+            changed.append(key)
 
     if args.unset:
         for key in args.unset:
             apply_unset(data, key)
-
-    engine.validate(data)
+            changed.append(key)
+
+    if args.incremental:
+        inc = IncrementalValidator(engine.validator, engine._resolve_ref)
+        error = best_match(inc.revalidate(data, changed))
+        if error is not None:
+            raise error
+    else:
+        engine.validate(data)
 
     with open(args.output, "w") as f:
         json.dump(data, f, indent=2)
\ No newline at end of file
@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+# Copyright (C) 2026 Pitpal
+#
+# This file is part of PitPal.
+#
+# PitPal is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License,
+# either version 3 of the License, or (at your option) any later version.
+#
+# PitPal is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+# See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with PitPal. If not, see <https://www.gnu.org/licenses/>.
+#    Author    :  Kalaiyarasan Es
+#    File name :  pitpal/kit/generator/pitpal_schema_index.py
+#    Date      :  19/10/2026
+#######################################################################
+import re
+
+
+CONSTRAINT_KEYS = ("enum", "const", "minimum", "maximum", "default", "required")
+
+_INDEX_RE = re.compile(r"\[\d+\]")
+
+
+def path_pattern(path: str) -> str:
+    """
+    "board.specialPits[3]" -> "board.specialPits[]"
+    """
+    return _INDEX_RE.sub("[]", path)
+
+
+class SchemaTypeIndex:
+    """
+    Flattened view of a schema: every reachable dotted path pattern
+    (array positions written as "[]") mapped to its resolved Python
+    type(s) and constraints. Built once; lookups are a dict access.
+
+    fully_resolve(node) follows $ref chains, extract_type(node) maps a
+    schema node to Python type(s); both come from the owning resolver.
+    """
+
+    def __init__(self, root, fully_resolve, extract_type):
+        self.fully_resolve = fully_resolve
+        self.extract_type = extract_type
+        self.types = {}
+        self.constraints = {}
+        self._walk(root, "", ())
+
+    def _branches(self, node):
+        """
+        node plus every allOf member, resolved.
+        """
+        nodes = [node]
+        for sub in node.get("allOf", ()):
+            sub = self.fully_resolve(sub)
+            nodes.extend(self._branches(sub))
+        return nodes
+
+    def _walk(self, node, pattern, stack):
+        node = self.fully_resolve(node)
+        if id(node) in stack:
+            return
+        stack = stack + (id(node),)
+
+        branches = self._branches(node)
+
+        if pattern:
+            # a node's own "type" wins over what its applicators imply
+            t = self.extract_type({"type": node["type"]} if "type" in node else node)
+            if t is None or t == [None]:
+                for branch in branches[1:]:
+                    t = self.extract_type(branch)
+                    if t is not None:
+                        break
+            self.types[pattern] = t
+            constraints = {}
+            for branch in reversed(branches):
+                for key in CONSTRAINT_KEYS:
+                    if key in branch:
+                        constraints[key] = branch[key]
+            self.constraints[pattern] = constraints
+
+        properties = {}
+        items = None
+        for branch in branches:
+            properties.update(branch.get("properties", {}))
+            if items is None and isinstance(branch.get("items"), dict):
+                items = branch["items"]
+
+        for key, sub in properties.items():
+            self._walk(sub, f"{pattern}.{key}" if pattern else key, stack)
+
+        if items is not None:
+            self._walk(items, pattern + "[]", stack)
+
+    def lookup(self, path: str):
+        pattern = path_pattern(path)
+        try:
+            return self.types[pattern]
+        except KeyError:
+            pass
+
+        if pattern.endswith("[]") and pattern[:-2] in self.types:
+            raise TypeError(f"Attempted array index on non-array type at '{path}'")
+        raise KeyError(f"Property '{path}' not found in schema")
+
+    def get_constraints(self, path: str) -> dict:
+        return self.constraints[path_pattern(path)]
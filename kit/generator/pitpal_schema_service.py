@@ -1,9 +1,15 @@
+import hashlib
 import json
 import re
 from pathlib import Path
 from jsonschema import Draft202012Validator
+from jsonschema.exceptions import best_match
 from referencing import Registry, Resource
 
+from kit.generator.pitpal_schema_index import SchemaTypeIndex
+from utils.jsonUtils.pitpal_json_schema_utils import retrieve_by_id
+import utils.jsonUtils.pitpal_validation_cache as vc
+
 
 JSON_TYPE_MAP = {
     "string": str,
@@ -18,12 +24,18 @@ JSON_TYPE_MAP = {
 
 class JsonSchemaService:
 
-    def __init__(self, root_schema_path: str):
+    def __init__(self, root_schema_path: str, cache=None):
         self.root_schema_path = Path(root_schema_path).resolve()
         self.schemas = {}
-        self.registry = Registry()
+        self._resources = {}
+        self.registry = Registry(retrieve=retrieve_by_id(self._resources))
         self.root_schema = None
         self.validator = None
+        self.schema_hash = None
+        self._index = None
+        if cache is None:
+            cache = vc.default_cache()
+        self.cache = cache
 
         self._load_schemas()
         self._build_validator()
@@ -34,18 +46,21 @@ class JsonSchemaService:
 
     def _load_schemas(self):
         directory = self.root_schema_path.parent
+        digest = hashlib.sha256()
 
-        for file in directory.glob("*.json"):
-            with open(file) as f:
-                schema_data = json.load(f)
+        for file in sorted(directory.glob("*.json")):
+            with open(file, "rb") as f:
+                raw = f.read()
+            digest.update(file.name.encode())
+            digest.update(raw)
+            schema_data = json.loads(raw)
 
             schema_id = schema_data.get("$id", str(file))
             self.schemas[schema_id] = schema_data
+            resource = Resource.from_contents(schema_data)
+            self._resources[schema_id] = resource
 
-            self.registry = self.registry.with_resource(
-                schema_id,
-                Resource.from_contents(schema_data)
-            )
+            self.registry = self.registry.with_resource(schema_id, resource)
 
             if file == self.root_schema_path:
                 self.root_schema = schema_data
@@ -53,6 +68,10 @@ class JsonSchemaService:
         if not self.root_schema:
             raise ValueError("Root schema not found")
 
+        self.schema_hash = hashlib.sha256(
+            f"{digest.hexdigest()}:{self.root_schema_path.name}".encode()
+        ).hexdigest()
+
     def _build_validator(self):
         self.validator = Draft202012Validator(
             self.root_schema,
@@ -64,7 +83,24 @@ class JsonSchemaService:
     # -----------------------
 
     def validate(self, data: dict):
-        self.validator.validate(data)
+        if self.cache is None:
+            self.validator.validate(data)
+            return
+
+        doc_hash = vc.document_hash(data)
+        hit = self.cache.lookup(self.schema_hash, doc_hash)
+        if hit is not None and hit[0]:
+            return
+
+        # failures are rare: re-run them so the raised error carries the
+        # same path and validator as an uncached call
+        errors = list(self.validator.iter_errors(data))
+        error = best_match(errors)
+        if hit is None:
+            self.cache.store(self.schema_hash, doc_hash, not errors,
+                             [e.message for e in errors])
+        if error is not None:
+            raise error
 
     # -----------------------
     # Path Parsing
@@ -150,16 +186,12 @@ class JsonSchemaService:
     # -----------------------
 
     def get_type(self, path: str):
-        tokens = self._parse_path(path)
-        current = self.root_schema
-
-        for token in tokens:
-            current = self._fully_resolve(current)
-
-            if isinstance(token, str):
-                current = current["properties"][token]
-
-            elif isinstance(token, int):
-                current = current["items"]
+        if self._index is None:
+            self._index = SchemaTypeIndex(
+                self.root_schema, self._fully_resolve, self._extract_type
+            )
+        return self._index.lookup(path)
 
-        return self._extract_type(current)
\ No newline at end of file
+    def get_constraints(self, path: str):
+        self.get_type(path)
+        return self._index.get_constraints(path)
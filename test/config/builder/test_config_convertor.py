@@ -136,3 +136,45 @@ def test_missing_fields_become_none():
     assert config.logging.console is None
     assert config.logging.file is None
     assert config.logging.format is None
+
+
+def test_plan_is_cached():
+
+    plan = ConfigConvertor.plan(PitpalLoggingConfig)
+
+    assert ConfigConvertor.plan(PitpalLoggingConfig) is plan
+    assert ConfigConvertor.plan(PitpalLoggingConfig, coerce=True) is not plan
+
+
+def test_string_values_coerced():
+
+    data = {
+        "logging": {
+            "level": "INFO",
+            "console": {"enabled": "false"},
+            "file": {
+                "enabled": "yes",
+                "path": "app.log",
+                "rotate": "size",
+                "size_rotation": {"max_bytes": "5000", "backup_count": "4"}
+            }
+        }
+    }
+
+    config = ConfigConvertor.config_from_dict(PitpalLoggingConfig, data, coerce=True)
+
+    assert config.logging.console.enabled is False
+    assert config.logging.file.enabled is True
+    assert config.logging.file.size_rotation.max_bytes == 5000
+    assert config.logging.file.path == "app.log"
+
+    plain = ConfigConvertor.config_from_dict(PitpalLoggingConfig, data)
+    assert plain.logging.file.size_rotation.max_bytes == "5000"
+
+
+def test_bad_bool_string_rejected():
+
+    data = {"logging": {"console": {"enabled": "maybe"}}}
+
+    with pytest.raises(ValueError):
+        ConfigConvertor.config_from_dict(PitpalLoggingConfig, data, coerce=True)
@@ -35,3 +35,40 @@ def test_env_loader_empty(monkeypatch):
     result = get_env("LOGGING")
 
     assert result == {}
+
+def test_env_snapshot_indexes_once():
+    from config.builder.env_loader import EnvSnapshot
+
+    environ = {"PITPAL_LOGGING_LEVEL": "INFO", "PITPAL_RULE_YAML": "r.yaml", "HOME": "/root"}
+    snap = EnvSnapshot(environ)
+
+    assert snap.get("logging") == {"logging.level": "INFO"}
+    assert snap.get("rule") == {"rule.yaml": "r.yaml"}
+    assert snap.get("engine") == {}
+
+def test_env_snapshot_picks_up_changes():
+    from config.builder.env_loader import EnvSnapshot
+
+    environ = {"PITPAL_LOGGING_LEVEL": "INFO"}
+    snap = EnvSnapshot(environ)
+    snap.get("logging")
+
+    environ["PITPAL_LOGGING_LEVEL"] = "DEBUG"
+    assert snap.get("logging") == {"logging.level": "DEBUG"}
+
+    environ["PITPAL_LOGGING_FILE_PATH"] = "a.log"
+    assert snap.get("logging")["logging.file.path"] == "a.log"
+
+    # same count, no existing PITPAL_ value touched: needs refresh()
+    del environ["PITPAL_LOGGING_FILE_PATH"]
+    environ["PITPAL_RULE_YAML"] = "r.yaml"
+    snap.refresh()
+    assert snap.get("rule") == {"rule.yaml": "r.yaml"}
+
+def test_env_snapshot_result_is_a_copy():
+    from config.builder.env_loader import EnvSnapshot
+
+    snap = EnvSnapshot({"PITPAL_LOGGING_LEVEL": "INFO"})
+    snap.get("logging")["logging.level"] = "x"
+
+    assert snap.get("logging") == {"logging.level": "INFO"}
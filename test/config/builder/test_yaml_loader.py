@@ -25,3 +25,21 @@ def test_yaml_loader_empty_yaml():
 def test_yaml_loader_file_not_found():
     with pytest.raises(FileNotFoundError):
         YamlLoader.load("non_existing.yaml")
+
+
+def test_yaml_loader_returns_copies():
+    path = "./config/default/logconfig.yaml"
+    data = YamlLoader.load(path)
+    data["logging"]["level"] = "DEBUG"
+
+    assert YamlLoader.load(path)["logging"]["level"] == "INFO"
+
+
+def test_yaml_loader_reloads_changed_file(tmp_path):
+    path = tmp_path / "conf.yaml"
+    path.write_text("a: 1\n")
+    assert YamlLoader.load(str(path)) == {"a": 1}
+
+    path.write_text("a: 22\n")
+
+    assert YamlLoader.load(str(path)) == {"a": 22}
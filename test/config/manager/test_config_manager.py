@@ -6,3 +6,10 @@ def test_get_log_config_manager():
     mgr = getLogConfigManager()
 
     assert isinstance(mgr, LoggingConfigManager)
+
+
+def test_get_engine_config_manager():
+    from config.manager.config_manager import getEngineConfigManager
+    from config.manager.engine_config_manager import EngineConfigManager
+
+    assert isinstance(getEngineConfigManager(), EngineConfigManager)
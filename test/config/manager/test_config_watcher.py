@@ -0,0 +1,79 @@
+import os
+import time
+
+from config.builder.base_builder import ConfigBuilder
+from config.manager.config_watcher import ConfigWatcher
+from config.manager.log_config_manager import LoggingConfigManager
+from config.interface.logging_config_database import PitpalLoggingConfig
+
+
+def _write(path, level):
+    with open("config/default/logconfig.yaml") as f:
+        text = f.read().replace("level: INFO", f"level: {level}")
+    path.write_text(text)
+    # make sure the stamp moves even on coarse mtime filesystems
+    st = path.stat()
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 10**9 * (1 + len(level))))
+
+
+def _watcher(path, **kwargs):
+    builder = ConfigBuilder({}, {}, str(path))
+    return ConfigWatcher(lambda: builder.build(PitpalLoggingConfig), [str(path)], **kwargs)
+
+
+def test_unchanged_file_does_not_rebuild(tmp_path):
+    path = tmp_path / "log.yaml"
+    _write(path, "INFO")
+    watcher = _watcher(path)
+    config = watcher.config
+
+    assert watcher.check() is False
+    assert watcher.config is config
+
+
+def test_change_is_published_to_subscribers(tmp_path):
+    path = tmp_path / "log.yaml"
+    _write(path, "INFO")
+    watcher = _watcher(path)
+    seen = []
+    watcher.subscribe(seen.append)
+
+    _write(path, "DEBUG")
+
+    assert watcher.check() is True
+    assert watcher.config.logging.level == "DEBUG"
+    assert seen == [watcher.config]
+
+
+def test_broken_file_keeps_old_config(tmp_path):
+    path = tmp_path / "log.yaml"
+    _write(path, "INFO")
+    watcher = _watcher(path)
+
+    path.write_text("logging: [unclosed")
+
+    assert watcher.check() is False
+    assert watcher.config.logging.level == "INFO"
+    assert watcher.last_error is not None
+
+
+def test_polling_thread(tmp_path):
+    path = tmp_path / "log.yaml"
+    _write(path, "INFO")
+    watcher = _watcher(path, interval=0.01).start()
+    try:
+        _write(path, "WARNING")
+        deadline = time.monotonic() + 5
+        while watcher.config.logging.level != "WARNING" and time.monotonic() < deadline:
+            time.sleep(0.01)
+    finally:
+        watcher.stop()
+
+    assert watcher.config.logging.level == "WARNING"
+
+
+def test_manager_watch_uses_default_yaml():
+    watcher = LoggingConfigManager().watch({})
+
+    assert watcher.paths == ["config/default/logconfig.yaml"]
+    assert watcher.config.logging.level == "INFO"
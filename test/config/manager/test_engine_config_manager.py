@@ -0,0 +1,87 @@
+import argparse
+import os
+import pytest
+
+from config.manager.engine_config_manager import EngineConfigManager
+from config.interface.engine_config_database import module_name
+from config.interface.engine_config_database import PitpalRuleConfig
+
+
+@pytest.fixture
+def manager():
+    mgr = EngineConfigManager()
+    mgr.clear()
+    yield mgr
+    mgr.clear()
+
+
+def test_singleton_behavior():
+    assert EngineConfigManager() is EngineConfigManager()
+
+
+def test_prefix_matches_module_name(manager):
+    assert manager.prefix == module_name
+
+
+def test_extract_arguments(manager):
+    parser = argparse.ArgumentParser()
+    manager.register_arguments(parser)
+
+    args = parser.parse_args(["--rule-var-time-max", "60", "--rule-fixed-level", "expert"])
+
+    result = manager.extract_arguments(args)
+
+    assert result["rule.var.time.max"] == "60"
+    assert result["rule.fixed.level"] == "expert"
+    assert result["rule.yaml"] is None
+
+
+def test_default_config_from_yaml(manager):
+    config = manager.current()
+
+    assert isinstance(config, PitpalRuleConfig)
+    assert config.rule.var.time.max == 180
+    assert config.rule.fixed.engine == "engine/rules/json/pal.json"
+    assert manager.current() is config
+
+
+def test_cli_and_env_overrides_are_typed(manager, monkeypatch):
+    monkeypatch.setenv("PITPAL_RULE_VAR_CLOCK_ENABLED", "true")
+
+    config = manager.get_config({"rule.var.time.max": "60", "rule.yaml": None})
+
+    assert config.rule.var.time.max == 60
+    assert config.rule.var.clock.enabled is True
+
+
+def test_memoized_per_override_set(manager):
+    a = manager.get_config({"rule.fixed.level": "expert"})
+    b = manager.get_config({"rule.fixed.level": "expert"})
+    c = manager.get_config({"rule.fixed.level": "beginner"})
+
+    assert a is b
+    assert c is not a
+    assert c.rule.fixed.level == "beginner"
+
+
+def test_select_sets_current(manager):
+    config = manager.select({"rule.fixed.algo": "other"})
+
+    assert manager.current() is config
+    assert config.rule.fixed.algo == "other"
+
+
+@pytest.mark.skipif(not hasattr(os, "fork"), reason="needs fork")
+def test_current_after_fork(manager):
+    config = manager.current()
+    manager._lock.acquire()
+    try:
+        pid = os.fork()
+        if pid == 0:
+            ok = manager.get_config({"rule.fixed.level": "expert"}).rule.fixed.level == "expert"
+            os._exit(0 if ok and manager.current() == config else 1)
+    finally:
+        manager._lock.release()
+
+    _, status = os.waitpid(pid, 0)
+    assert os.waitstatus_to_exitcode(status) == 0
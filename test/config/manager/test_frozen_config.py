@@ -0,0 +1,70 @@
+import argparse
+import pytest
+
+import config.manager.config_manager as CM
+import config.manager.frozen_config as fc
+from config.interface.engine_config_database import PitpalRuleConfig
+from config.interface.logging_config_database import PitpalLoggingConfig
+
+
+@pytest.fixture
+def managers():
+    yield CM.getConfigManagers()
+    for manager in CM.getConfigManagers().values():
+        manager.frozen = None
+    CM.getEngineConfigManager().clear()
+
+
+def _args(argv):
+    parser = argparse.ArgumentParser()
+    for manager in CM.getConfigManagers().values():
+        manager.register_arguments(parser)
+    return parser.parse_args(argv)
+
+
+def test_bundle_round_trip(tmp_path):
+    path = tmp_path / "b.bundle"
+
+    digest = fc.write_bundle(path, {"a": (1, "x")})
+
+    assert len(digest) == 64
+    assert fc.read_bundle(path) == {"a": (1, "x")}
+
+
+def test_corrupt_bundle_rejected(tmp_path):
+    path = tmp_path / "b.bundle"
+    fc.write_bundle(path, {"a": 1})
+    raw = bytearray(path.read_bytes())
+    raw[-2] ^= 0xFF
+    path.write_bytes(bytes(raw))
+
+    with pytest.raises(ValueError):
+        fc.read_bundle(path)
+    path.write_bytes(b"nope")
+    with pytest.raises(ValueError):
+        fc.read_bundle(path)
+
+
+def test_freeze_and_load(tmp_path, managers, monkeypatch):
+    path = tmp_path / "pitpal.config.bundle"
+    CM.freezeConfig(_args(["--rule-var-time-max", "42", "--logging-level", "DEBUG"]), path)
+
+    configs = CM.loadFrozenConfig(path)
+
+    assert isinstance(configs["rule"], PitpalRuleConfig)
+    assert isinstance(configs["logging"], PitpalLoggingConfig)
+
+    # neither YAML nor env is consulted any more
+    monkeypatch.setenv("PITPAL_RULE_VAR_TIME_MAX", "7")
+    engine = CM.getEngineConfigManager()
+    assert engine.current().rule.var.time.max == 42
+    assert engine.get_config({}).rule.var.time.max == 42
+    assert CM.getLogConfigManager().get_config({}).logging.level == "DEBUG"
+
+
+def test_bundle_missing_manager(tmp_path, managers):
+    path = tmp_path / "partial.bundle"
+    fc.write_bundle(path, {"rule": None})
+
+    with pytest.raises(ValueError):
+        CM.loadFrozenConfig(path)
@@ -0,0 +1,131 @@
+import pytest
+
+from engine.src.engine_pool import EnginePool, rule_file_hash
+
+
+class FakeEngine:
+
+    def __init__(self, rule_path):
+        self.rule_path = rule_path
+        self.moves = []
+        self.resets = 0
+
+    def reset(self):
+        self.moves.clear()
+        self.resets += 1
+
+
+@pytest.fixture
+def rule_files(tmp_path):
+    files = []
+    for i in range(3):
+        f = tmp_path / f"rule{i}.json"
+        f.write_text('{"vRule": "r%d"}' % i)
+        files.append(str(f))
+    return files
+
+
+def test_checkout_builds_on_cold_miss(rule_files):
+    built = []
+    pool = EnginePool(factory=lambda p: built.append(p) or FakeEngine(p))
+
+    engine = pool.checkout(rule_files[0])
+
+    assert isinstance(engine, FakeEngine)
+    assert built == [rule_files[0]]
+
+
+def test_checkin_reuses_and_resets(rule_files):
+    pool = EnginePool(factory=FakeEngine)
+
+    engine = pool.checkout(rule_files[0])
+    engine.moves.append(3)
+    pool.checkin(engine)
+
+    again = pool.checkout(rule_files[0])
+
+    assert again is engine
+    assert again.moves == []
+    assert again.resets == 1
+
+
+def test_same_content_shares_variant(tmp_path, rule_files):
+    copy = tmp_path / "copy.json"
+    copy.write_text(open(rule_files[0]).read())
+
+    pool = EnginePool(factory=FakeEngine)
+    pool.warm(rule_files[0])
+
+    assert rule_file_hash(str(copy)) == rule_file_hash(rule_files[0])
+    assert pool.idle_count(str(copy)) == 1
+
+
+def test_lru_evicts_cold_variant(rule_files):
+    pool = EnginePool(factory=FakeEngine, max_variants=2)
+
+    pool.warm(rule_files[0])
+    pool.warm(rule_files[1])
+    pool.checkin(pool.checkout(rule_files[0]))
+    pool.warm(rule_files[2])
+
+    assert rule_file_hash(rule_files[1]) not in pool.variants()
+    assert pool.variants() == [
+        rule_file_hash(rule_files[0]),
+        rule_file_hash(rule_files[2]),
+    ]
+
+
+def test_max_idle_bounds_pool(rule_files):
+    pool = EnginePool(factory=FakeEngine, max_idle=2)
+
+    pool.warm(rule_files[0], count=5)
+
+    assert pool.idle_count(rule_files[0]) == 2
+
+
+def test_checkin_unknown_instance():
+    pool = EnginePool(factory=FakeEngine)
+
+    with pytest.raises(KeyError):
+        pool.checkin(FakeEngine("x"))
+
+
+def test_changed_file_gets_new_variant(rule_files):
+    pool = EnginePool(factory=FakeEngine)
+    pool.warm(rule_files[0])
+
+    with open(rule_files[0], "w") as f:
+        f.write('{"vRule": "changed-content"}')
+
+    assert pool.idle_count(rule_files[0]) == 0
+
+
+def test_cold_hash_does_not_block_warm_checkout(rule_files, monkeypatch):
+    import threading
+    import engine.src.engine_pool as ep
+
+    pool = EnginePool(factory=FakeEngine)
+    pool.warm(rule_files[0])
+    hashing = threading.Event()
+    release = threading.Event()
+    real_hash = ep.rule_file_hash
+
+    def slow_hash(path):
+        if path == rule_files[1]:
+            hashing.set()
+            release.wait(5)
+        return real_hash(path)
+
+    monkeypatch.setattr(ep, "rule_file_hash", slow_hash)
+    cold = threading.Thread(target=pool.checkout, args=(rule_files[1],))
+    cold.start()
+    hashing.wait(5)
+
+    warm = []
+    worker = threading.Thread(target=lambda: warm.append(pool.checkout(rule_files[0])))
+    worker.start()
+    worker.join(1)
+    release.set()
+    cold.join(5)
+
+    assert len(warm) == 1
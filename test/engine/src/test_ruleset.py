@@ -0,0 +1,119 @@
+import json
+import pytest
+
+from engine.src.ruleset import RuleSetLoader, RuleSet
+from config.interface.engine_config_database import (
+    VarRuleConfig,
+    BoardConfig,
+    Fruiting,
+    TimePerMove,
+    ClockRule,
+)
+
+PAL_RULES = "engine/rules/json/pal.json"
+
+
+@pytest.fixture
+def var_config():
+    return VarRuleConfig(
+        board=BoardConfig(nseeds=5, npits=6, nside=2),
+        fruit=Fruiting(dormant=True, period=3),
+        time=TimePerMove(max=180, enabled=True),
+        clock=ClockRule(enabled=False, min=10),
+        kingzpit=False,
+        capture="beyond",
+        captureplus=False,
+    )
+
+
+@pytest.fixture
+def user_rules(tmp_path):
+    with open(PAL_RULES) as f:
+        data = json.load(f)
+
+    seeds = data["board"]["nSeeds"]["Param"]
+    seeds.update({"Config": "user", "Min": "4", "Max": "8"})
+
+    mod = data["mod"]["Param"]
+    mod.update({"Config": "flexi", "Options": ["5", "11"]})
+
+    path = tmp_path / "user.json"
+    path.write_text(json.dumps(data))
+    return str(path)
+
+
+def test_values_are_typed():
+    rules = RuleSetLoader().load(PAL_RULES)
+
+    assert isinstance(rules, RuleSet)
+    assert rules.pits_per_side == 7
+    assert rules.n_seeds == 6
+    assert rules.algorithm == "classic"
+    assert rules.direction is True
+    assert rules.timelimit == 1000
+    assert rules.timelimit_enabled is False
+    assert rules.param("nSeeds").min == 6
+
+
+def test_ruleset_is_frozen():
+    rules = RuleSetLoader().load(PAL_RULES)
+
+    with pytest.raises(AttributeError):
+        rules.n_seeds = 3
+    assert not hasattr(rules, "__dict__")
+
+
+def test_fixed_params_ignore_overrides(var_config):
+    rules = RuleSetLoader().load(PAL_RULES, var_config)
+
+    assert rules.n_seeds == 6
+    assert rules.fruit_period == 3
+    assert rules.kingzpit is False
+
+
+def test_user_params_take_overrides(user_rules, var_config):
+    rules = RuleSetLoader().load(user_rules, var_config)
+
+    assert rules.n_seeds == 5
+    assert rules.param("mod").options == (5, 11)
+
+
+def test_override_out_of_range(user_rules, var_config):
+    var = VarRuleConfig(
+        board=BoardConfig(nseeds=20, npits=6, nside=2),
+        fruit=var_config.fruit,
+        time=var_config.time,
+        clock=var_config.clock,
+        kingzpit=False,
+        capture="beyond",
+        captureplus=False,
+    )
+
+    with pytest.raises(ValueError):
+        RuleSetLoader().load(user_rules, var)
+
+
+def test_in_process_cache_returns_same_object():
+    loader = RuleSetLoader()
+
+    assert loader.load(PAL_RULES) is loader.load(PAL_RULES)
+
+
+def test_disk_cache_skips_validation(tmp_path):
+    RuleSetLoader(cache_dir=str(tmp_path)).load(PAL_RULES)
+
+    assert list((tmp_path / "ruleset").glob("*.rsc"))
+
+    loader = RuleSetLoader(cache_dir=str(tmp_path))
+    loader._compile = None   # would fail if called
+    rules = loader.load(PAL_RULES)
+
+    assert rules.n_seeds == 6
+
+
+def test_invalid_rule_file(tmp_path):
+    path = tmp_path / "bad.json"
+    path.write_text(json.dumps({"vRule": "r", "vSchema": "bad"}))
+
+    with pytest.raises(ValueError):
+        RuleSetLoader().load(str(path))
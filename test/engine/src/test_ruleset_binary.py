@@ -0,0 +1,124 @@
+import json
+import os
+import pytest
+
+import engine.src.ruleset_binary as rsb
+from engine.src.ruleset import RuleSetLoader
+from config.interface.engine_config_database import (
+    VarRuleConfig,
+    BoardConfig,
+    Fruiting,
+    TimePerMove,
+    ClockRule,
+)
+
+PAL_RULES = "engine/rules/json/pal.json"
+
+
+@pytest.fixture
+def rule_file(tmp_path):
+    path = tmp_path / "pal.json"
+    with open(PAL_RULES) as f:
+        path.write_text(f.read())
+    return path
+
+
+@pytest.fixture
+def var_config():
+    return VarRuleConfig(
+        board=BoardConfig(nseeds=5, npits=6, nside=2),
+        fruit=Fruiting(dormant=True, period=3),
+        time=TimePerMove(max=180, enabled=True),
+        clock=ClockRule(enabled=False, min=10),
+        kingzpit=False,
+        capture="beyond",
+        captureplus=False,
+    )
+
+
+def test_round_trip(var_config):
+    rules = RuleSetLoader().load(PAL_RULES, var_config)
+
+    buf = rsb.encode(rules, 123, 456, bytes(32))
+
+    assert rsb.decode(buf) == rules
+    header = rsb.read_header(buf)
+    assert (header.mtime_ns, header.size) == (123, 456)
+    assert header.source_digest.hex() == rules.source_hash
+
+
+def test_foreign_or_truncated_data_rejected():
+    rules = RuleSetLoader().load(PAL_RULES)
+    buf = rsb.encode(rules, 1, 1, bytes(32))
+
+    assert rsb.read_header(b"PPRS") is None
+    assert rsb.read_header(b"XXXX" + buf[4:]) is None
+    with pytest.raises(rsb.RuleSetFormatError):
+        rsb.decode(buf[:-3])
+
+
+def test_sidecar_skips_json(rule_file):
+    rules = RuleSetLoader(sidecar=True).load(str(rule_file))
+    sidecar = rule_file.with_name("pal.json.rsc")
+    assert sidecar.exists()
+
+    # same stamp: the JSON is not even read
+    st = rule_file.stat()
+    rule_file.write_text("x" * st.st_size)
+    os.utime(rule_file, ns=(st.st_atime_ns, st.st_mtime_ns))
+    loader = RuleSetLoader(sidecar=True)
+    loader._compile = None
+
+    assert loader.load(str(rule_file)) == rules
+
+
+def test_touched_file_reuses_binary(rule_file, tmp_path):
+    RuleSetLoader(cache_dir=str(tmp_path / "cache")).load(str(rule_file))
+    st = rule_file.stat()
+    os.utime(rule_file, ns=(st.st_atime_ns, st.st_mtime_ns + 10**9))
+
+    loader = RuleSetLoader(cache_dir=str(tmp_path / "cache"))
+    loader._compile = None
+    rules = loader.load(str(rule_file))
+
+    buf = loader.binary_path(str(rule_file)).read_bytes()
+    assert rsb.read_header(buf).mtime_ns == rule_file.stat().st_mtime_ns
+    assert rules.n_seeds == 6
+
+
+def test_changed_file_recompiles(rule_file, tmp_path):
+    loader = RuleSetLoader(cache_dir=str(tmp_path / "cache"))
+    loader.load(str(rule_file))
+
+    data = json.loads(rule_file.read_text())
+    data["vRule"] = "r00.00.999"
+    rule_file.write_text(json.dumps(data))
+
+    rules = RuleSetLoader(cache_dir=str(tmp_path / "cache")).load(str(rule_file))
+
+    assert rules.v_rule == "r00.00.999"
+
+
+def test_overrides_get_their_own_file(rule_file, var_config):
+    loader = RuleSetLoader(sidecar=True)
+
+    plain = loader.load(str(rule_file))
+    with_var = loader.load(str(rule_file), var_config)
+
+    assert loader.binary_path(str(rule_file)) != loader.binary_path(str(rule_file), var_config)
+    assert plain.fruit_period is None
+    assert with_var.fruit_period == 3
+    assert len(list(rule_file.parent.glob("*.rsc"))) == 2
+
+
+def test_same_content_at_another_path_is_not_recompiled(rule_file, tmp_path):
+    rules = RuleSetLoader(cache_dir=str(tmp_path / "cache")).load(str(rule_file))
+    copy = tmp_path / "copy" / "pal.json"
+    copy.parent.mkdir()
+    copy.write_bytes(rule_file.read_bytes())
+
+    loader = RuleSetLoader(cache_dir=str(tmp_path / "cache"))
+    loader._compile = None
+
+    assert loader.load(str(copy)) == rules
+    assert loader.binary_path(str(copy)).exists()
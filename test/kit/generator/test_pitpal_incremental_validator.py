@@ -0,0 +1,89 @@
+import json
+import pytest
+
+from kit.generator.pitpal_schema_service import JsonSchemaService
+from kit.generator.pitpal_incremental_validator import (
+    IncrementalValidator,
+    parse_path,
+    patch_paths,
+)
+
+RULES_SCHEMA = "engine/rules/schema/pal.rules.schema.json"
+
+EDITS = [
+    ("board.nSeeds.Param.Value", "9"),
+    ("board.nSeeds.Param.Value", 9),
+    ("board.nSeeds.Param.Config", "flexi"),
+    ("board.nSeeds.Param.Config", "nowhere"),
+    ("board.nSeeds.Type", "enum"),
+    ("board.specialPits", [1, 2]),
+    ("board.specialPits", [-1]),
+    ("mod.Param.Options", ["5", "11"]),
+    ("mod.Param.Options", "['5', '11']"),
+    ("capture.SubType", "opposite"),
+    ("capture.SubType", "sideways"),
+    ("capture.Extra", 1),
+    ("direction.Param.Enabled", "yes"),
+]
+
+
+@pytest.fixture(scope="module")
+def service():
+    return JsonSchemaService(RULES_SCHEMA)
+
+
+@pytest.fixture
+def rules():
+    with open("engine/rules/json/pal.json") as f:
+        return json.load(f)
+
+
+def set_path(data, path, value):
+    tokens = parse_path(path)
+    node = data
+    for token in tokens[:-1]:
+        node = node[token]
+    node[tokens[-1]] = value
+
+
+def test_parse_path():
+    assert parse_path("board.specialPits[1]") == ["board", "specialPits", 1]
+
+
+def test_patch_paths(rules):
+    patch = {"board": {"nSeeds": {"Param": {"Value": "8"}}}, "vRule": "r2"}
+
+    assert list(patch_paths(rules, patch)) == [
+        ["board", "nSeeds", "Param", "Value"],
+        ["vRule"],
+    ]
+
+
+@pytest.mark.parametrize("path, value", EDITS)
+def test_agrees_with_full_validation(service, rules, path, value):
+    set_path(rules, path, value)
+    inc = IncrementalValidator(service.validator, service._resolve_ref)
+
+    expected = service.validator.is_valid(rules)
+
+    assert inc.is_valid(rules, [path]) == expected
+
+
+def test_only_changed_subtree_is_checked(service, rules):
+    inc = IncrementalValidator(service.validator, service._resolve_ref)
+    rules["capture"]["SubType"] = "sideways"     # not reported: unchanged
+    rules["board"]["nSeeds"]["Param"]["Config"] = "nowhere"
+
+    errors = inc.revalidate(rules, ["board.nSeeds.Param.Config"])
+
+    assert [list(e.path) for e in errors] == [["board", "nSeeds", "Param", "Config"]]
+
+
+def test_root_change_falls_back_to_full(service, rules):
+    inc = IncrementalValidator(service.validator, service._resolve_ref)
+    rules["capture"]["SubType"] = "sideways"
+    del rules["vRule"]
+
+    errors = inc.revalidate(rules, ["vRule"])
+
+    assert len(errors) == 2
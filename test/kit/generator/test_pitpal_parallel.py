@@ -0,0 +1,47 @@
+import time
+import pytest
+
+import kit.generator.pitpal_parallel as parallel
+
+
+def test_find_rule_files_is_sorted(tmp_path):
+    (tmp_path / "b").mkdir()
+    (tmp_path / "a").mkdir()
+    for name in ("b/2.json", "b/1.json", "a/3.json", "a/notes.txt"):
+        (tmp_path / name).write_text("{}")
+
+    files = list(parallel.find_rule_files(str(tmp_path)))
+
+    assert files == [str(tmp_path / n) for n in ("a/3.json", "b/1.json", "b/2.json")]
+
+
+@pytest.mark.parametrize("jobs", [1, 2])
+def test_run_bounded(jobs):
+    items = (str(i) for i in range(50))
+
+    results = parallel.run_bounded(int, items, jobs=jobs, window=1)
+
+    assert sorted(results) == list(range(50))
+
+
+def test_run_bounded_inline_runs_initializer():
+    calls = []
+
+    results = list(parallel.run_bounded(len, ["ab", "c"], calls.append, ("init",), jobs=1))
+
+    assert calls == ["init"]
+    assert results == [2, 1]
+
+
+def _sleep(seconds):
+    time.sleep(seconds)
+    return seconds
+
+
+def test_run_bounded_streams_last_window():
+    # one slow item must not hold back the ones that finished after it
+    items = [1.0] + [0] * 15
+
+    results = list(parallel.run_bounded(_sleep, items, jobs=2, window=8))
+
+    assert results[-1] == 1.0
@@ -0,0 +1,75 @@
+import io
+import json
+import os
+import subprocess
+import sys
+import threading
+
+import kit.generator.pitpal_rules_client as client
+import kit.generator.pitpal_rules_creator_cli as cli
+
+RULES_SCHEMA = "engine/rules/schema/pal.rules.schema.json"
+
+
+def edit_argv(tmp_path, *extra):
+    return ["--schema", RULES_SCHEMA,
+            "--sample", "engine/rules/json/pal.json",
+            "--output", str(tmp_path / "out.json"), *extra]
+
+
+def test_socket_round_trip(tmp_path, monkeypatch):
+    sock_path = str(tmp_path / "rules.sock")
+    loaded = {}
+    cli.load_schema_pair(os.path.abspath(RULES_SCHEMA), loaded)
+    server = cli.RulesDaemon(sock_path, loaded)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    monkeypatch.setattr(cli, "load_schema", None)   # the preloaded schema is reused
+    try:
+        status, output = client.forward(sock_path, edit_argv(tmp_path))
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    assert status == 0
+    assert "Validated successfully" in output
+    assert (tmp_path / "out.json").exists()
+
+
+def test_forward_pins_file_arguments(tmp_path, monkeypatch):
+    sent = []
+
+    class FakeSocket:
+        def __init__(self, *args):
+            pass
+
+        def __enter__(self):
+            return self
+
+        def __exit__(self, *exc):
+            return False
+
+        def connect(self, path):
+            pass
+
+        def sendall(self, data):
+            sent.append(data)
+
+        def makefile(self, *args, **kwargs):
+            return io.StringIO('{"status": 0, "output": ""}\n')
+
+    monkeypatch.setattr(client.socket, "socket", FakeSocket)
+    client.forward("sock", edit_argv(tmp_path, "--set", "mod.Param.Value=11"))
+
+    argv = json.loads(sent[0])["argv"]
+    assert argv[1] == os.path.realpath(RULES_SCHEMA)
+    assert argv[3] == os.path.realpath("engine/rules/json/pal.json")
+    assert argv[-1] == "mod.Param.Value=11"
+
+
+def test_client_imports_only_the_standard_library():
+    code = "import sys, kit.generator.pitpal_rules_client; print('jsonschema' in sys.modules)"
+
+    out = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+
+    assert out.stdout.strip() == "False"
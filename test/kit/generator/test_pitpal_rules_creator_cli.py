@@ -0,0 +1,119 @@
+import io
+import json
+import os
+import shutil
+import pytest
+
+import kit.generator.pitpal_rules_creator_cli as cli
+
+RULES_SCHEMA = "engine/rules/schema/pal.rules.schema.json"
+
+
+@pytest.fixture
+def rules_tree(tmp_path):
+    nested = tmp_path / "variants" / "v1"
+    nested.mkdir(parents=True)
+    shutil.copy("engine/rules/json/pal.json", tmp_path / "pal.json")
+    shutil.copy("engine/rules/json/pal.json", nested / "copy.json")
+    # Options stored as a string: invalid against parameter.schema.json
+    shutil.copy("engine/rules/json/pal2020.json", nested / "pal2020.json")
+    (nested / "broken.json").write_text("{not json")
+    (nested / "notes.txt").write_text("ignored")
+    return tmp_path
+
+
+def test_load_schema_resolves_nested_refs():
+    validator = cli.load_schema(RULES_SCHEMA)
+
+    with open("engine/rules/json/pal.json") as f:
+        assert validator.is_valid(json.load(f))
+
+
+@pytest.mark.parametrize("jobs", [1, 2])
+def test_validate_all(rules_tree, jobs):
+    out = io.StringIO()
+
+    report = cli.validate_all(RULES_SCHEMA, str(rules_tree), jobs=jobs, out=out)
+
+    assert report["total"] == 4
+    assert report["invalid"] == 2
+    streamed = [json.loads(line) for line in out.getvalue().splitlines()]
+    assert len(streamed) == 4
+    invalid = {r["file"].rsplit("/", 1)[-1] for r in report["results"] if not r["valid"]}
+    assert invalid == {"pal2020.json", "broken.json"}
+
+
+def test_validate_all_main_exit_code(rules_tree, tmp_path):
+    report_file = tmp_path / "report.json"
+
+    code = cli.validate_all_main([
+        "--schema", RULES_SCHEMA,
+        "--rules", str(rules_tree / "variants"),
+        "--jobs", "1",
+        "--report", str(report_file),
+    ])
+
+    assert code == 1
+    assert json.loads(report_file.read_text())["invalid"] == 2
+
+
+def test_validate_all_main_all_valid(tmp_path, capsys):
+    shutil.copy("engine/rules/json/pal.json", tmp_path / "pal.json")
+
+    code = cli.validate_all_main(["--rules", str(tmp_path), "--jobs", "1"])
+
+    assert code == 0
+    assert '"invalid": 0' in capsys.readouterr().out
+
+
+def edit_argv(tmp_path, *extra):
+    return ["--schema", RULES_SCHEMA,
+            "--sample", "engine/rules/json/pal.json",
+            "--output", str(tmp_path / "out.json"), *extra]
+
+
+def test_handle_request_reuses_loaded_schema(tmp_path, monkeypatch):
+    loaded = {}
+    status, output = cli.handle_request(
+        edit_argv(tmp_path, "--set", "capture.SubType=opposite"), loaded)
+
+    assert status == 0
+    assert "Validated successfully" in output
+    assert json.loads((tmp_path / "out.json").read_text())["capture"]["SubType"] == "opposite"
+
+    monkeypatch.setattr(cli, "load_schema", None)   # must not be called again
+    status, _ = cli.handle_request(edit_argv(tmp_path), loaded)
+    assert status == 0
+
+
+def test_handle_request_survives_bad_arguments(tmp_path):
+    status, output = cli.handle_request(["--sample"], {})
+
+    assert status == 2
+    assert "usage" in output
+
+
+def test_serve_stream(tmp_path):
+    requests = io.StringIO(
+        json.dumps({"argv": edit_argv(tmp_path, "--set", "capture.SubType=sideways")}) + "\n"
+        + "not json\n"
+    )
+    out = io.StringIO()
+
+    cli.serve_stream(requests, out, {})
+
+    replies = [json.loads(line) for line in out.getvalue().splitlines()]
+    assert replies[0]["status"] == 0
+    assert "Validation failed" in replies[0]["output"]
+    assert replies[1]["status"] == 2
+
+
+def test_loaded_schema_is_keyed_by_real_path(tmp_path, monkeypatch):
+    loaded = {}
+    cli.load_schema_pair(RULES_SCHEMA, loaded)
+
+    monkeypatch.setattr(cli, "load_schema", None)   # must not be called again
+    cli.load_schema_pair(os.path.abspath(RULES_SCHEMA), loaded)
+
+    assert list(loaded) == [os.path.realpath(RULES_SCHEMA)]
+
@@ -0,0 +1,157 @@
+import json
+import queue
+import threading
+
+import pytest
+
+import kit.generator.pitpal_rules_creator_tk as tk_creator
+
+RULES_SCHEMA = "engine/rules/schema/pal.rules.schema.json"
+
+
+# no display here: build the objects without their widgets
+
+class FakeRoot:
+
+    def __init__(self):
+        self.pending = {}
+        self.cancelled = []
+        self._next = 0
+
+    def after(self, ms, func):
+        self._next += 1
+        self.pending[self._next] = (ms, func)
+        return self._next
+
+    def after_cancel(self, after_id):
+        self.cancelled.append(after_id)
+        self.pending.pop(after_id, None)
+
+
+class FakeLabel:
+
+    def __init__(self):
+        self.text = None
+
+    def config(self, text=None, foreground=None):
+        self.text = text
+
+
+class FakeVar:
+
+    def __init__(self):
+        self.value = ""
+
+    def get(self):
+        return self.value
+
+
+@pytest.fixture
+def generator():
+    gen = object.__new__(tk_creator.RuleGenerator)
+    gen.root = FakeRoot()
+    gen.schema_path = RULES_SCHEMA
+    with open(RULES_SCHEMA) as f:
+        gen.schema = json.load(f)
+    gen._validator = None
+    gen._section_validators = {}
+    gen._validator_lock = threading.Lock()
+    gen._validation_results = queue.Queue()
+    gen._validation_generation = 0
+    gen._debounce_id = None
+    gen.status_label = FakeLabel()
+    return gen
+
+
+@pytest.fixture
+def board():
+    with open("engine/rules/json/pal.json") as f:
+        return json.load(f)["board"]
+
+
+def test_unvisited_sections_are_not_reported(generator, board):
+    generator._validate_worker(1, {"board": board}, ["vRule", "board"])
+
+    assert generator._validation_results.get_nowait() == (1, [])
+
+
+def test_visited_section_errors_keep_their_path(generator, board):
+    board["nSeeds"]["Param"]["Config"] = "flexi"
+
+    generator._validate_worker(1, {"board": board}, ["board"])
+
+    _, errors = generator._validation_results.get_nowait()
+    assert errors
+    assert all(e.startswith("board/nSeeds/Param") for e in errors)
+
+
+def test_debounce_keeps_one_pending_validation(generator):
+    for _ in range(3):
+        generator.schedule_validation()
+
+    assert len(generator.root.cancelled) == 2
+    assert list(generator.root.pending.values()) == [
+        (tk_creator.VALIDATION_DEBOUNCE_MS, generator._start_validation)
+    ]
+
+
+def test_superseded_results_are_dropped(generator):
+    generator._validation_generation = 2
+    generator._validation_results.put((1, ["board: stale"]))
+    generator._validation_results.put((2, []))
+
+    generator._poll_validation()
+
+    assert generator.status_label.text == "Valid"
+
+    generator._validation_generation = 3
+    generator._validation_results.put((2, ["board: stale"]))
+    generator._poll_validation()
+
+    assert generator.status_label.text == "Valid"
+
+
+@pytest.fixture
+def entries():
+    lst = object.__new__(tk_creator.VirtualEntryList)
+    lst.values = [str(i) for i in range(25)]
+    lst.visible_rows = 10
+    lst.first = 0
+    lst._loading = False
+    lst.rows = [(None, None, FakeVar()) for _ in range(10)]
+    lst.refresh = lambda: None
+    return lst
+
+
+def test_virtual_list_scroll_is_clamped(entries):
+    entries.scroll(-5)
+    assert entries.first == 0
+
+    entries.scroll(100)
+    assert entries.first == 15
+
+    entries.yview("moveto", "0.2")
+    assert entries.first == 5
+
+    entries.yview("scroll", "1", "pages")
+    assert entries.first == 15
+
+
+def test_virtual_list_edit_maps_slot_to_index(entries):
+    entries.scroll(7)
+    entries.rows[2][2].value = "edited"
+
+    entries._on_edit(2)
+
+    assert entries.values[9] == "edited"
+
+
+def test_virtual_list_resize(entries):
+    entries.scroll(15)
+
+    entries.resize(12)
+    assert entries.values == [str(i) for i in range(12)]
+    assert entries.first == 2
+
+    entries.resize(14)
+    assert entries.values[12:] == ["", ""]
@@ -0,0 +1,110 @@
+import json
+import pytest
+
+import kit.generator.pitpal_rules_matrix as matrix
+
+
+@pytest.fixture
+def sample(tmp_path):
+    with open("engine/rules/json/pal.json") as f:
+        data = json.load(f)
+    data["mod"]["Param"].update({"Config": "flexi", "Options": ["5", "11"]})
+    data["board"]["nSeeds"]["Param"].update({"Config": "flexi", "Options": ["4", "5", "6"]})
+    path = tmp_path / "base.json"
+    path.write_text(json.dumps(data))
+    return str(path)
+
+
+def test_find_option_params(sample):
+    with open(sample) as f:
+        found = dict(matrix.find_option_params(json.load(f)))
+
+    assert found == {"board.nSeeds": ["4", "5", "6"], "mod": ["5", "11"]}
+
+
+def test_string_options_are_parsed():
+    with open("engine/rules/json/pal2020.json") as f:
+        found = dict(matrix.find_option_params(json.load(f)))
+
+    assert found == {"mod": ["5", "11"]}
+
+
+def test_iter_combinations_is_lazy():
+    params = [("a", [str(i) for i in range(1000)])] * 4
+
+    combos = matrix.iter_combinations(params)
+
+    assert next(combos) == (("a", "0"),) * 4
+
+
+def test_select_params_subset():
+    found = [("mod", ["5", "11"]), ("board.nSeeds", ["4", "5"])]
+
+    assert matrix.select_params(found, {"mod": ["11"]}) == [("mod", ["11"])]
+    with pytest.raises(ValueError):
+        matrix.select_params(found, {"mod": ["7"]})
+    with pytest.raises(KeyError):
+        matrix.select_params(found, {"nPlayers": None})
+
+
+@pytest.mark.parametrize("jobs", [1, 2])
+def test_generate_matrix(sample, tmp_path, jobs):
+    out_dir = tmp_path / "out"
+
+    report = matrix.generate_matrix(sample, str(out_dir), jobs=jobs)
+
+    assert report["written"] == 6
+    assert report["invalid"] == []
+    files = sorted(p.name for p in out_dir.glob("*.json"))
+    assert "base__nSeeds-4__mod-11.json" in files
+    data = json.loads((out_dir / "base__nSeeds-4__mod-11.json").read_text())
+    assert data["mod"]["Param"]["Value"] == "11"
+    assert data["board"]["nSeeds"]["Param"]["Value"] == "4"
+    assert data["board"]["nSeeds"]["Param"]["Config"] == "fixed"
+    assert data["board"]["nSeeds"]["Param"]["Options"] is None
+
+
+def test_build_variant_pins_value():
+    with open("engine/rules/json/pal2020.json") as f:
+        base_json = f.read()
+
+    data = matrix.build_variant(base_json, (("mod", "11"),))
+
+    assert data["mod"]["Param"]["Value"] == "11"
+    assert data["mod"]["Param"]["Config"] == "fixed"
+    assert data["mod"]["Param"]["Options"] is None
+
+
+@pytest.mark.parametrize("jobs", [1, 2])
+def test_pal2020_example(tmp_path, jobs):
+    # the sample from the module docstring
+    report = matrix.generate_matrix("engine/rules/json/pal2020.json",
+                                    str(tmp_path), jobs=jobs)
+
+    assert report["written"] == 2
+    assert report["invalid"] == []
+    data = json.loads((tmp_path / "pal2020__mod-11.json").read_text())
+    assert data["mod"]["Param"]["Config"] == "fixed"
+    assert data["mod"]["Param"]["Options"] is None
+    assert data["mod"]["Param"]["Value"] == "11"
+
+
+def test_invalid_variants_are_reported(sample, tmp_path):
+    with open(sample) as f:
+        data = json.load(f)
+    data["mod"]["Param"]["Default"] = 5
+    bad = tmp_path / "bad.json"
+    bad.write_text(json.dumps(data))
+    out_dir = tmp_path / "out"
+
+    report = matrix.generate_matrix(str(bad), str(out_dir), subset={"mod": None}, jobs=1)
+
+    assert report["written"] == 0
+    assert [r["file"] for r in report["invalid"]] == [
+        "bad__mod-5.json", "bad__mod-11.json"
+    ]
+    assert not list(out_dir.glob("*.json"))
+
+
+def test_load_validator_prefers_compiled():
+    assert isinstance(matrix.load_validator(), matrix.compiled.CompiledValidator)
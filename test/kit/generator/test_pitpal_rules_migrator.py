@@ -0,0 +1,130 @@
+import json
+import pytest
+
+import kit.generator.pitpal_rules_migrator as migrator
+
+
+def _noop(data):
+    return data
+
+
+def _drop_algorithm(data):
+    data.pop("algorithm", None)
+    return data
+
+
+def _broken_step(data):
+    return data["no_such_key"]
+
+
+def _registry():
+    registry = migrator.MigrationRegistry()
+    # legacy files stored the time limit under "timer"
+    registry.register("s00.00.001", "s00.00.002", _restore_timelimit)
+    return registry
+
+
+def _restore_timelimit(data):
+    data["timelimit"] = data.pop("timer")
+    return data
+
+
+@pytest.fixture
+def rules(tmp_path):
+    with open("engine/rules/json/pal.json") as f:
+        current = json.load(f)
+    legacy = json.loads(json.dumps(current))
+    legacy["vSchema"] = "s00.00.001"
+    legacy["timer"] = legacy.pop("timelimit")
+
+    (tmp_path / "sub").mkdir()
+    (tmp_path / "current.json").write_text(json.dumps(current, indent=2))
+    (tmp_path / "legacy.json").write_text(json.dumps(legacy, indent=2))
+    (tmp_path / "sub" / "legacy2.json").write_text(json.dumps(legacy, indent=2))
+    return tmp_path
+
+
+def test_plan_chains_steps():
+    registry = migrator.MigrationRegistry()
+    registry.register("a", "b", _noop)
+    registry.register("b", "c", _drop_algorithm)
+
+    assert [(s, t) for s, t, _ in registry.plan("a", "c")] == [("a", "b"), ("b", "c")]
+    assert registry.plan("c", "c") == []
+    with pytest.raises(migrator.MigrationError):
+        registry.plan("c", "a")
+
+
+def test_duplicate_step_rejected():
+    registry = migrator.MigrationRegistry()
+    registry.register("a", "b", _noop)
+
+    with pytest.raises(migrator.MigrationError):
+        registry.register("a", "c", _drop_algorithm)
+
+
+def test_migrate_sets_version():
+    registry = migrator.MigrationRegistry()
+    registry.register("a", "b", _drop_algorithm)
+
+    data = registry.migrate({"vSchema": "a", "algorithm": 1}, "b")
+
+    assert data == {"vSchema": "b"}
+
+
+def test_read_vschema_from_header(rules):
+    assert migrator.read_vschema(str(rules / "legacy.json")) == "s00.00.001"
+    assert migrator.schema_version() == "s00.00.002"
+
+
+@pytest.mark.parametrize("jobs", [1, 2])
+def test_migrate_all(rules, jobs):
+    report = migrator.migrate_all(str(rules), jobs=jobs, registry=_registry())
+
+    assert report["migrated"] == 2
+    assert report["current"] == 1
+    assert report["failed"] == []
+    for name in ("legacy.json", "sub/legacy2.json"):
+        data = json.loads((rules / name).read_text())
+        assert data["vSchema"] == "s00.00.002"
+        assert "timelimit" in data and "timer" not in data
+    assert not list(rules.rglob("*.tmp"))
+
+
+def test_dry_run_leaves_files(rules):
+    before = (rules / "legacy.json").read_text()
+
+    report = migrator.migrate_all(str(rules), jobs=1, dry_run=True,
+                                  registry=_registry())
+
+    assert report["migrated"] == 2
+    assert (rules / "legacy.json").read_text() == before
+
+
+def test_invalid_or_unplanned_files_not_written(rules):
+    registry = migrator.MigrationRegistry()
+    registry.register("s00.00.001", "s00.00.002", _drop_algorithm)
+    before = (rules / "legacy.json").read_text()
+
+    report = migrator.migrate_all(str(rules), jobs=1, registry=registry)
+
+    assert report["migrated"] == 0
+    assert {r["status"] for r in report["failed"]} == {"invalid"}
+    assert (rules / "legacy.json").read_text() == before
+
+    report = migrator.migrate_all(str(rules), jobs=1,
+                                  registry=migrator.MigrationRegistry())
+    assert {r["status"] for r in report["failed"]} == {"error"}
+
+
+@pytest.mark.parametrize("jobs", [1, 2])
+def test_broken_step_fails_only_its_files(rules, jobs):
+    registry = migrator.MigrationRegistry()
+    registry.register("s00.00.001", "s00.00.002", _broken_step)
+
+    report = migrator.migrate_all(str(rules), jobs=jobs, registry=registry)
+
+    assert report["current"] == 1
+    assert len(report["failed"]) == 2
+    assert {r["status"] for r in report["failed"]} == {"error"}
+    assert report["failed"][0]["errors"][0].startswith("KeyError")
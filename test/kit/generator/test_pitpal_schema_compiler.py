@@ -0,0 +1,130 @@
+import copy
+import json
+import pytest
+
+import utils.jsonUtils.pitpal_compiled_schema as compiled
+import utils.jsonUtils.pitpal_json_schema_utils as Jsu
+from kit.generator.pitpal_schema_compiler import SchemaCompiler, compile_schemas
+
+SCHEMA_DIR = "engine/rules/schema"
+RULES_SCHEMA = "engine/rules/schema/pal.rules.schema.json"
+GENERATED = "utils/jsonUtils/pitpal_compiled_schema.py"
+
+CANDIDATES = [None, True, False, 0, 1, 1.0, 1.5, -1, "", "x", "7",
+              "flexi", "fixed", "integer", "enum", "classic", "beyond",
+              "s00.00.002", [], ["5", "11"], [1, 2], [-1], {}, {"Param": {}}]
+
+
+def load(name):
+    with open(f"engine/rules/json/{name}") as f:
+        return json.load(f)
+
+
+def paths(node, prefix=()):
+    yield prefix
+    if isinstance(node, dict):
+        for key, value in node.items():
+            yield from paths(value, prefix + (key,))
+    elif isinstance(node, list):
+        for i, value in enumerate(node):
+            yield from paths(value, prefix + (i,))
+
+
+def replaced(doc, path, value):
+    doc = copy.deepcopy(doc)
+    node = doc
+    for key in path[:-1]:
+        node = node[key]
+    node[path[-1]] = value
+    return doc
+
+
+def removed(doc, path):
+    doc = copy.deepcopy(doc)
+    node = doc
+    for key in path[:-1]:
+        node = node[key]
+    del node[path[-1]]
+    return doc
+
+
+def mutations():
+    base = load("pal.json")
+    base["board"]["specialPits"] = [0, 3]
+    yield base
+    yield load("pal2020.json")
+
+    for path in paths(base):
+        if not path:
+            continue
+        for value in CANDIDATES:
+            yield replaced(base, path, value)
+        if isinstance(path[-1], str):
+            yield removed(base, path)
+        node = base
+        for key in path:
+            node = node[key]
+        if isinstance(node, dict):
+            yield replaced(base, path, dict(node, zz=1))
+
+    # flexi parameters need Options
+    flexi = replaced(base, ("mod", "Param", "Config"), "flexi")
+    yield flexi
+    yield replaced(flexi, ("mod", "Param", "Options"), ["5", "11"])
+    yield replaced(flexi, ("mod", "Param", "Options"), [5])
+
+
+@pytest.fixture(scope="module")
+def reference():
+    return Jsu.get_schema_set(RULES_SCHEMA)
+
+
+def test_generated_module_is_current():
+    assert compile_schemas(SCHEMA_DIR, RULES_SCHEMA) == open(GENERATED).read()
+
+
+def test_agrees_with_jsonschema_on_rule_files(reference):
+    validator = reference.validator(RULES_SCHEMA)
+    count = 0
+
+    for doc in mutations():
+        expected = validator.is_valid(doc)
+        assert compiled.is_valid(doc) == expected, json.dumps(doc)
+        count += 1
+
+    assert count > 500
+
+
+@pytest.mark.parametrize("schema_id", [
+    key for key in compiled.VALIDATORS if "#" in key
+])
+def test_agrees_with_jsonschema_on_defs(reference, schema_id):
+    resolved = reference.registry.resolver().lookup(schema_id)
+    jsonschema_validator = Jsu.Draft202012Validator(
+        resolved.contents, registry=reference.registry
+    )
+    samples = list(CANDIDATES)
+    rules = load("pal.json")
+    samples += [rules["board"], rules["algorithm"], rules["capture"],
+                rules["direction"], rules["mod"], rules["mod"]["Param"]]
+
+    for sample in samples:
+        assert compiled.is_valid(sample, schema_id) == jsonschema_validator.is_valid(sample)
+
+
+def test_errors_are_reported():
+    doc = replaced(load("pal.json"), ("capture", "SubType"), "nowhere")
+
+    errors = list(compiled.validator_for().iter_errors(doc))
+
+    assert errors
+    assert errors[0].path == "$.capture.SubType"
+    with pytest.raises(compiled.CompiledValidationError):
+        compiled.validate(doc)
+
+
+def test_unsupported_keyword(tmp_path):
+    (tmp_path / "a.json").write_text(json.dumps({"$id": "a.json", "pattern": "^x"}))
+
+    with pytest.raises(NotImplementedError):
+        SchemaCompiler(str(tmp_path)).generate("a.json")
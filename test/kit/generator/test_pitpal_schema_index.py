@@ -0,0 +1,63 @@
+import pytest
+
+from kit.generator.pitpal_rules_creator_cli import SchemaTypeResolver
+from kit.generator.pitpal_schema_service import JsonSchemaService
+from kit.generator.pitpal_schema_index import path_pattern
+
+RULES_SCHEMA = "engine/rules/schema/pal.rules.schema.json"
+
+
+@pytest.fixture(params=["cli", "service"])
+def resolver(request):
+    if request.param == "cli":
+        return SchemaTypeResolver(RULES_SCHEMA)
+    return JsonSchemaService(RULES_SCHEMA)
+
+
+def test_path_pattern():
+    assert path_pattern("board.specialPits[3]") == "board.specialPits[]"
+
+
+@pytest.mark.parametrize("path, expected", [
+    ("vRule", str),
+    ("board.specialPits", list),
+    ("board.specialPits[0]", int),
+    ("capture.SubType", str),
+    ("capture.Param.Value", str),
+    ("direction.Param.Enabled", bool),
+    # reached through allOf + two $ref hops
+    ("board.nSeeds.Param.Value", str),
+])
+def test_get_type_fully_resolved(resolver, path, expected):
+    assert resolver.get_type(path) == expected
+
+
+def test_get_type_union(resolver):
+    assert set(resolver.get_type("mod.Param.Options")) == {list, type(None)}
+    assert resolver.get_type("mod.Param.Options[2]") == str
+
+
+def test_get_constraints(resolver):
+    assert resolver.get_constraints("capture.SubType")["enum"] == [
+        "beyond", "opposite", "adjacent"
+    ]
+    assert resolver.get_constraints("board.specialPits[1]")["minimum"] == 0
+
+
+def test_unknown_path(resolver):
+    with pytest.raises(KeyError):
+        resolver.get_type("board.unknown")
+
+
+def test_index_on_non_array(resolver):
+    with pytest.raises(TypeError):
+        resolver.get_type("vRule[0]")
+
+
+def test_index_built_once(resolver):
+    resolver.get_type("vRule")
+    index = resolver._index
+
+    resolver.get_type("board.nSeeds.Param.Config")
+
+    assert resolver._index is index
@@ -0,0 +1,64 @@
+import json
+import pytest
+from jsonschema.exceptions import ValidationError
+
+from kit.generator.pitpal_schema_service import JsonSchemaService
+from utils.jsonUtils.pitpal_validation_cache import ValidationCache
+
+RULES_SCHEMA = "engine/rules/schema/pal.rules.schema.json"
+
+
+def load_rules():
+    with open("engine/rules/json/pal.json") as f:
+        return json.load(f)
+
+
+def test_validate_rule_file():
+    JsonSchemaService(RULES_SCHEMA).validate(load_rules())
+
+
+def test_validate_nested_error():
+    data = load_rules()
+    data["board"]["nSeeds"]["Param"]["Config"] = "flexi"
+
+    with pytest.raises(ValidationError):
+        JsonSchemaService(RULES_SCHEMA).validate(data)
+
+
+def test_get_type():
+    service = JsonSchemaService(RULES_SCHEMA)
+
+    assert service.get_type("vRule") == str
+    assert service.get_type("board.specialPits") == list
+
+
+def test_cached_verdict_skips_validator(tmp_path):
+    data = load_rules()
+    JsonSchemaService(RULES_SCHEMA, cache=ValidationCache(str(tmp_path))).validate(data)
+
+    service = JsonSchemaService(RULES_SCHEMA, cache=ValidationCache(str(tmp_path)))
+    service.validator = None   # a cache miss would fail here
+    service.validate(data)
+
+
+def test_cached_failure_raises_same_error(tmp_path):
+    data = load_rules()
+    data["vSchema"] = "s99"
+
+    with pytest.raises(ValidationError) as uncached:
+        JsonSchemaService(RULES_SCHEMA).validate(data)
+    for _ in range(2):
+        service = JsonSchemaService(RULES_SCHEMA, cache=ValidationCache(str(tmp_path)))
+        with pytest.raises(ValidationError) as cached:
+            service.validate(data)
+
+        assert list(cached.value.path) == list(uncached.value.path) == ["vSchema"]
+        assert cached.value.validator == uncached.value.validator == "const"
+
+
+def test_unwritable_cache_dir(tmp_path):
+    blocker = tmp_path / "cache"
+    blocker.write_text("")   # a file where the cache dir should be
+    service = JsonSchemaService(RULES_SCHEMA, cache=ValidationCache(str(blocker)))
+
+    service.validate(load_rules())
@@ -0,0 +1,79 @@
+import json
+import os
+import shutil
+import pytest
+
+import utils.jsonUtils.pitpal_json_schema_utils as Jsu
+
+RULES_SCHEMA = "engine/rules/schema/pal.rules.schema.json"
+
+
+def setup_function():
+    Jsu.invalidate_schema_cache()
+
+
+def load_rules():
+    with open("engine/rules/json/pal.json") as f:
+        return json.load(f)
+
+
+def test_validate_rule_file():
+    jsu = Jsu.JSU(schema_file=RULES_SCHEMA, json_data=load_rules())
+
+    assert jsu.validate() is True
+    assert jsu.errors() == []
+
+
+def test_validate_nested_ref_error():
+    data = load_rules()
+    data["board"]["nSeeds"]["Param"]["Config"] = "flexi"
+
+    jsu = Jsu.JSU(schema_file=RULES_SCHEMA, json_data=data)
+
+    assert jsu.validate() is False
+    assert jsu.errors()
+
+
+def test_validator_shared_between_instances():
+    first = Jsu.JSU(schema_file=RULES_SCHEMA, json_data={})
+    second = Jsu.JSU(schema_file=RULES_SCHEMA, json_data={})
+
+    assert first.validator is second.validator
+
+
+def test_schema_files_read_once(monkeypatch):
+    Jsu.JSU(schema_file=RULES_SCHEMA, json_data={})
+
+    def fail(*args, **kwargs):
+        raise AssertionError("schema reloaded")
+
+    monkeypatch.setattr(Jsu.json, "load", fail)
+
+    Jsu.JSU(schema_file=RULES_SCHEMA, json_data={})
+
+
+def test_invalidate_rebuilds():
+    first = Jsu.JSU(schema_file=RULES_SCHEMA, json_data={})
+    Jsu.invalidate_schema_cache("engine/rules/schema")
+    second = Jsu.JSU(schema_file=RULES_SCHEMA, json_data={})
+
+    assert first.validator is not second.validator
+
+
+def test_changed_file_rebuilds(tmp_path):
+    schema_dir = tmp_path / "schema"
+    shutil.copytree("engine/rules/schema", schema_dir)
+    root = str(schema_dir / "pal.rules.schema.json")
+
+    first = Jsu.JSU(schema_file=root, json_data={})
+
+    st = os.stat(root)
+    os.utime(root, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+    second = Jsu.JSU(schema_file=root, json_data={})
+
+    assert first.validator is not second.validator
+
+
+def test_missing_root_schema():
+    with pytest.raises(FileNotFoundError):
+        Jsu.JSU(schema_file="engine/rules/schema/missing.json", json_data={})
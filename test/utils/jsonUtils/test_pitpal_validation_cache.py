@@ -0,0 +1,91 @@
+import json
+
+import utils.jsonUtils.pitpal_json_schema_utils as Jsu
+from utils.jsonUtils.pitpal_validation_cache import (
+    ValidationCache,
+    default_cache,
+    document_hash,
+)
+
+RULES_SCHEMA = "engine/rules/schema/pal.rules.schema.json"
+
+
+def load_rules():
+    with open("engine/rules/json/pal.json") as f:
+        return json.load(f)
+
+
+def test_document_hash_ignores_key_order():
+    assert document_hash({"a": 1, "b": [1, 2]}) == document_hash({"b": [1, 2], "a": 1})
+    assert document_hash({"a": 1}) != document_hash({"a": 2})
+
+
+def test_store_and_lookup_persist(tmp_path):
+    cache = ValidationCache(str(tmp_path))
+    assert cache.lookup("s", "d") is None
+
+    cache.store("s", "d", False, ["bad value"])
+
+    reopened = ValidationCache(str(tmp_path))
+    assert reopened.lookup("s", "d") == (False, ["bad value"])
+
+
+def test_store_appends_one_record(tmp_path):
+    cache = ValidationCache(str(tmp_path))
+    cache.store("s", "a", True, [])
+    size = cache.path.stat().st_size
+
+    cache.store("s", "b", True, [])
+
+    assert len(cache.path.read_text().splitlines()) == 2
+    assert cache.path.stat().st_size < 2 * size + 2
+
+
+def test_lookup_sees_other_writers(tmp_path):
+    reader = ValidationCache(str(tmp_path))
+    assert reader.lookup("s", "d") is None
+
+    ValidationCache(str(tmp_path)).store("s", "d", True, [])
+
+    assert reader.lookup("s", "d") == (True, [])
+
+
+def test_max_entries_drops_oldest(tmp_path):
+    cache = ValidationCache(str(tmp_path), max_entries=2)
+
+    for i in range(3):
+        cache.store("s", str(i), True, [])
+
+    assert cache.lookup("s", "0") is None
+    assert cache.lookup("s", "2") == (True, [])
+
+
+def test_default_cache_from_env(tmp_path, monkeypatch):
+    monkeypatch.delenv("PITPAL_CACHE_DIR", raising=False)
+    assert default_cache() is None
+
+    monkeypatch.setenv("PITPAL_CACHE_DIR", str(tmp_path))
+    assert isinstance(default_cache(), ValidationCache)
+
+
+def test_jsu_uses_cache(tmp_path):
+    cache = ValidationCache(str(tmp_path))
+    data = load_rules()
+
+    assert Jsu.JSU(RULES_SCHEMA, data, cache=cache).validate() is True
+
+    jsu = Jsu.JSU(RULES_SCHEMA, data, cache=ValidationCache(str(tmp_path)))
+    jsu.validator = None   # a cache miss would fail here
+    assert jsu.validate() is True
+    assert jsu.errors() == []
+
+
+def test_unwritable_cache_dir_is_a_miss(tmp_path):
+    blocker = tmp_path / "cache"
+    blocker.write_text("")
+    data = load_rules()
+
+    jsu = Jsu.JSU(RULES_SCHEMA, data, cache=ValidationCache(str(blocker)))
+
+    assert jsu.validate() is True
+    assert jsu.errors() == []
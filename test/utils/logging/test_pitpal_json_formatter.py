@@ -0,0 +1,56 @@
+import json
+import logging
+
+from utils.logging.pitpal_json_formatter import PitPalJsonFormatter, DEFAULT_FIELDS
+
+PATTERN = "%(asctime)s | %(levelname)s | %(name)s | %(message)s"
+
+
+def _record(msg="move %s", args=("a3",), **extra):
+    record = logging.LogRecord("pitpal", logging.INFO, __file__, 1, msg, args, None)
+    record.__dict__.update(extra)
+    return record
+
+
+def test_fields_follow_pattern():
+    out = json.loads(PitPalJsonFormatter(PATTERN).format(_record()))
+
+    assert list(out) == ["asctime", "levelname", "name", "message"]
+    assert out["message"] == "move a3"
+    assert out["levelname"] == "INFO"
+
+
+def test_extra_context_included():
+    out = json.loads(PitPalJsonFormatter(PATTERN).format(_record(game="g-1", ply=3)))
+
+    assert out["game"] == "g-1"
+    assert out["ply"] == 3
+
+
+def test_one_line_and_unserializable_values():
+    line = PitPalJsonFormatter("%(message)s").format(_record("a\nb", (), obj=object()))
+
+    assert "\n" not in line
+    assert json.loads(line)["obj"].startswith("<object")
+
+
+def test_exception_text():
+    try:
+        raise ValueError("boom")
+    except ValueError:
+        import sys
+        record = logging.LogRecord("pitpal", logging.ERROR, __file__, 1, "failed", (), sys.exc_info())
+
+    out = json.loads(PitPalJsonFormatter(PATTERN).format(record))
+
+    assert "ValueError: boom" in out["exc_info"]
+
+
+def test_time_matches_standard_formatter():
+    record = _record()
+
+    assert PitPalJsonFormatter(PATTERN).formatTime(record) == logging.Formatter().formatTime(record)
+
+
+def test_default_fields_without_pattern():
+    assert PitPalJsonFormatter().fields == DEFAULT_FIELDS
@@ -142,3 +142,117 @@ def test_time_log_rotation(logging_config, tmp_path):
     log_files = list(tmp_path.glob("time_rotation.log*"))
 
     assert len(log_files) > 1
+
+
+def test_reconfigure_replaces_handlers(logging_config):
+    from dataclasses import replace
+
+    log_cfg = logging_config.logging
+    text_config = replace(logging_config, logging=replace(
+        log_cfg, format=replace(log_cfg.format, style="text")))
+    PitPalLogger.initialize(text_config)
+    logger = PitPalLogger.get_logger()
+
+    quiet = replace(text_config, logging=replace(
+        text_config.logging, level="ERROR",
+        console=replace(log_cfg.console, enabled=False)))
+    PitPalLogger.reconfigure(quiet)
+
+    assert PitPalLogger.get_logger() is logger
+    assert logger.level == logging.ERROR
+    assert len(logger.handlers) == 1
+
+
+def _queued(config, size=100, policy="drop"):
+    from dataclasses import replace
+    from config.interface.logging_config_database import QueueLoggingConfig
+
+    log_cfg = config.logging
+    return replace(config, logging=replace(
+        log_cfg,
+        console=replace(log_cfg.console, enabled=False),
+        format=replace(log_cfg.format, style="text"),
+        queue=QueueLoggingConfig(enabled=True, size=size, policy=policy)))
+
+
+def test_queue_mode_hands_io_to_listener(logging_config):
+    from logging.handlers import QueueHandler
+
+    PitPalLogger.initialize(_queued(logging_config))
+    logger = PitPalLogger.get_logger()
+
+    assert len(logger.handlers) == 1
+    assert isinstance(logger.handlers[0], QueueHandler)
+
+    logger.info("queued message")
+    PitPalLogger.shutdown()
+
+    with open(logging_config.logging.file.path) as f:
+        assert "queued message" in f.read()
+
+
+def test_queue_block_policy_keeps_every_record(logging_config):
+    PitPalLogger.initialize(_queued(logging_config, size=1, policy="block"))
+    logger = PitPalLogger.get_logger()
+
+    for i in range(200):
+        logger.info("record %d", i)
+    PitPalLogger.shutdown()
+
+    with open(logging_config.logging.file.path) as f:
+        text = f.read()
+    assert "record 0\n" in text and "record 199\n" in text
+    assert PitPalLogger.dropped() == 0
+
+
+def test_queue_drop_policy_counts_drops():
+    import queue
+    from utils.logging.pitpal_logger import _BoundedQueueHandler
+
+    handler = _BoundedQueueHandler(queue.Queue(maxsize=1), "drop")
+    for i in range(3):
+        handler.emit(logging.makeLogRecord({"msg": f"m{i}"}))
+
+    assert handler.dropped == 2
+    assert handler.queue.get_nowait().msg == "m0"
+
+
+def test_queue_invalid_policy():
+    import queue
+    from utils.logging.pitpal_logger import _BoundedQueueHandler
+
+    with pytest.raises(ValueError):
+        _BoundedQueueHandler(queue.Queue(), "wait")
+
+
+def test_json_style_writes_json_lines(logging_config):
+    import json
+    from dataclasses import replace
+
+    log_cfg = logging_config.logging
+    PitPalLogger.initialize(replace(logging_config, logging=replace(
+        log_cfg, format=replace(log_cfg.format, style="json"))))
+
+    PitPalLogger.get_logger().info("json message", extra={"game": "g-7"})
+    PitPalLogger.reset()
+
+    with open(log_cfg.file.path) as f:
+        lines = [json.loads(line) for line in f]
+    assert lines[-1]["message"] == "json message"
+    assert lines[-1]["game"] == "g-7"
+
+
+def test_remote_handler_attached(logging_config, tmp_path):
+    from dataclasses import replace
+    from utils.logging.pitpal_remote_handler import BatchingRemoteHandler
+
+    log_cfg = logging_config.logging
+    PitPalLogger.initialize(replace(logging_config, logging=replace(
+        log_cfg,
+        format=replace(log_cfg.format, style="text"),
+        remote=replace(log_cfg.remote, enabled=True, type="socket",
+                       url="tcp://127.0.0.1:9", spill=str(tmp_path / "spill")))))
+
+    handlers = PitPalLogger.get_logger().handlers
+    assert any(isinstance(h, BatchingRemoteHandler) for h in handlers)
+    PitPalLogger.reset()
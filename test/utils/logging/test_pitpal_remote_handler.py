@@ -0,0 +1,234 @@
+import json
+import logging
+import socket
+import socketserver
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from config.builder.base_builder import ConfigBuilder
+from config.interface.logging_config_database import PitpalLoggingConfig
+from utils.logging.pitpal_remote_handler import (
+    BatchingRemoteHandler,
+    HttpTransport,
+    SocketTransport,
+    SyslogTransport,
+    make_remote_handler,
+)
+
+
+def _record(i, level=logging.INFO):
+    return logging.makeLogRecord({"msg": f"record {i}", "levelno": level,
+                                  "levelname": logging.getLevelName(level)})
+
+
+@pytest.fixture
+def http_server():
+    requests = []
+    connections = set()
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def do_POST(self):
+            length = int(self.headers["Content-Length"])
+            requests.append(self.rfile.read(length).decode())
+            connections.add(self.client_address)
+            self.send_response(200)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server, requests, connections
+    server.shutdown()
+    server.server_close()
+
+
+class FlakyTransport:
+
+    def __init__(self):
+        self.up = False
+        self.sent = []
+
+    def send(self, batch):
+        if not self.up:
+            raise OSError("down")
+        self.sent.extend(line for _, line in batch)
+
+    def close(self):
+        pass
+
+
+class SlowTransport(FlakyTransport):
+
+    def send(self, batch):
+        time.sleep(0.5)
+
+
+def test_http_batches_over_one_connection(http_server):
+    server, requests, connections = http_server
+    url = f"http://127.0.0.1:{server.server_address[1]}/log"
+    handler = BatchingRemoteHandler(HttpTransport(url, 2), batch_size=10, flush_interval=10)
+
+    for i in range(25):
+        handler.handle(_record(i))
+    handler.flush(timeout=5)
+    handler.close()
+
+    lines = [line for body in requests for line in body.splitlines()]
+    assert lines == [f"record {i}" for i in range(25)]
+    assert len(requests) == 3
+    assert len(connections) == 1
+
+
+def test_socket_transport_ships_on_close():
+    received = []
+
+    class Handler(socketserver.StreamRequestHandler):
+        def handle(self):
+            for line in self.rfile:
+                received.append(line.decode().rstrip("\n"))
+
+    server = socketserver.ThreadingTCPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    try:
+        url = f"tcp://127.0.0.1:{server.server_address[1]}"
+        handler = BatchingRemoteHandler(SocketTransport(url, 2), flush_interval=10)
+        for i in range(5):
+            handler.handle(_record(i))
+        handler.close()
+
+        deadline = time.monotonic() + 5
+        while len(received) < 5 and time.monotonic() < deadline:
+            time.sleep(0.01)
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    assert received == [f"record {i}" for i in range(5)]
+
+
+def test_syslog_priority():
+    sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    sock.bind(("127.0.0.1", 0))
+    sock.settimeout(5)
+    try:
+        transport = SyslogTransport(f"127.0.0.1:{sock.getsockname()[1]}", 2)
+        handler = BatchingRemoteHandler(transport, flush_interval=10)
+        handler.handle(_record(1, logging.ERROR))
+        handler.close()
+
+        assert sock.recv(1024) == b"<11>record 1"
+    finally:
+        sock.close()
+
+
+def test_failed_batches_spill_and_replay(tmp_path):
+    spill = tmp_path / "remote.spill"
+    transport = FlakyTransport()
+    handler = BatchingRemoteHandler(transport, batch_size=2, flush_interval=10,
+                                    retries=1, backoff=0.001, spill_path=str(spill))
+
+    for i in range(3):
+        handler.handle(_record(i))
+    handler.flush(timeout=5)
+
+    assert transport.sent == []
+    assert [json.loads(line)[1] for line in spill.read_text().splitlines()] == \
+        ["record 0", "record 1", "record 2"]
+
+    transport.up = True
+    handler.handle(_record(3))
+    handler.flush(timeout=5)
+    handler.close()
+
+    assert sorted(transport.sent) == [f"record {i}" for i in range(4)]
+    assert not spill.exists()
+
+
+def test_emit_never_blocks():
+    handler = BatchingRemoteHandler(SlowTransport(), batch_size=1, capacity=2,
+                                    flush_interval=0.01, retries=0)
+
+    start = time.monotonic()
+    for i in range(200):
+        handler.handle(_record(i))
+    elapsed = time.monotonic() - start
+
+    assert elapsed < 0.4
+    assert handler.dropped > 0
+    handler.close()
+
+
+def test_make_remote_handler_defaults_from_yaml(tmp_path, http_server):
+    server, requests, _ = http_server
+    url = f"http://127.0.0.1:{server.server_address[1]}/log"
+    with open("config/default/logconfig.yaml") as f:
+        text = f.read()
+    # a remote section with none of the batching keys
+    text = text[:text.index("    batch_size:")]
+    text = text.replace("http://localhost:9000/log", url)
+    yaml_file = tmp_path / "logconfig.yaml"
+    yaml_file.write_text(text)
+
+    config = ConfigBuilder({}, {}, str(yaml_file)).build(PitpalLoggingConfig)
+    assert config.logging.remote.batch_size is None
+
+    handler = make_remote_handler(config.logging.remote)
+    handler.setFormatter(logging.Formatter("%(message)s"))
+    try:
+        assert (handler.batch_size, handler.flush_interval, handler.retries) == (100, 1.0, 3)
+        assert handler.spill_path is None
+        handler.emit(_record(1))
+        handler.flush(timeout=5)
+        assert handler._thread.is_alive()
+        assert requests == ["record 1\n"]
+    finally:
+        handler.close()
+
+
+class DeadTransport(FlakyTransport):
+
+    def send(self, batch):
+        time.sleep(0.1)
+        raise OSError("unreachable")
+
+
+def test_close_with_dead_sink_spills_quickly(tmp_path):
+    spill = tmp_path / "remote.spill"
+    handler = BatchingRemoteHandler(DeadTransport(), batch_size=1, flush_interval=10,
+                                    retries=3, backoff=1, spill_path=str(spill))
+    for i in range(20):
+        handler.handle(_record(i))
+
+    start = time.monotonic()
+    handler.close()
+
+    assert time.monotonic() - start < 2
+    assert len(spill.read_text().splitlines()) == 20
+
+
+def test_close_does_not_wait_on_a_hung_send(tmp_path):
+    spill = tmp_path / "remote.spill"
+    transport = SlowTransport()
+    handler = BatchingRemoteHandler(transport, batch_size=1, flush_interval=0.01,
+                                    spill_path=str(spill), close_timeout=0.2)
+    handler.handle(_record(0))
+    time.sleep(0.05)   # the thread is now inside send()
+    for i in range(1, 4):
+        handler.handle(_record(i))
+
+    start = time.monotonic()
+    handler.flush()
+    handler.close()
+
+    assert time.monotonic() - start < 1
+    assert [json.loads(line)[1] for line in spill.read_text().splitlines()] == \
+        ["record 1", "record 2", "record 3"]
@@ -0,0 +1,96 @@
+import os
+import threading
+import time
+import pytest
+
+import utils.oops.singleton as so
+from utils.oops.singleton import Singleton
+
+
+class Counted(Singleton):
+    inits = 0
+
+    def __init__(self):
+        type(self).inits += 1
+        time.sleep(0.01)
+        self.lock = threading.Lock()
+        self.forked = False
+
+    def _after_fork(self):
+        self.lock = threading.Lock()
+        self.forked = True
+
+
+class Child(Counted):
+    inits = 0
+
+
+def setup_function():
+    so.reset(Counted)
+    so.reset(Child)
+    Counted.inits = 0
+    Child.inits = 0
+
+
+def test_concurrent_creation_initializes_once():
+    barrier = threading.Barrier(8)
+    seen = []
+
+    def create():
+        barrier.wait()
+        seen.append(Counted())
+
+    threads = [threading.Thread(target=create) for _ in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert Counted.inits == 1
+    assert all(s is seen[0] for s in seen)
+
+
+def test_subclass_gets_its_own_instance():
+    parent = Counted()
+
+    assert Child() is not parent
+    assert Child() is Child()
+    assert isinstance(Child(), Child)
+
+
+@pytest.mark.skipif(not hasattr(os, "fork"), reason="needs fork")
+def test_after_fork_hook_runs_in_child():
+    instance = Counted()
+    instance.lock.acquire()
+    try:
+        pid = os.fork()
+        if pid == 0:
+            ok = Counted().forked and Counted().lock.acquire(timeout=1)
+            os._exit(0 if ok else 1)
+    finally:
+        instance.lock.release()
+
+    _, status = os.waitpid(pid, 0)
+    assert os.waitstatus_to_exitcode(status) == 0
+    assert instance.forked is False
+
+
+@pytest.mark.skipif(not hasattr(os, "fork"), reason="needs fork")
+def test_warm_hooks_once_per_process(monkeypatch):
+    calls = []
+    monkeypatch.setattr(so, "_warm_hooks", [])
+    monkeypatch.setattr(so, "_warmed_pid", None)
+    so.register_warm_hook(lambda: calls.append(os.getpid()))
+
+    so.warm()
+    so.warm()
+    assert calls == [os.getpid()]
+
+    pid = os.fork()
+    if pid == 0:
+        so.warm()
+        so.warm()
+        os._exit(0 if len(calls) == 2 and calls[1] == os.getpid() else 1)
+
+    _, status = os.waitpid(pid, 0)
+    assert os.waitstatus_to_exitcode(status) == 0
@@ -0,0 +1,505 @@
+# Generated by kit/generator/pitpal_schema_compiler.py. Do not edit.
+# Source: engine/rules/schema
+
+SOURCE_HASH = '3fbf195b70356e8afff684f9ef9dc74c421056b7436284951eb0f2c4da70bad5'
+ROOT = 'engine/rules/schema/pal.rules.schema.json'
+
+
+class CompiledValidationError(ValueError):
+
+    def __init__(self, message, path):
+        super().__init__(f"{path}: {message}")
+        self.message = message
+        self.path = path
+
+
+def _is_integer(x):
+    if isinstance(x, bool):
+        return False
+    return isinstance(x, int) or (isinstance(x, float) and x.is_integer())
+
+
+def _is_number(x):
+    return isinstance(x, (int, float)) and not isinstance(x, bool)
+
+
+def _equal(a, b):
+    # JSON equality: booleans never equal numbers
+    if isinstance(a, bool) or isinstance(b, bool):
+        return isinstance(a, bool) and isinstance(b, bool) and a == b
+    if isinstance(a, list) and isinstance(b, list):
+        return len(a) == len(b) and all(_equal(i, j) for i, j in zip(a, b))
+    if isinstance(a, dict) and isinstance(b, dict):
+        return a.keys() == b.keys() and all(_equal(a[k], b[k]) for k in a)
+    if isinstance(a, (list, dict, str)) or isinstance(b, (list, dict, str)):
+        return type(a) is type(b) and a == b
+    return a == b
+
+
+_C0 = "is not of type 'object'"
+_C1 = "'Type' is a required property"
+_C2 = "'SubType' is a required property"
+_C3 = "'Param' is a required property"
+_C4 = "is not of type 'string'"
+_C5 = 'enum'
+_C6 = "is not of type 'string'"
+_C7 = frozenset(['classic', 'mount', 'silver', 'snake'])
+_C8 = ['classic', 'silver', 'snake', 'mount']
+_C9 = "is not of type 'object'"
+_C10 = "'Default' is a required property"
+_C11 = "'Config' is a required property"
+_C12 = "is not of type 'string'"
+_C13 = "is not of type 'string'"
+_C14 = "is not of type 'array', 'null'"
+_C15 = "is not of type 'string'"
+_C16 = "is not of type 'boolean'"
+_C17 = "is not of type 'string'"
+_C18 = frozenset(['auto', 'fixed', 'flexi', 'user'])
+_C19 = ['fixed', 'user', 'auto', 'flexi']
+_C20 = "is not of type 'string'"
+_C21 = "is not of type 'string'"
+_C22 = frozenset(['Config', 'Default', 'Enabled', 'Max', 'Min', 'Options', 'Value'])
+_C23 = 'flexi'
+_C24 = "'Options' is a required property"
+_C25 = "is not of type 'array'"
+_C26 = "is not of type 'null'"
+_C27 = frozenset(['Param', 'SubType', 'Type'])
+_C28 = "is not of type 'object'"
+_C29 = "'pitsPerSide' is a required property"
+_C30 = "'nSide' is a required property"
+_C31 = "'nSeeds' is a required property"
+_C32 = "is not of type 'object'"
+_C33 = "'Type' is a required property"
+_C34 = "'Param' is a required property"
+_C35 = "is not of type 'string'"
+_C36 = 'integer'
+_C37 = "is not of type 'array'"
+_C38 = "is not of type 'integer'"
+_C39 = 0
+_C40 = frozenset(['nSeeds', 'nSide', 'pitsPerSide', 'specialPits'])
+_C41 = "is not of type 'object'"
+_C42 = "'Param' is a required property"
+_C43 = "is not of type 'object'"
+_C44 = "'Type' is a required property"
+_C45 = "'SubType' is a required property"
+_C46 = "'Param' is a required property"
+_C47 = "is not of type 'string'"
+_C48 = 'enum'
+_C49 = "is not of type 'string'"
+_C50 = frozenset(['adjacent', 'beyond', 'opposite'])
+_C51 = ['beyond', 'opposite', 'adjacent']
+_C52 = frozenset(['Param', 'SubType', 'Type'])
+_C53 = "is not of type 'object'"
+_C54 = "'vSchema' is a required property"
+_C55 = "'vRule' is a required property"
+_C56 = "'board' is a required property"
+_C57 = "'algorithm' is a required property"
+_C58 = "'capture' is a required property"
+_C59 = "'nPlayers' is a required property"
+_C60 = "is not of type 'string'"
+_C61 = "is not of type 'string'"
+_C62 = 's00.00.002'
+_C63 = frozenset(['algorithm', 'board', 'capture', 'direction', 'mod', 'nPlayers', 'timelimit', 'vRule', 'vSchema'])
+
+
+def _v0(x, path, errors):
+    pass
+
+def _v1(x, path, errors):
+    if not (isinstance(x, dict)):
+        errors.append(CompiledValidationError(f"{x!r} {_C0}", path))
+    if isinstance(x, dict):
+        if 'Type' not in x:
+            errors.append(CompiledValidationError(_C1, path))
+        if 'SubType' not in x:
+            errors.append(CompiledValidationError(_C2, path))
+        if 'Param' not in x:
+            errors.append(CompiledValidationError(_C3, path))
+        if 'Type' in x:
+            _v2(x['Type'], path + '.Type', errors)
+        if 'SubType' in x:
+            _v3(x['SubType'], path + '.SubType', errors)
+        if 'Param' in x:
+            _v4(x['Param'], path + '.Param', errors)
+        for k in x:
+            if k not in _C27:
+                errors.append(CompiledValidationError(f"Additional properties are not allowed ({k!r} was unexpected)", path))
+
+def _v2(x, path, errors):
+    if not (isinstance(x, str)):
+        errors.append(CompiledValidationError(f"{x!r} {_C4}", path))
+    if not (isinstance(x, str) and x == _C5):
+        errors.append(CompiledValidationError(f"{_C5!r} was expected", path))
+
+def _v3(x, path, errors):
+    if not (isinstance(x, str)):
+        errors.append(CompiledValidationError(f"{x!r} {_C6}", path))
+    if not (isinstance(x, str) and x in _C7):
+        errors.append(CompiledValidationError(f"{x!r} is not one of {_C8!r}", path))
+
+def _v4(x, path, errors):
+    _v5(x, path, errors)
+
+def _v5(x, path, errors):
+    if not (isinstance(x, dict)):
+        errors.append(CompiledValidationError(f"{x!r} {_C9}", path))
+    if isinstance(x, dict):
+        if 'Default' not in x:
+            errors.append(CompiledValidationError(_C10, path))
+        if 'Config' not in x:
+            errors.append(CompiledValidationError(_C11, path))
+        if 'Default' in x:
+            _v6(x['Default'], path + '.Default', errors)
+        if 'Value' in x:
+            _v7(x['Value'], path + '.Value', errors)
+        if 'Options' in x:
+            _v8(x['Options'], path + '.Options', errors)
+        if 'Enabled' in x:
+            _v10(x['Enabled'], path + '.Enabled', errors)
+        if 'Config' in x:
+            _v11(x['Config'], path + '.Config', errors)
+        if 'Min' in x:
+            _v12(x['Min'], path + '.Min', errors)
+        if 'Max' in x:
+            _v13(x['Max'], path + '.Max', errors)
+        for k in x:
+            if k not in _C22:
+                errors.append(CompiledValidationError(f"Additional properties are not allowed ({k!r} was unexpected)", path))
+    _v14(x, path, errors)
+
+def _v6(x, path, errors):
+    if not (isinstance(x, str)):
+        errors.append(CompiledValidationError(f"{x!r} {_C12}", path))
+
+def _v7(x, path, errors):
+    if not (isinstance(x, str)):
+        errors.append(CompiledValidationError(f"{x!r} {_C13}", path))
+
+def _v8(x, path, errors):
+    if not (isinstance(x, list) or x is None):
+        errors.append(CompiledValidationError(f"{x!r} {_C14}", path))
+    if isinstance(x, list):
+        for i, v in enumerate(x):
+            _v9(v, f"{path}[{i}]", errors)
+
+def _v9(x, path, errors):
+    if not (isinstance(x, str)):
+        errors.append(CompiledValidationError(f"{x!r} {_C15}", path))
+
+def _v10(x, path, errors):
+    if not (isinstance(x, bool)):
+        errors.append(CompiledValidationError(f"{x!r} {_C16}", path))
+
+def _v11(x, path, errors):
+    if not (isinstance(x, str)):
+        errors.append(CompiledValidationError(f"{x!r} {_C17}", path))
+    if not (isinstance(x, str) and x in _C18):
+        errors.append(CompiledValidationError(f"{x!r} is not one of {_C19!r}", path))
+
+def _v12(x, path, errors):
+    if not (isinstance(x, str)):
+        errors.append(CompiledValidationError(f"{x!r} {_C20}", path))
+
+def _v13(x, path, errors):
+    if not (isinstance(x, str)):
+        errors.append(CompiledValidationError(f"{x!r} {_C21}", path))
+
+def _v14(x, path, errors):
+    _e = []
+    _v15(x, path, _e)
+    if not _e:
+        _v17(x, path, errors)
+    else:
+        _v19(x, path, errors)
+
+def _v15(x, path, errors):
+    if isinstance(x, dict):
+        if 'Config' in x:
+            _v16(x['Config'], path + '.Config', errors)
+
+def _v16(x, path, errors):
+    if not (isinstance(x, str) and x == _C23):
+        errors.append(CompiledValidationError(f"{_C23!r} was expected", path))
+
+def _v17(x, path, errors):
+    if isinstance(x, dict):
+        if 'Options' not in x:
+            errors.append(CompiledValidationError(_C24, path))
+        if 'Options' in x:
+            _v18(x['Options'], path + '.Options', errors)
+
+def _v18(x, path, errors):
+    if not (isinstance(x, list)):
+        errors.append(CompiledValidationError(f"{x!r} {_C25}", path))
+
+def _v19(x, path, errors):
+    if isinstance(x, dict):
+        if 'Options' in x:
+            _v20(x['Options'], path + '.Options', errors)
+
+def _v20(x, path, errors):
+    if not (x is None):
+        errors.append(CompiledValidationError(f"{x!r} {_C26}", path))
+
+def _v21(x, path, errors):
+    pass
+
+def _v22(x, path, errors):
+    if not (isinstance(x, dict)):
+        errors.append(CompiledValidationError(f"{x!r} {_C28}", path))
+    if isinstance(x, dict):
+        if 'pitsPerSide' not in x:
+            errors.append(CompiledValidationError(_C29, path))
+        if 'nSide' not in x:
+            errors.append(CompiledValidationError(_C30, path))
+        if 'nSeeds' not in x:
+            errors.append(CompiledValidationError(_C31, path))
+        if 'pitsPerSide' in x:
+            _v23(x['pitsPerSide'], path + '.pitsPerSide', errors)
+        if 'nSide' in x:
+            _v28(x['nSide'], path + '.nSide', errors)
+        if 'nSeeds' in x:
+            _v30(x['nSeeds'], path + '.nSeeds', errors)
+        if 'specialPits' in x:
+            _v32(x['specialPits'], path + '.specialPits', errors)
+        for k in x:
+            if k not in _C40:
+                errors.append(CompiledValidationError(f"Additional properties are not allowed ({k!r} was unexpected)", path))
+
+def _v23(x, path, errors):
+    _v24(x, path, errors)
+
+def _v24(x, path, errors):
+    _v25(x, path, errors)
+
+def _v25(x, path, errors):
+    if not (isinstance(x, dict)):
+        errors.append(CompiledValidationError(f"{x!r} {_C32}", path))
+    if isinstance(x, dict):
+        if 'Type' not in x:
+            errors.append(CompiledValidationError(_C33, path))
+        if 'Param' not in x:
+            errors.append(CompiledValidationError(_C34, path))
+        if 'Type' in x:
+            _v26(x['Type'], path + '.Type', errors)
+        if 'Param' in x:
+            _v27(x['Param'], path + '.Param', errors)
+
+def _v26(x, path, errors):
+    if not (isinstance(x, str)):
+        errors.append(CompiledValidationError(f"{x!r} {_C35}", path))
+    if not (isinstance(x, str) and x == _C36):
+        errors.append(CompiledValidationError(f"{_C36!r} was expected", path))
+
+def _v27(x, path, errors):
+    _v5(x, path, errors)
+
+def _v28(x, path, errors):
+    _v29(x, path, errors)
+
+def _v29(x, path, errors):
+    _v25(x, path, errors)
+
+def _v30(x, path, errors):
+    _v31(x, path, errors)
+
+def _v31(x, path, errors):
+    _v25(x, path, errors)
+
+def _v32(x, path, errors):
+    if not (isinstance(x, list)):
+        errors.append(CompiledValidationError(f"{x!r} {_C37}", path))
+    if isinstance(x, list):
+        for i, v in enumerate(x):
+            _v33(v, f"{path}[{i}]", errors)
+
+def _v33(x, path, errors):
+    if not (_is_integer(x)):
+        errors.append(CompiledValidationError(f"{x!r} {_C38}", path))
+    if _is_number(x) and x < _C39:
+        errors.append(CompiledValidationError(f"{x!r} is less than the minimum of {_C39!r}", path))
+
+def _v34(x, path, errors):
+    pass
+
+def _v35(x, path, errors):
+    if not (isinstance(x, dict)):
+        errors.append(CompiledValidationError(f"{x!r} {_C41}", path))
+    if isinstance(x, dict):
+        if 'Param' not in x:
+            errors.append(CompiledValidationError(_C42, path))
+        if 'Param' in x:
+            _v36(x['Param'], path + '.Param', errors)
+
+def _v36(x, path, errors):
+    _v5(x, path, errors)
+
+def _v37(x, path, errors):
+    pass
+
+def _v38(x, path, errors):
+    if not (isinstance(x, dict)):
+        errors.append(CompiledValidationError(f"{x!r} {_C43}", path))
+    if isinstance(x, dict):
+        if 'Type' not in x:
+            errors.append(CompiledValidationError(_C44, path))
+        if 'SubType' not in x:
+            errors.append(CompiledValidationError(_C45, path))
+        if 'Param' not in x:
+            errors.append(CompiledValidationError(_C46, path))
+        if 'Type' in x:
+            _v39(x['Type'], path + '.Type', errors)
+        if 'SubType' in x:
+            _v40(x['SubType'], path + '.SubType', errors)
+        if 'Param' in x:
+            _v41(x['Param'], path + '.Param', errors)
+        for k in x:
+            if k not in _C52:
+                errors.append(CompiledValidationError(f"Additional properties are not allowed ({k!r} was unexpected)", path))
+
+def _v39(x, path, errors):
+    if not (isinstance(x, str)):
+        errors.append(CompiledValidationError(f"{x!r} {_C47}", path))
+    if not (isinstance(x, str) and x == _C48):
+        errors.append(CompiledValidationError(f"{_C48!r} was expected", path))
+
+def _v40(x, path, errors):
+    if not (isinstance(x, str)):
+        errors.append(CompiledValidationError(f"{x!r} {_C49}", path))
+    if not (isinstance(x, str) and x in _C50):
+        errors.append(CompiledValidationError(f"{x!r} is not one of {_C51!r}", path))
+
+def _v41(x, path, errors):
+    _v5(x, path, errors)
+
+def _v42(x, path, errors):
+    pass
+
+def _v43(x, path, errors):
+    if not (isinstance(x, dict)):
+        errors.append(CompiledValidationError(f"{x!r} {_C53}", path))
+    if isinstance(x, dict):
+        if 'vSchema' not in x:
+            errors.append(CompiledValidationError(_C54, path))
+        if 'vRule' not in x:
+            errors.append(CompiledValidationError(_C55, path))
+        if 'board' not in x:
+            errors.append(CompiledValidationError(_C56, path))
+        if 'algorithm' not in x:
+            errors.append(CompiledValidationError(_C57, path))
+        if 'capture' not in x:
+            errors.append(CompiledValidationError(_C58, path))
+        if 'nPlayers' not in x:
+            errors.append(CompiledValidationError(_C59, path))
+        if 'vRule' in x:
+            _v44(x['vRule'], path + '.vRule', errors)
+        if 'vSchema' in x:
+            _v45(x['vSchema'], path + '.vSchema', errors)
+        if 'board' in x:
+            _v46(x['board'], path + '.board', errors)
+        if 'algorithm' in x:
+            _v47(x['algorithm'], path + '.algorithm', errors)
+        if 'capture' in x:
+            _v48(x['capture'], path + '.capture', errors)
+        if 'timelimit' in x:
+            _v49(x['timelimit'], path + '.timelimit', errors)
+        if 'nPlayers' in x:
+            _v50(x['nPlayers'], path + '.nPlayers', errors)
+        if 'direction' in x:
+            _v51(x['direction'], path + '.direction', errors)
+        if 'mod' in x:
+            _v52(x['mod'], path + '.mod', errors)
+        for k in x:
+            if k not in _C63:
+                errors.append(CompiledValidationError(f"Additional properties are not allowed ({k!r} was unexpected)", path))
+
+def _v44(x, path, errors):
+    if not (isinstance(x, str)):
+        errors.append(CompiledValidationError(f"{x!r} {_C60}", path))
+
+def _v45(x, path, errors):
+    if not (isinstance(x, str)):
+        errors.append(CompiledValidationError(f"{x!r} {_C61}", path))
+    if not (isinstance(x, str) and x == _C62):
+        errors.append(CompiledValidationError(f"{_C62!r} was expected", path))
+
+def _v46(x, path, errors):
+    _v22(x, path, errors)
+
+def _v47(x, path, errors):
+    _v1(x, path, errors)
+
+def _v48(x, path, errors):
+    _v38(x, path, errors)
+
+def _v49(x, path, errors):
+    _v25(x, path, errors)
+
+def _v50(x, path, errors):
+    _v25(x, path, errors)
+
+def _v51(x, path, errors):
+    _v35(x, path, errors)
+
+def _v52(x, path, errors):
+    _v25(x, path, errors)
+
+def _v53(x, path, errors):
+    pass
+
+
+VALIDATORS = {
+    'engine/rules/schema/algorithm.schema.json': _v0,
+    'engine/rules/schema/algorithm.schema.json#/$defs/Algorithm': _v1,
+    'engine/rules/schema/board.schema.json': _v21,
+    'engine/rules/schema/board.schema.json#/$defs/Board': _v22,
+    'engine/rules/schema/boolean.schema.json': _v34,
+    'engine/rules/schema/boolean.schema.json#/$defs/Bool': _v35,
+    'engine/rules/schema/capture.schema.json': _v37,
+    'engine/rules/schema/capture.schema.json#/$defs/Capture': _v38,
+    'engine/rules/schema/integer.schema.json': _v42,
+    'engine/rules/schema/integer.schema.json#/$defs/Integer': _v25,
+    'engine/rules/schema/pal.rules.schema.json': _v43,
+    'engine/rules/schema/parameter.schema.json': _v53,
+    'engine/rules/schema/parameter.schema.json#/$defs/Parameter': _v5,
+}
+
+
+class CompiledValidator:
+    """
+    Drop-in subset of Draft202012Validator: is_valid, iter_errors, validate.
+    """
+
+    def __init__(self, schema_id):
+        self.schema_id = schema_id
+        self._check = VALIDATORS[schema_id]
+
+    def iter_errors(self, instance):
+        errors = []
+        self._check(instance, "$", errors)
+        return iter(errors)
+
+    def is_valid(self, instance):
+        errors = []
+        self._check(instance, "$", errors)
+        return not errors
+
+    def validate(self, instance):
+        errors = []
+        self._check(instance, "$", errors)
+        if errors:
+            raise errors[0]
+
+
+def validator_for(schema_id=ROOT):
+    return CompiledValidator(schema_id)
+
+
+def is_valid(instance, schema_id=ROOT):
+    errors = []
+    VALIDATORS[schema_id](instance, "$", errors)
+    return not errors
+
+
+def validate(instance, schema_id=ROOT):
+    CompiledValidator(schema_id).validate(instance)
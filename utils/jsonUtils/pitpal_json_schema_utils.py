@@ -25,40 +25,154 @@ import os
 import sys
 import re
 import ast
+import hashlib
+import threading
 from copy import deepcopy
 from jsonschema import Draft202012Validator
 from referencing import Registry, Resource
+from referencing.exceptions import NoSuchResource
+import utils.jsonUtils.pitpal_validation_cache as vc
+
+
+def retrieve_by_id(resources):
+    """
+    Schema $id values are base-path relative ("engine/rules/schema/x.json"),
+    so a $ref inside one schema file is joined against that file's $id and
+    comes out doubled. Map such URIs back to the registered resource.
+    """
+    def retrieve(uri):
+        for schema_id, resource in resources.items():
+            if uri.endswith(schema_id):
+                return resource
+        raise NoSuchResource(ref=uri)
+    return retrieve
+
+
+class _SchemaSet:
+    """
+    Every schema file of one directory, loaded and registered once.
+    Validators are built lazily per root file and shared.
+    """
+
+    def __init__(self, directory, stamp):
+        self.directory = directory
+        self.stamp = stamp
+        self.schemas = {}
+        self.validators = {}
+
+        digest = hashlib.sha256()
+        resources = {}
+        for filename, _, _ in stamp:
+            digest.update(filename.encode())
+            filename = os.path.join(directory, filename)
+            with open(filename, "rb") as sf:
+                raw = sf.read()
+            digest.update(raw)
+            schema_data = json.loads(raw)
+            self.schemas[filename] = schema_data
+            schema_id = schema_data.get("$id", filename)
+            resources[schema_id] = Resource.from_contents(schema_data)
+
+        self.registry = Registry(retrieve=retrieve_by_id(resources)).with_resources(
+            resources.items()
+        )
+        self.hash = digest.hexdigest()
+
+    def schema_hash(self, schema_path):
+        """
+        Content hash of the whole set plus the root file, used as the
+        validation cache key.
+        """
+        return hashlib.sha256(
+            f"{self.hash}:{os.path.basename(schema_path)}".encode()
+        ).hexdigest()
+
+    def validator(self, schema_path):
+        validator = self.validators.get(schema_path)
+        if validator is None:
+            validator = Draft202012Validator(
+                self.schemas[schema_path], registry=self.registry
+            )
+            self.validators[schema_path] = validator
+        return validator
+
+
+# directory -> _SchemaSet, rebuilt when any file mtime/size changes
+_schema_cache = {}
+_schema_cache_lock = threading.Lock()
+
+
+def _directory_stamp(directory):
+    stamp = []
+    for entry in os.scandir(directory):
+        if entry.name.endswith(".json"):
+            st = entry.stat()
+            stamp.append((entry.name, st.st_mtime_ns, st.st_size))
+    return tuple(sorted(stamp))
+
+
+def get_schema_set(schema_path) -> _SchemaSet:
+    directory = os.path.dirname(schema_path)
+    stamp = _directory_stamp(directory)
+
+    with _schema_cache_lock:
+        schema_set = _schema_cache.get(directory)
+        if schema_set is None or schema_set.stamp != stamp:
+            schema_set = _SchemaSet(directory, stamp)
+            _schema_cache[directory] = schema_set
+        return schema_set
+
+
+def invalidate_schema_cache(directory=None):
+    """
+    Drop cached schema sets; all of them when directory is None.
+    """
+    with _schema_cache_lock:
+        if directory is None:
+            _schema_cache.clear()
+        else:
+            _schema_cache.pop(directory, None)
 
 
 #JSU   : - JSON Schema Utility
 class JSU:
-    def __init__(self , schema_file: str , json_data ):
+    def __init__(self , schema_file: str , json_data, cache=None):
         self.schemaFile = schema_file
         self.schema = {}
         self.jsonData = json_data
+        self.cache = cache if cache is not None else vc.default_cache()
         self._load_schema(schema_file)
 
     def _load_schema(self , schema_path):
-        directory, rootfilename = os.path.split(schema_path)
-        registry = Registry()
-        for filename in os.listdir(directory):
-            filename = os.path.join(directory, filename)
-            if filename.endswith(".json"):
-                schema_data=None
-                with open(filename) as sf:
-                    schema_data= json.load(sf)
-                self.schema[filename] = schema_data;
-                schema_id = schema_data.get("$id", filename)
-                registry = registry.with_resource(
-                    schema_id,
-                    Resource.from_contents(schema_data)
-                )
-                if filename == schema_path:
-                    self.schema["."] = self.schema[filename]
-        self.validator = Draft202012Validator(self.schema["."], registry=registry)
+        schema_set = get_schema_set(schema_path)
+        if schema_path not in schema_set.schemas:
+            raise FileNotFoundError(f"Schema not found: {schema_path}")
+        self.schema = dict(schema_set.schemas)
+        self.schema["."] = schema_set.schemas[schema_path]
+        self.validator = schema_set.validator(schema_path)
+        self.schemaHash = schema_set.schema_hash(schema_path)
+
+    def _verdict(self):
+        if self.cache is None:
+            errors = [error.message for error in self.validator.iter_errors(self.jsonData)]
+            return not errors, errors
+
+        doc_hash = vc.document_hash(self.jsonData)
+        hit = self.cache.lookup(self.schemaHash, doc_hash)
+        if hit is not None:
+            return hit
+
+        errors = [error.message for error in self.validator.iter_errors(self.jsonData)]
+        self.cache.store(self.schemaHash, doc_hash, not errors, errors)
+        return not errors, errors
 
     def validate(self):
-        return self.validator(self.jsonData)
+        if self.cache is None:
+            return self.validator.is_valid(self.jsonData)
+        return self._verdict()[0]
+
+    def errors(self):
+        return self._verdict()[1]
 
     def __str__(self):
         return str(self.jsonData)
@@ -0,0 +1,156 @@
+#!/usr/bin/env python3
+# Copyright (C) 2026 Pitpal
+#
+# This file is part of PitPal.
+#
+# PitPal is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License,
+# either version 3 of the License, or (at your option) any later version.
+#
+# PitPal is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+# See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with PitPal. If not, see <https://www.gnu.org/licenses/>.
+#    Author    :  Kalaiyarasan Es
+#    File name :  pitpal/utils/jsonUtils/pitpal_validation_cache.py
+#    Date      :  19/10/2026
+#######################################################################
+
+import hashlib
+import json
+import os
+import threading
+from pathlib import Path
+from typing import Optional
+
+CACHE_ENV = "PITPAL_CACHE_DIR"
+
+
+def document_hash(data) -> str:
+    """
+    sha256 of the canonical JSON form, so key order and whitespace in
+    the source file do not matter.
+    """
+    canonical = json.dumps(data, sort_keys=True, separators=(",", ":"),
+                           ensure_ascii=False)
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+class ValidationCache:
+    """
+    Persistent (schema-set hash, document hash) -> (valid, errors) index.
+
+    Stored as an append-only log of one JSON record per line under
+    <cache_dir>/validation/, so a store writes one line and several
+    processes can share a cache dir. Lookups read only what was appended
+    since the last read. Once the log holds more than max_entries, it is
+    rewritten with the newest half. The cache never raises OSError: an
+    unreadable or unwritable cache dir behaves like an empty cache.
+    """
+
+    def __init__(self, cache_dir: str, max_entries: int = 10000):
+        self.path = Path(cache_dir) / "validation" / "index.jsonl"
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._entries = {}
+        self._offset = 0
+        self._inode = None
+
+    def _refresh(self) -> None:
+        try:
+            with open(self.path, "rb") as f:
+                st = os.fstat(f.fileno())
+                if st.st_ino != self._inode or st.st_size < self._offset:
+                    # first read, or another process compacted the log
+                    self._entries = {}
+                    self._offset = 0
+                    self._inode = st.st_ino
+                f.seek(self._offset)
+                tail = f.read()
+        except OSError:
+            return
+
+        # a line still being appended has no newline yet
+        end = tail.rfind(b"\n") + 1
+        for line in tail[:end].splitlines():
+            try:
+                record = json.loads(line)
+                self._entries[record["key"]] = (record["valid"], record["errors"])
+            except (ValueError, KeyError, TypeError):
+                continue
+        self._offset += end
+
+    @staticmethod
+    def _key(schema_hash: str, doc_hash: str) -> str:
+        return f"{schema_hash}:{doc_hash}"
+
+    def lookup(self, schema_hash: str, doc_hash: str):
+        """
+        Return (valid, errors) or None on a miss.
+        """
+        key = self._key(schema_hash, doc_hash)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self._refresh()
+                entry = self._entries.get(key)
+        return entry
+
+    def store(self, schema_hash: str, doc_hash: str, valid: bool, errors: list) -> None:
+        key = self._key(schema_hash, doc_hash)
+        line = json.dumps({"key": key, "valid": valid, "errors": list(errors)}) + "\n"
+        with self._lock:
+            self._entries[key] = (valid, list(errors))
+            try:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                with open(self.path, "a", encoding="utf-8") as f:
+                    f.write(line)
+            except OSError:
+                return
+            if len(self._entries) > self.max_entries:
+                self._compact()
+
+    def _compact(self) -> None:
+        keep = list(self._entries.items())[-max(1, self.max_entries // 2):]
+        tmp = self.path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+        try:
+            with open(tmp, "w", encoding="utf-8") as f:
+                for key, (valid, errors) in keep:
+                    f.write(json.dumps({"key": key, "valid": valid, "errors": errors}) + "\n")
+            os.replace(tmp, self.path)
+            st = os.stat(self.path)
+        except OSError:
+            return
+        self._entries = dict(keep)
+        self._offset = st.st_size
+        self._inode = st.st_ino
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries = {}
+            self._offset = 0
+            self._inode = None
+            try:
+                self.path.unlink()
+            except OSError:
+                pass
+
+
+_default_caches = {}
+
+
+def default_cache() -> Optional[ValidationCache]:
+    """
+    Cache under $PITPAL_CACHE_DIR, or None when it is not set.
+    """
+    cache_dir = os.environ.get(CACHE_ENV)
+    if not cache_dir:
+        return None
+    cache = _default_caches.get(cache_dir)
+    if cache is None:
+        cache = _default_caches[cache_dir] = ValidationCache(cache_dir)
+    return cache
@@ -0,0 +1,111 @@
+import json
+import logging
+import re
+import time
+from operator import attrgetter
+
+# attributes every LogRecord has; anything else came in through extra=
+_RESERVED = frozenset(logging.makeLogRecord({}).__dict__) | {"message", "asctime"}
+
+_FIELD_RE = re.compile(r"%\((\w+)\)")
+
+DEFAULT_FIELDS = ("asctime", "levelname", "name", "message")
+
+
+class PitPalJsonFormatter(logging.Formatter):
+    """
+    One JSON object per line.
+
+    The keys are the record attributes named in the configured pattern
+    ("%(asctime)s | %(levelname)s ..." -> asctime, levelname, ...), in
+    that order, followed by any extra= context and exc_info/stack_info
+    when present. The pattern is parsed once into a list of getters.
+
+    Usage:
+        handler.setFormatter(PitPalJsonFormatter(log_cfg.format.pattern))
+    """
+
+    def __init__(self, pattern=None, datefmt=None):
+        super().__init__(datefmt=datefmt)
+        fields = tuple(dict.fromkeys(_FIELD_RE.findall(pattern or ""))) or DEFAULT_FIELDS
+        self.fields = fields
+
+        getters = []
+        for name in fields:
+            if name == "message":
+                getters.append((name, logging.LogRecord.getMessage))
+            elif name == "asctime":
+                getters.append((name, self.formatTime))
+            else:
+                getters.append((name, attrgetter(name)))
+        self._getters = tuple(getters)
+
+        self._encode = json.JSONEncoder(
+            ensure_ascii=False,
+            check_circular=False,
+            separators=(",", ":"),
+            default=str,
+        ).encode
+
+        # (second, strftime prefix): strftime once per second, not once per record
+        self._time_cache = (None, "")
+
+    def formatTime(self, record, datefmt=None):
+        if datefmt or self.datefmt:
+            return super().formatTime(record, datefmt or self.datefmt)
+        second = int(record.created)
+        cached_second, prefix = self._time_cache
+        if second != cached_second:
+            prefix = time.strftime(self.default_time_format, self.converter(record.created))
+            # one tuple, so a thread never sees a new second with an old prefix
+            self._time_cache = (second, prefix)
+        return self.default_msec_format % (prefix, record.msecs)
+
+    def format(self, record):
+        out = {name: get(record) for name, get in self._getters}
+
+        attrs = record.__dict__
+        extra = attrs.keys() - _RESERVED
+        if extra:
+            for key in sorted(extra):
+                out[key] = attrs[key]
+
+        if record.exc_info:
+            if not record.exc_text:
+                record.exc_text = self.formatException(record.exc_info)
+        if record.exc_text:
+            out["exc_info"] = record.exc_text
+        if record.stack_info:
+            out["stack_info"] = self.formatStack(record.stack_info)
+
+        return self._encode(out)
+
+
+def benchmark(n=100000):
+    """
+    Per-record cost of the JSON formatter against the plain-text one
+    with the same pattern.
+    """
+    import timeit
+
+    pattern = "%(asctime)s | %(levelname)s | %(name)s | %(message)s"
+    record = logging.LogRecord("pitpal", logging.INFO, __file__, 1,
+                               "move %s took %d ms", ("a3", 12), None)
+    record.game = "g-42"
+
+    text = logging.Formatter(pattern)
+    structured = PitPalJsonFormatter(pattern)
+
+    results = {}
+    for label, formatter in (("text", text), ("json", structured)):
+        seconds = min(timeit.repeat(lambda: formatter.format(record), number=n, repeat=3))
+        results[label] = seconds / n * 1e6
+    return results
+
+
+if __name__ == "__main__":
+    # python -m utils.logging.pitpal_json_formatter
+    results = benchmark()
+    for label, us in results.items():
+        print(f"{label:5s} {us:6.2f} us/record")
+    print(f"json/text {results['json'] / results['text']:.2f}x")
@@ -1,16 +1,62 @@
 
+import atexit
 import logging
-from logging.handlers import RotatingFileHandler, TimedRotatingFileHandler
+import os
+import queue
+from logging.handlers import (
+    QueueHandler,
+    QueueListener,
+    RotatingFileHandler,
+    TimedRotatingFileHandler,
+)
 from pathlib import Path
 from typing import Optional
 
 from config.interface.logging_config_database import PitpalLoggingConfig
+from utils.logging.pitpal_json_formatter import PitPalJsonFormatter
+from utils.logging.pitpal_remote_handler import make_remote_handler
+
+
+class _BoundedQueueHandler(QueueHandler):
+    """
+    QueueHandler for a bounded queue: "drop" discards records while the
+    queue is full (counted in dropped), "block" waits for room.
+    """
+
+    def __init__(self, log_queue, policy: str):
+        super().__init__(log_queue)
+        if policy not in ("drop", "block"):
+            raise ValueError(f"Invalid log queue policy: {policy}")
+        self.block = policy == "block"
+        self.dropped = 0
+
+    def enqueue(self, record):
+        if self.block:
+            self.queue.put(record)
+            return
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+
+class _DrainingQueueListener(QueueListener):
+
+    def enqueue_sentinel(self):
+        # wait for room, so stop() also works on a full queue; the
+        # listener drains everything queued before the sentinel
+        self.queue.put(self._sentinel)
 
 
 class PitPalLogger:
     """
     Singleton logger for PitPal.
 
+    With logging.queue.enabled the "pitpal" logger only carries a
+    QueueHandler; a QueueListener thread owns the console and file
+    handlers, so log calls never wait on I/O. The queue is flushed on
+    reset(), reconfigure() and interpreter exit.
+
     Usage:
         PitPalLogger.initialize(config)
         logger = PitPalLogger.get_logger()
@@ -18,6 +64,8 @@ class PitPalLogger:
 
     _initialized = False
     _logger: Optional[logging.Logger] = None
+    _listener: Optional[QueueListener] = None
+    _handlers: list = []
 
     @classmethod
     def initialize(cls, config: PitpalLoggingConfig) -> None:
@@ -40,15 +88,12 @@ class PitPalLogger:
         # formatter
         style=str(log_cfg.format.style)
         if style == "text":
-            style = "%"
+            formatter = logging.Formatter(log_cfg.format.pattern, style="%")
         elif style == "json":
-            style = "{"
+            # the pattern's %(field)s names become the JSON keys
+            formatter = PitPalJsonFormatter(log_cfg.format.pattern)
         else:
             raise ValueError(f"Invalid log formatter style: {style}")
-        formatter = logging.Formatter(
-            log_cfg.format.pattern,
-            style=style,
-        )
 
         # ----------------------
         # Console logging
@@ -87,11 +132,100 @@ class PitPalLogger:
             handler.setFormatter(formatter)
             logger.addHandler(handler)
 
+        # ----------------------
+        # Remote logging
+        # ----------------------
+        remote_cfg = log_cfg.remote
+        if remote_cfg is not None and remote_cfg.enabled:
+            if remote_cfg.spill:
+                Path(remote_cfg.spill).parent.mkdir(parents=True, exist_ok=True)
+            handler = make_remote_handler(remote_cfg)
+            handler.setFormatter(formatter)
+            logger.addHandler(handler)
+
+        queue_cfg = log_cfg.queue
+        if queue_cfg is not None and queue_cfg.enabled:
+            cls._start_queue(logger, queue_cfg)
+
         cls._logger = logger
         cls._initialized = True
 
         logger.info("PitPal logger initialized")
 
+    @classmethod
+    def _start_queue(cls, logger, queue_cfg) -> None:
+        handlers = list(logger.handlers)
+        log_queue = queue.Queue(maxsize=queue_cfg.size)
+
+        logger.handlers.clear()
+        logger.addHandler(_BoundedQueueHandler(log_queue, queue_cfg.policy))
+
+        cls._handlers = handlers
+        cls._listener = _DrainingQueueListener(
+            log_queue, *handlers, respect_handler_level=True
+        )
+        cls._listener.start()
+
+    @classmethod
+    def _restart_queue(cls) -> None:
+        """
+        After fork: the listener thread did not survive, and the parent
+        may have been mid-put on the queue. Start over with a fresh
+        queue feeding the same handlers.
+        """
+        if cls._listener is None or cls._logger is None:
+            return
+        old = cls._logger.handlers[0]
+        log_queue = queue.Queue(maxsize=old.queue.maxsize)
+        old.queue = log_queue
+        old.dropped = 0
+        cls._listener = _DrainingQueueListener(
+            log_queue, *cls._handlers, respect_handler_level=True
+        )
+        cls._listener.start()
+
+    @classmethod
+    def _close_handlers(cls) -> None:
+        if cls._listener is not None:
+            cls._listener.stop()
+            cls._listener = None
+        handlers = list(cls._handlers)
+        if cls._logger:
+            handlers.extend(cls._logger.handlers)
+        for handler in handlers:
+            handler.close()
+        cls._handlers = []
+
+    @classmethod
+    def shutdown(cls) -> None:
+        """
+        Flush queued records and close every handler.
+        """
+        cls._close_handlers()
+        if cls._logger:
+            cls._logger.handlers.clear()
+        cls._initialized = False
+
+    @classmethod
+    def dropped(cls) -> int:
+        """
+        Records discarded by the "drop" queue policy so far.
+        """
+        if cls._listener is None or not cls._logger or not cls._logger.handlers:
+            return 0
+        return getattr(cls._logger.handlers[0], "dropped", 0)
+
+    @classmethod
+    def reconfigure(cls, config: PitpalLoggingConfig) -> None:
+        """
+        Rebuild the handlers from a new config, e.g. as a ConfigWatcher
+        subscriber. The "pitpal" logger object itself is kept, so loggers
+        already handed out pick up the change.
+        """
+        cls._close_handlers()
+        cls._initialized = False
+        cls.initialize(config)
+
     @classmethod
     def get_logger(cls) -> logging.Logger:
         if not cls._initialized:
@@ -104,10 +238,14 @@ class PitPalLogger:
         ONLY for testing.
         Clears singleton state.
         """
+        cls._close_handlers()
         if cls._logger:
-            for handler in cls._logger.handlers:
-                handler.close()
             cls._logger.handlers.clear()
 
         cls._logger = None
         cls._initialized = False
+
+
+atexit.register(PitPalLogger.shutdown)
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=PitPalLogger._restart_queue)
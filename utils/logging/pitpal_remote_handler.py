@@ -0,0 +1,326 @@
+import http.client
+import json
+import logging
+import os
+import queue
+import socket
+import threading
+import time
+from typing import Optional
+from urllib.parse import urlsplit
+
+# syslog severities for the standard levels
+_SEVERITY = {
+    logging.CRITICAL: 2,
+    logging.ERROR: 3,
+    logging.WARNING: 4,
+    logging.INFO: 6,
+    logging.DEBUG: 7,
+}
+_FACILITY_USER = 1
+
+
+def _host_port(url: str, default_port: int):
+    parts = urlsplit(url if "//" in url else f"//{url}")
+    return parts.hostname or "localhost", parts.port or default_port
+
+
+# ---------------------------
+# Transports
+# ---------------------------
+
+class HttpTransport:
+    """
+    POSTs each batch as newline-delimited records over one keep-alive
+    connection, reconnecting after an error.
+    """
+
+    def __init__(self, url: str, timeout: float):
+        parts = urlsplit(url)
+        self.https = parts.scheme == "https"
+        self.host = parts.hostname or "localhost"
+        self.port = parts.port
+        self.path = parts.path or "/"
+        if parts.query:
+            self.path += "?" + parts.query
+        self.timeout = timeout
+        self._conn = None
+
+    def _connection(self):
+        if self._conn is None:
+            cls = http.client.HTTPSConnection if self.https else http.client.HTTPConnection
+            self._conn = cls(self.host, self.port, timeout=self.timeout)
+        return self._conn
+
+    def send(self, batch):
+        body = "".join(line + "\n" for _, line in batch).encode("utf-8")
+        conn = self._connection()
+        try:
+            conn.request("POST", self.path, body=body,
+                         headers={"Content-Type": "application/x-ndjson"})
+            response = conn.getresponse()
+            response.read()
+        except (OSError, http.client.HTTPException):
+            self.close()
+            raise
+        if response.status >= 300:
+            raise OSError(f"Log server answered {response.status}")
+
+    def close(self):
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+
+class SocketTransport:
+    """
+    Newline-delimited records over one persistent TCP connection.
+    """
+
+    def __init__(self, url: str, timeout: float):
+        self.address = _host_port(url, 9000)
+        self.timeout = timeout
+        self._sock = None
+
+    def send(self, batch):
+        data = "".join(line + "\n" for _, line in batch).encode("utf-8")
+        if self._sock is None:
+            self._sock = socket.create_connection(self.address, timeout=self.timeout)
+        try:
+            self._sock.sendall(data)
+        except OSError:
+            self.close()
+            raise
+
+    def close(self):
+        if self._sock is not None:
+            self._sock.close()
+            self._sock = None
+
+
+class SyslogTransport:
+    """
+    One RFC 3164 style UDP datagram per record.
+    """
+
+    def __init__(self, url: str, timeout: float):
+        self.address = _host_port(url, 514)
+        self._sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        self._sock.settimeout(timeout)
+
+    def send(self, batch):
+        for levelno, line in batch:
+            severity = _SEVERITY.get(levelno, 6)
+            pri = _FACILITY_USER * 8 + severity
+            self._sock.sendto(f"<{pri}>{line}".encode("utf-8"), self.address)
+
+    def close(self):
+        self._sock.close()
+
+
+TRANSPORTS = {
+    "http": HttpTransport,
+    "socket": SocketTransport,
+    "syslog": SyslogTransport,
+}
+
+
+# ---------------------------
+# Handler
+# ---------------------------
+
+class BatchingRemoteHandler(logging.Handler):
+    """
+    Ships formatted records to a remote log sink from a background thread.
+
+    emit() only formats the record and puts it on a bounded queue; when
+    the queue is full the record is dropped (counted in dropped), so the
+    caller never waits. The thread sends a batch once batch_size records
+    are waiting or flush_interval seconds have passed, retrying up to
+    retries times. Batches that still fail are appended to spill_path
+    and replayed after the next successful send.
+
+    flush() and close() wait at most close_timeout seconds. While
+    closing, a batch gets one attempt; once that fails the rest of the
+    queue goes straight to the spill file.
+    """
+
+    def __init__(self, transport, batch_size: int = 100, flush_interval: float = 1.0,
+                 capacity: int = 10000, retries: int = 3, backoff: float = 0.2,
+                 spill_path: Optional[str] = None, spill_max_bytes: int = 50 * 1024 * 1024,
+                 close_timeout: float = 5.0):
+        super().__init__()
+        self.transport = transport
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.capacity = capacity
+        self.retries = retries
+        self.backoff = backoff
+        self.spill_path = spill_path
+        self.spill_max_bytes = spill_max_bytes
+        self.close_timeout = close_timeout
+        self.dropped = 0
+        self._start()
+
+    def _start(self):
+        self._pid = os.getpid()
+        self._queue = queue.Queue(maxsize=self.capacity)
+        self._stop = threading.Event()
+        self._flush_requested = threading.Event()
+        self._flushed = threading.Event()
+        self._down = False
+        self._thread = threading.Thread(
+            target=self._run, name="pitpal-remote-log", daemon=True
+        )
+        self._thread.start()
+
+    def emit(self, record):
+        if self._pid != os.getpid():
+            # forked child: the shipping thread stayed in the parent
+            self._start()
+        try:
+            self._queue.put_nowait((record.levelno, self.format(record)))
+        except queue.Full:
+            self.dropped += 1
+        except Exception:
+            self.handleError(record)
+
+    def flush(self, timeout: Optional[float] = None):
+        """
+        Ask the thread to ship everything queued so far and wait for it.
+        """
+        if self._thread is None or not self._thread.is_alive():
+            return
+        self._flushed.clear()
+        self._flush_requested.set()
+        self._flushed.wait(self.close_timeout if timeout is None else timeout)
+
+    def close(self):
+        stuck = False
+        if self._thread is not None and self._pid == os.getpid():
+            self._stop.set()
+            self._thread.join(self.close_timeout)
+            stuck = self._thread.is_alive()
+            if stuck:
+                # the thread is inside a send; keep what it has not taken
+                self._spill(self._drain())
+            self._thread = None
+        if not stuck:
+            self.transport.close()
+        super().close()
+
+    def _drain(self):
+        items = []
+        while True:
+            try:
+                items.append(self._queue.get_nowait())
+            except queue.Empty:
+                return items
+
+    # ---------------------------
+    # Shipping thread
+    # ---------------------------
+
+    def _take(self, batch, deadline):
+        while len(batch) < self.batch_size:
+            timeout = deadline - time.monotonic()
+            if timeout <= 0 or self._flush_requested.is_set() or self._stop.is_set():
+                try:
+                    batch.append(self._queue.get_nowait())
+                    continue
+                except queue.Empty:
+                    return
+            try:
+                batch.append(self._queue.get(timeout=min(timeout, 0.05)))
+            except queue.Empty:
+                pass
+
+    def _run(self):
+        while True:
+            batch = []
+            self._take(batch, time.monotonic() + self.flush_interval)
+            if batch:
+                self._ship(batch)
+
+            if self._flush_requested.is_set() and self._queue.empty():
+                self._flush_requested.clear()
+                self._flushed.set()
+            if self._stop.is_set() and self._queue.empty():
+                self._flushed.set()
+                return
+
+    def _send(self, batch) -> bool:
+        retries = 0 if self._stop.is_set() else self.retries
+        for attempt in range(retries + 1):
+            try:
+                self.transport.send(batch)
+                self._down = False
+                return True
+            except OSError:
+                if attempt < retries:
+                    # wait, but give up early on close()
+                    self._stop.wait(self.backoff * (2 ** attempt))
+        self._down = True
+        return False
+
+    def _ship(self, batch):
+        if self._stop.is_set() and self._down:
+            # closing with the sink unreachable: do not wait on it again
+            self._spill(batch)
+        elif self._send(batch):
+            if not self._stop.is_set():
+                self._replay_spill()
+        else:
+            self._spill(batch)
+
+    def _spill(self, batch):
+        if self.spill_path is None:
+            self.dropped += len(batch)
+            return
+        try:
+            if os.path.exists(self.spill_path) and os.path.getsize(self.spill_path) > self.spill_max_bytes:
+                self.dropped += len(batch)
+                return
+            with open(self.spill_path, "a", encoding="utf-8") as f:
+                for item in batch:
+                    f.write(json.dumps(item) + "\n")
+        except OSError:
+            self.dropped += len(batch)
+
+    def _replay_spill(self):
+        if self.spill_path is None or not os.path.exists(self.spill_path):
+            return
+        sending = f"{self.spill_path}.sending"
+        try:
+            os.replace(self.spill_path, sending)
+            with open(sending, "r", encoding="utf-8") as f:
+                spilled = [tuple(json.loads(line)) for line in f if line.strip()]
+            os.remove(sending)
+        except (OSError, ValueError):
+            return
+
+        for i in range(0, len(spilled), self.batch_size):
+            chunk = spilled[i:i + self.batch_size]
+            if not self._send(chunk):
+                self._spill(spilled[i:])
+                return
+
+
+def make_remote_handler(remote_cfg) -> BatchingRemoteHandler:
+    try:
+        transport_cls = TRANSPORTS[remote_cfg.type]
+    except KeyError:
+        raise ValueError(f"Invalid remote log type: {remote_cfg.type}")
+
+    options = {
+        "batch_size": remote_cfg.batch_size,
+        "flush_interval": remote_cfg.flush_interval,
+        "retries": remote_cfg.retries,
+        "spill_path": remote_cfg.spill,
+    }
+    # keys missing from the YAML come through as None; keep the defaults
+    options = {k: v for k, v in options.items() if v is not None}
+
+    return BatchingRemoteHandler(
+        transport_cls(remote_cfg.url, remote_cfg.timeout), **options
+    )
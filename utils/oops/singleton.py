@@ -1,10 +1,114 @@
-class Singleton:
+import os
+import threading
+
+# guards creation of every singleton; re-entrant because one
+# singleton's __init__ may create another
+_lock = threading.RLock()
+
+# class -> instance, in creation order
+_instances = {}
+
+_warm_hooks = []
+_warmed_pid = None
+
+
+class _SingletonMeta(type):
+
+    def __call__(cls, *args, **kwargs):
+        # fast path: one dict lookup, __init__ is not run again
+        instance = cls.__dict__.get("_instance")
+        if instance is not None:
+            return instance
+
+        with _lock:
+            instance = cls.__dict__.get("_instance")
+            if instance is None:
+                instance = super().__call__(*args, **kwargs)
+                cls._instance = instance
+                _instances[cls] = instance
+        return instance
+
+
+class Singleton(metaclass=_SingletonMeta):
+    """
+    One instance per subclass, created and initialised exactly once even
+    when several threads ask for it at the same time.
+
+    After fork the child calls _after_fork() on every existing instance
+    that defines it, e.g. to replace locks or threads it does not own.
+    """
 
     _instance = None
 
-    def __new__(cls, *args, **kwargs):
 
-        if cls._instance is None:
-            cls._instance = super().__new__(cls)
+def reset(cls) -> None:
+    """
+    ONLY for testing.
+    Forget the instance of cls.
+    """
+    with _lock:
+        _instances.pop(cls, None)
+        if "_instance" in cls.__dict__:
+            cls._instance = None
+
+
+# ---------------------------
+# Per-process warm-up
+# ---------------------------
+
+def register_warm_hook(func):
+    """
+    func() builds expensive per-process state (validators, tables,
+    loggers). warm() runs every hook once per process. Usable as a
+    decorator.
+    """
+    with _lock:
+        _warm_hooks.append(func)
+    return func
+
+
+def warm() -> None:
+    """
+    Run the warm hooks unless this process already did. Meant as a
+    ProcessPoolExecutor initializer or thread-pool start-up call.
+    """
+    global _warmed_pid
+    pid = os.getpid()
+    if _warmed_pid == pid:
+        return
+    with _lock:
+        if _warmed_pid == pid:
+            return
+        for hook in list(_warm_hooks):
+            hook()
+        _warmed_pid = pid
+
+
+# ---------------------------
+# Fork handling
+# ---------------------------
+
+def _before_fork():
+    # no singleton is half-built while the process is copied
+    _lock.acquire()
+
+
+def _after_fork_parent():
+    _lock.release()
+
+
+def _after_fork_child():
+    global _lock
+    _lock = threading.RLock()
+    for instance in list(_instances.values()):
+        hook = getattr(instance, "_after_fork", None)
+        if hook is not None:
+            hook()
+
 
-        return cls._instance
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(
+        before=_before_fork,
+        after_in_parent=_after_fork_parent,
+        after_in_child=_after_fork_child,
+    )